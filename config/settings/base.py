@@ -47,6 +47,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'utils.db.middleware.replica_routing_middleware',
 ]
 
 # URL configuration module
@@ -161,3 +162,146 @@ CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/1')
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
+# Lifetime (seconds) of entries in the result backend; run_scheduled_job only writes there for jobs
+# whose result_backend is digest or full, and result_expires overrides this per job
+CELERY_RESULT_EXPIRES = int(os.getenv('CELERY_RESULT_EXPIRES', 24 * 60 * 60))
+
+# Recycle worker children after N executions or once their RSS passes the high-water mark (KB)
+CELERY_WORKER_MAX_TASKS_PER_CHILD = int(os.getenv('CELERY_WORKER_MAX_TASKS_PER_CHILD', 1000))
+CELERY_WORKER_MAX_MEMORY_PER_CHILD = int(os.getenv('CELERY_WORKER_MAX_MEMORY_PER_CHILD', 512000))
+
+# Job result storage: results are compressed above COMPRESS_MIN_SIZE bytes and offloaded
+# to the SCHEDULER_RESULT_STORAGE alias of STORAGES above OFFLOAD_THRESHOLD bytes
+SCHEDULER_RESULT_STORAGE = os.getenv('SCHEDULER_RESULT_STORAGE', 'default')
+SCHEDULER_RESULT_COMPRESS_MIN_SIZE = int(os.getenv('SCHEDULER_RESULT_COMPRESS_MIN_SIZE', 256))
+SCHEDULER_RESULT_OFFLOAD_THRESHOLD = int(os.getenv('SCHEDULER_RESULT_OFFLOAD_THRESHOLD', 64 * 1024))
+
+# Exactly-once run claims: 'db' (unique JobRun rows) or 'cache' (SETNX in CACHES['default'])
+SCHEDULER_RUN_CLAIM_BACKEND = os.getenv('SCHEDULER_RUN_CLAIM_BACKEND', 'db')
+SCHEDULER_RUN_CLAIM_TTL = int(os.getenv('SCHEDULER_RUN_CLAIM_TTL', 24 * 60 * 60))
+
+# Heartbeat leases of RUNNING jobs; the reaper fails (or requeues) jobs whose lease expired
+SCHEDULER_HEARTBEAT_INTERVAL = int(os.getenv('SCHEDULER_HEARTBEAT_INTERVAL', 30))
+SCHEDULER_HEARTBEAT_LEASE = int(os.getenv('SCHEDULER_HEARTBEAT_LEASE', 120))
+SCHEDULER_REAPER_REQUEUE = os.getenv('SCHEDULER_REAPER_REQUEUE', 'False').lower() == 'true'
+
+# Scheduler housekeeping tasks (synced into django-celery-beat on beat startup)
+CELERY_BEAT_SCHEDULE = {
+    'reap-stale-jobs': {
+        'task': 'reap_stale_jobs',
+        'schedule': float(os.getenv('SCHEDULER_REAPER_INTERVAL', 60)),
+    },
+}
+
+# Scheduler engine used by JobService:
+# - core.utils.scheduler.beat_scheduler_engine.beat_scheduler_engine (persistent, default)
+# - core.utils.scheduler.scheduler_engine.scheduler_engine (in-memory)
+# - core.utils.scheduler.redis_index_engine.redis_index_engine (Redis sorted set + dispatcher)
+SCHEDULER_ENGINE = os.getenv(
+    'SCHEDULER_ENGINE',
+    'core.utils.scheduler.beat_scheduler_engine.beat_scheduler_engine',
+)
+SCHEDULER_REDIS_URL = os.getenv('SCHEDULER_REDIS_URL', CACHES['default']['LOCATION'])
+SCHEDULER_DISPATCH_BATCH_SIZE = int(os.getenv('SCHEDULER_DISPATCH_BATCH_SIZE', 500))
+
+if SCHEDULER_ENGINE.endswith('redis_index_engine'):
+    CELERY_BEAT_SCHEDULE['dispatch-due-jobs'] = {
+        'task': 'dispatch_due_jobs',
+        'schedule': float(os.getenv('SCHEDULER_DISPATCH_INTERVAL', 1)),
+    }
+
+# Largest window accepted by GET /jobs/upcoming/
+SCHEDULER_UPCOMING_MAX_WINDOW_HOURS = int(os.getenv('SCHEDULER_UPCOMING_MAX_WINDOW_HOURS', 24 * 7))
+
+# Default dispatch spread window (seconds) for cron jobs without their own spread_seconds, capped just below
+# each job's shortest cron interval; 0 disables
+SCHEDULER_DEFAULT_SPREAD_SECONDS = int(os.getenv('SCHEDULER_DEFAULT_SPREAD_SECONDS', 0))
+
+# Beat sync: cron jobs update their PeriodicTask in place. With incremental sync, beat must run
+# core.utils.scheduler.beat_sync:IncrementalDatabaseScheduler, which applies changed rows every
+# SCHEDULER_BEAT_SYNC_DEBOUNCE seconds; otherwise full reloads are signalled at most once per window
+SCHEDULER_BEAT_INCREMENTAL_SYNC = os.getenv('SCHEDULER_BEAT_INCREMENTAL_SYNC', 'True').lower() == 'true'
+SCHEDULER_BEAT_SYNC_DEBOUNCE = int(os.getenv('SCHEDULER_BEAT_SYNC_DEBOUNCE', 5))
+
+# Execution stats windows (hours) served by the stats endpoints
+SCHEDULER_STATS_DEFAULT_HOURS = int(os.getenv('SCHEDULER_STATS_DEFAULT_HOURS', 24))
+SCHEDULER_STATS_MAX_HOURS = int(os.getenv('SCHEDULER_STATS_MAX_HOURS', 24 * 7))
+
+# Worker profiling: fraction of runs timed per phase (0 disables). Sampled runs slower than
+# SCHEDULER_PROFILE_SLOW_MS also keep cProfile / tracemalloc captures of the task callable when enabled
+SCHEDULER_PROFILE_SAMPLE_RATE = float(os.getenv('SCHEDULER_PROFILE_SAMPLE_RATE', 0))
+SCHEDULER_PROFILE_SLOW_MS = int(os.getenv('SCHEDULER_PROFILE_SLOW_MS', 1000))
+SCHEDULER_PROFILE_CPROFILE = os.getenv('SCHEDULER_PROFILE_CPROFILE', 'False').lower() == 'true'
+SCHEDULER_PROFILE_TRACEMALLOC = os.getenv('SCHEDULER_PROFILE_TRACEMALLOC', 'False').lower() == 'true'
+
+# Multi-tenancy: deficit round robin quantum (jobs per weight unit per round) of the Redis dispatcher,
+# first delay (seconds) before retrying a run deferred by a tenant's concurrency limit, doubled (with
+# jitter) on each further deferral up to the max delay, quota cache lifetime
+SCHEDULER_TENANT_QUANTUM = int(os.getenv('SCHEDULER_TENANT_QUANTUM', 10))
+SCHEDULER_TENANT_THROTTLE_DELAY = int(os.getenv('SCHEDULER_TENANT_THROTTLE_DELAY', 5))
+SCHEDULER_TENANT_THROTTLE_MAX_DELAY = int(os.getenv('SCHEDULER_TENANT_THROTTLE_MAX_DELAY', 300))
+SCHEDULER_TENANT_QUOTA_CACHE_SECONDS = int(os.getenv('SCHEDULER_TENANT_QUOTA_CACHE_SECONDS', 30))
+
+# `async def` job callables run on one event loop per worker process: cap of concurrently running
+# coroutines (further submissions wait for a slot) and how long a stopping worker waits for them
+SCHEDULER_ASYNC_MAX_IN_FLIGHT = int(os.getenv('SCHEDULER_ASYNC_MAX_IN_FLIGHT', 200))
+SCHEDULER_ASYNC_DRAIN_TIMEOUT = int(os.getenv('SCHEDULER_ASYNC_DRAIN_TIMEOUT', 30))
+
+# Memoized results (jobs with result_cache_ttl): how long a computing run holds the single-flight
+# lock of its call, and how often concurrent identical runs poll for its result meanwhile
+SCHEDULER_RESULT_CACHE_LOCK_TIMEOUT = int(os.getenv('SCHEDULER_RESULT_CACHE_LOCK_TIMEOUT', 300))
+SCHEDULER_RESULT_CACHE_POLL_INTERVAL = float(os.getenv('SCHEDULER_RESULT_CACHE_POLL_INTERVAL', 0.5))
+
+# Archiving: finished one-off jobs older than SCHEDULER_ARCHIVE_AFTER_DAYS are moved to ArchivedJob
+# every SCHEDULER_ARCHIVE_INTERVAL seconds, SCHEDULER_ARCHIVE_BATCH_SIZE rows per transaction (0 days disables)
+SCHEDULER_ARCHIVE_AFTER_DAYS = int(os.getenv('SCHEDULER_ARCHIVE_AFTER_DAYS', 7))
+SCHEDULER_ARCHIVE_BATCH_SIZE = int(os.getenv('SCHEDULER_ARCHIVE_BATCH_SIZE', 1000))
+
+if SCHEDULER_ARCHIVE_AFTER_DAYS:
+    CELERY_BEAT_SCHEDULE['archive-finished-jobs'] = {
+        'task': 'archive_finished_jobs',
+        'schedule': float(os.getenv('SCHEDULER_ARCHIVE_INTERVAL', 60 * 60)),
+    }
+
+# Live status events: transitions are published on SCHEDULER_STATUS_EVENTS_CHANNEL and streamed to
+# SSE clients (jobs/events/, ASGI only) with a keep-alive comment every SCHEDULER_STATUS_EVENTS_KEEPALIVE
+# seconds; a client lagging by more than SCHEDULER_STATUS_EVENTS_BUFFER events starts losing them
+SCHEDULER_STATUS_EVENTS = os.getenv('SCHEDULER_STATUS_EVENTS', 'True').lower() == 'true'
+SCHEDULER_STATUS_EVENTS_CHANNEL = os.getenv('SCHEDULER_STATUS_EVENTS_CHANNEL', 'scheduler:events:status')
+SCHEDULER_STATUS_EVENTS_KEEPALIVE = int(os.getenv('SCHEDULER_STATUS_EVENTS_KEEPALIVE', 15))
+SCHEDULER_STATUS_EVENTS_BUFFER = int(os.getenv('SCHEDULER_STATUS_EVENTS_BUFFER', 1000))
+SCHEDULER_STATUS_EVENTS_RETRY_MS = int(os.getenv('SCHEDULER_STATUS_EVENTS_RETRY_MS', 3000))
+
+# Admin at scale: changelists use the planner's row estimate instead of COUNT(*) above
+# SCHEDULER_ADMIN_EXACT_COUNT_THRESHOLD rows (PostgreSQL), and value filters offer the
+# SCHEDULER_ADMIN_FILTER_CHOICES most common values, cached for SCHEDULER_ADMIN_FILTER_CACHE_SECONDS
+SCHEDULER_ADMIN_EXACT_COUNT_THRESHOLD = int(os.getenv('SCHEDULER_ADMIN_EXACT_COUNT_THRESHOLD', 10000))
+SCHEDULER_ADMIN_FILTER_CHOICES = int(os.getenv('SCHEDULER_ADMIN_FILTER_CHOICES', 50))
+SCHEDULER_ADMIN_FILTER_CACHE_SECONDS = int(os.getenv('SCHEDULER_ADMIN_FILTER_CACHE_SECONDS', 300))
+
+# Deadline-aware dispatch: run_scheduled_job messages get a broker priority from their slack, the
+# seconds left before the job's end_time or next cron fire (at which they also expire). Slack up to
+# the first band gets level 0 (consumed first by the Redis transport), each further band the next
+# level; the rest, like runs without a deadline, the lowest level. Messages of other tasks keep the default (highest) level
+SCHEDULER_DEADLINE_PRIORITY = os.getenv('SCHEDULER_DEADLINE_PRIORITY', 'True').lower() == 'true'
+SCHEDULER_DEADLINE_PRIORITY_BANDS = sorted(
+    int(band) for band in os.getenv('SCHEDULER_DEADLINE_PRIORITY_BANDS', '60,300,1800').split(',') if band.strip()
+)
+
+if SCHEDULER_DEADLINE_PRIORITY:
+    CELERY_BROKER_TRANSPORT_OPTIONS = {
+        'priority_steps': list(range(len(SCHEDULER_DEADLINE_PRIORITY_BANDS) + 1)),
+        'queue_order_strategy': 'priority',
+    }
+    CELERY_TASK_ANNOTATIONS = {
+        'run_scheduled_job': {'priority': len(SCHEDULER_DEADLINE_PRIORITY_BANDS)},
+    }
+    # Prefetched messages are not reordered, so a worker reserves one at a time
+    CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv('CELERY_WORKER_PREFETCH_MULTIPLIER', 1))
+
+# Read replicas: aliases in DATABASES (see prod.py) that read-only API and admin requests read from.
+# Writes, transactions, workers, beat and commands always use 'default'. A client that changed
+# something is pinned to the primary for DATABASE_REPLICA_PIN_SECONDS (set above the replication lag)
+DATABASE_ROUTERS = ['utils.db.routers.ReplicaRouter']
+DATABASE_REPLICAS = []
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv('DATABASE_REPLICA_PIN_SECONDS', 5))
@@ -19,6 +19,17 @@ DATABASES = {
     }
 }
 
+# Read replicas, as comma-separated host[:port] entries sharing the primary's credentials
+for index, replica in enumerate(filter(None, os.getenv('DATABASE_REPLICA_HOSTS', '').split(',')), start=1):
+    host, _, port = replica.strip().partition(':')
+    DATABASES[f'replica{index}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+
 # Disable Browsable API in production
 REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
     'rest_framework.renderers.JSONRenderer',
@@ -35,5 +46,7 @@ CACHES = {
     }
 }
 
+SCHEDULER_REDIS_URL = os.getenv('SCHEDULER_REDIS_URL', REDIS_LOCATION)
+
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://redis:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://redis:6379/1')
@@ -34,3 +34,6 @@ REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] = {
     'anon': '100000/min',
     'user': '100000/min',
 }
+
+# No Redis in tests: status transitions are not published
+SCHEDULER_STATUS_EVENTS = False
@@ -0,0 +1,30 @@
+"""
+Slim settings for Celery worker and beat processes.
+
+Builds on the profile selected by DJANGO_ENV and drops the apps and middleware that
+only serve HTTP (admin, API, docs, CORS, static files), so `django.setup()` in a worker
+imports what `run_scheduled_job` needs and nothing else.
+
+Usage: DJANGO_SETTINGS_MODULE=config.settings.worker celery -A config worker -l info
+"""
+from config.settings import *  # noqa: F401,F403  (dev/test/prod profile, see config/settings/__init__.py)
+
+# Apps serving the web/API layer only; never imported by tasks or engines
+WEB_ONLY_APPS = (
+    'django.contrib.admin',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'drf_yasg',
+    'corsheaders',
+    'rest_framework',
+    'django_filters',
+)
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in WEB_ONLY_APPS]
+
+# Workers do not handle requests
+MIDDLEWARE = []
+
+# Celery's Django fixup runs system checks (and thus imports the URLconf) on startup
+ROOT_URLCONF = 'config.worker_urls'
@@ -1,11 +1,10 @@
 from django.conf.urls.i18n import i18n_patterns
 from django.conf.urls.static import static
 from django.contrib import admin
+from functools import lru_cache
+
 from django.urls import path, include, re_path
 from django.utils.translation import gettext_lazy as _
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-from rest_framework import permissions
 
 from config.settings import (
     STATIC_URL,
@@ -15,29 +14,59 @@ from config.settings import (
 )
 
 # Swagger/OpenAPI schema configuration
-schema_view = get_schema_view(
-    openapi.Info(
-        title="ChronosTasker APIs",
-        default_version='v1',
-        description="Designed for asynchronous and periodic task execution... .",
-        contact=openapi.Contact(email="navidsoleymani@ymail.com"),
-        license=openapi.License(name="MIT License"),
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny],
-)
+@lru_cache(maxsize=None)
+def _schema_view():
+    """
+    Build the schema view on the first docs request; drf_yasg is heavy to import
+    and processes that never serve the docs should not pay for it.
+    """
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+    from rest_framework import permissions
+
+    return get_schema_view(
+        openapi.Info(
+            title="ChronosTasker APIs",
+            default_version='v1',
+            description="Designed for asynchronous and periodic task execution... .",
+            contact=openapi.Contact(email="navidsoleymani@ymail.com"),
+            license=openapi.License(name="MIT License"),
+        ),
+        public=True,
+        permission_classes=[permissions.AllowAny],
+    )
+
+
+@lru_cache(maxsize=None)
+def _docs_view(renderer):
+    if renderer is None:
+        return _schema_view().without_ui(cache_timeout=0)
+    return _schema_view().with_ui(renderer, cache_timeout=0)
+
+
+def schema_json(request, *args, **kwargs):
+    return _docs_view(None)(request, *args, **kwargs)
+
+
+def schema_swagger_ui(request, *args, **kwargs):
+    return _docs_view('swagger')(request, *args, **kwargs)
+
+
+def schema_redoc(request, *args, **kwargs):
+    return _docs_view('redoc')(request, *args, **kwargs)
+
 
 # Main URL patterns
 urlpatterns = (
     [
         # Swagger schema in JSON or YAML format
-        re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
+        re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_json, name='schema-json'),
 
         # Swagger UI documentation
-        path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
+        path('swagger/', schema_swagger_ui, name='schema-swagger-ui'),
 
         # ReDoc documentation UI
-        path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+        path('redoc/', schema_redoc, name='schema-redoc'),
 
         # API version 1 interface
         path('api/v1/', include('config.interfaces.v1')),
@@ -0,0 +1,7 @@
+"""
+URLconf for worker/beat processes (see config/settings/worker.py).
+
+Celery's Django fixup runs the system checks at startup, which import ROOT_URLCONF;
+workers serve no HTTP, so they get an empty one instead of the admin/API/docs tree.
+"""
+urlpatterns = []
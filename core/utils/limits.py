@@ -0,0 +1,140 @@
+import logging
+import os
+import signal
+import threading
+import time
+
+from celery.exceptions import SoftTimeLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+
+class JobTimeLimitExceeded(SoftTimeLimitExceeded):
+    """
+    Raised inside a running job callable when its time limit is exceeded.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        super().__init__(f"Job exceeded time limit of {limit}s.")
+
+    def __str__(self):
+        return self.args[0]
+
+
+class JobMemoryLimitExceeded(Exception):
+    """
+    Raised inside a running job callable when the process RSS exceeds the job's ceiling.
+    """
+
+    def __init__(self, limit_mb, rss_mb):
+        self.limit_mb = limit_mb
+        self.rss_mb = rss_mb
+        super().__init__(f"Job exceeded memory limit of {limit_mb}MB (rss={rss_mb}MB).")
+
+
+class ExecutionGuard:
+    """
+    Enforces time and memory bounds around a single job execution.
+
+    - `soft_time_limit`: a SIGALRM raises `JobTimeLimitExceeded` in the callable,
+      giving it the chance to clean up.
+    - `time_limit`: hard limit. `on_hard_limit` is invoked and, when `hard_kill` is set
+      (i.e. inside a prefork child), the process exits so the pool replaces it.
+      Otherwise the limit is raised in the callable like the soft one.
+    - `max_memory_mb`: process RSS is sampled by a monitor thread; once exceeded,
+      `JobMemoryLimitExceeded` is raised in the callable.
+
+    Signals can only be armed from the main thread; elsewhere only the hard limit
+    and memory ceiling are monitored.
+    """
+
+    def __init__(self, soft_time_limit=None, time_limit=None, max_memory_mb=None,
+                 poll_interval=0.5, hard_kill=False, on_hard_limit=None):
+        self.soft_time_limit = soft_time_limit
+        self.time_limit = time_limit
+        self.max_memory_mb = max_memory_mb
+        self.poll_interval = poll_interval
+        self.hard_kill = hard_kill
+        self.on_hard_limit = on_hard_limit
+
+        self._pending = None
+        self._done = threading.Event()
+        self._monitor = None
+        self._previous_handler = None
+        self._signals_armed = False
+        self._main_ident = threading.get_ident()
+
+    @property
+    def enabled(self):
+        return bool(self.soft_time_limit or self.time_limit or self.max_memory_mb)
+
+    def __enter__(self):
+        if not self.enabled:
+            return self
+
+        if hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread():
+            self._previous_handler = signal.signal(signal.SIGALRM, self._handle_alarm)
+            self._signals_armed = True
+            if self.soft_time_limit:
+                signal.setitimer(signal.ITIMER_REAL, self.soft_time_limit)
+
+        if self.time_limit or self.max_memory_mb:
+            self._monitor = threading.Thread(target=self._watch, name='job-execution-guard', daemon=True)
+            self._monitor.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._done.set()
+        if self._signals_armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler or signal.SIG_DFL)
+        if self._monitor is not None:
+            self._monitor.join(timeout=self.poll_interval * 2)
+        return False
+
+    def _handle_alarm(self, signum, frame):
+        pending, self._pending = self._pending, None
+        raise pending or JobTimeLimitExceeded(self.soft_time_limit)
+
+    def _interrupt(self, error):
+        """
+        Deliver `error` to the main thread through SIGALRM, if signals are armed.
+        """
+        if not self._signals_armed:
+            return False
+        self._pending = error
+        signal.pthread_kill(self._main_ident, signal.SIGALRM)
+        return True
+
+    def _watch(self):
+        started = time.monotonic()
+        memory_checked = not self.max_memory_mb
+        if not memory_checked:
+            import psutil  # only needed for memory ceilings; kept off the worker import path
+
+            process = psutil.Process()
+
+        while not self._done.wait(self.poll_interval):
+            if not memory_checked:
+                rss_mb = process.memory_info().rss // (1024 * 1024)
+                if rss_mb > self.max_memory_mb:
+                    logger.warning(f"[ExecutionGuard] RSS {rss_mb}MB above ceiling {self.max_memory_mb}MB.")
+                    self._interrupt(JobMemoryLimitExceeded(self.max_memory_mb, rss_mb))
+                    # Keep watching: the hard limit still applies if the callable swallows this.
+                    memory_checked = True
+
+            if self.time_limit and time.monotonic() - started > self.time_limit:
+                error = JobTimeLimitExceeded(self.time_limit)
+                logger.error(f"[ExecutionGuard] Hard time limit of {self.time_limit}s exceeded.")
+                if self.on_hard_limit:
+                    try:
+                        self.on_hard_limit(error)
+                    except Exception as e:
+                        logger.error(f"[ExecutionGuard] Hard limit callback failed: {e}")
+                if self.hard_kill:
+                    # Same semantics as Celery's own hard limit: the pool replaces this child.
+                    os._exit(1)
+                self._interrupt(error)
+                return
+
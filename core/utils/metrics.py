@@ -0,0 +1,36 @@
+import logging
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Prefix for counters kept in the default cache
+COUNTER_PREFIX = 'metrics'
+
+
+def incr_counter(name: str, amount: int = 1):
+    """
+    Increment a named counter in the default cache, creating it on first use.
+    Counters are best-effort and never raise into the caller.
+    """
+    key = f"{COUNTER_PREFIX}:{name}"
+    try:
+        try:
+            cache.incr(key, amount)
+        except ValueError:
+            # Missing key; another process may create it first, so fall back to incr
+            if not cache.add(key, amount, timeout=None):
+                cache.incr(key, amount)
+    except Exception as e:
+        logger.debug(f"[Metrics] Failed to increment counter {name}: {e}")
+
+
+def get_counter(name: str) -> int:
+    """
+    Read a named counter from the default cache.
+    """
+    try:
+        return int(cache.get(f"{COUNTER_PREFIX}:{name}") or 0)
+    except Exception as e:
+        logger.debug(f"[Metrics] Failed to read counter {name}: {e}")
+        return 0
@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def get_redis_client() -> redis.Redis:
+    """
+    Shared Redis client for scheduler data structures (index, pub/sub, counters).
+    redis-py pools are fork-aware, so the client is safe to reuse in worker children.
+    """
+    return redis.Redis.from_url(settings.SCHEDULER_REDIS_URL)
@@ -1 +1,5 @@
-from .beat_scheduler_engine import  beat_scheduler_engine as engine
\ No newline at end of file
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# Engine selected by settings (beat, in-memory or Redis index)
+engine = import_string(settings.SCHEDULER_ENGINE)
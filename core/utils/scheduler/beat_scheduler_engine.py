@@ -1,7 +1,10 @@
 import logging
 from django_celery_beat.models import PeriodicTask, CrontabSchedule
 from django.utils import timezone
+from core.utils.scheduler.beat_sync import notify_schedule_changed
+from scheduler.claims import run_claims
 from scheduler.models import ScheduledJob
+from scheduler.priority import deadline_priority
 from scheduler.tasks import run_scheduled_job
 import json
 
@@ -21,7 +24,12 @@ class BeatSchedulerEngine:
         eta = job.one_off_run_time
 
         if eta and eta > timezone.now():
-            run_scheduled_job.apply_async(args=[job.id], eta=eta)
+            run_scheduled_job.apply_async(
+                args=[job.id],
+                kwargs={'run_key': run_claims.one_off_run_key(job)},
+                eta=eta,
+                **deadline_priority.options(job, eta),
+            )
             logger.info(f"[BeatScheduler] One-off job {job.id} scheduled at {eta}.")
         else:
             logger.warning(f"[BeatScheduler] Invalid one-off run time for job {job.id}: {eta}")
@@ -30,6 +38,9 @@ class BeatSchedulerEngine:
         """
         Schedule a recurring job via django-celery-beat.
         This creates a PeriodicTask in DB, which survives process restarts.
+
+        An existing PeriodicTask is updated in place, and only when one of its
+        columns actually differs, so edits do not force beat into a full reload.
         """
         try:
             # Parse cron expression
@@ -45,20 +56,33 @@ class BeatSchedulerEngine:
             )
 
             task_name = f"scheduler.job.{job.id}"
+            desired = {
+                "task": "run_scheduled_job",  # must match registered task name
+                "crontab_id": schedule.id,
+                "args": json.dumps([job.id]),
+                # Workers defer the run by this offset to spread jobs sharing a cron slot
+                "kwargs": json.dumps({"spread": job.spread_offset} if job.spread_offset else {}),
+                "enabled": job.is_active,
+                "expires": job.end_time,
+                # Deadline priority and expiry are computed per fire by IncrementalDatabaseScheduler
+                "priority": None,
+            }
 
-            PeriodicTask.objects.update_or_create(
-                name=task_name,
-                defaults={
-                    "task": "run_scheduled_job",  # must match registered task name
-                    "crontab": schedule,
-                    "args": json.dumps([job.id]),
-                    "enabled": job.is_active,
-                    "start_time": timezone.now(),
-                    "expires": job.end_time,
-                }
-            )
+            current = PeriodicTask.objects.filter(name=task_name).values("id", *desired).first()
+            if current is None:
+                task = PeriodicTask(name=task_name, start_time=timezone.now(), **desired)
+                task.no_changes = True  # notified below, debounced
+                task.save()
+                logger.info(f"[BeatScheduler] Cron job {job.id} registered in DB.")
+            else:
+                changes = {field: value for field, value in desired.items() if current[field] != value}
+                if not changes:
+                    logger.debug(f"[BeatScheduler] Cron job {job.id} is up to date.")
+                    return
+                PeriodicTask.objects.filter(id=current["id"]).update(**changes, date_changed=timezone.now())
+                logger.info(f"[BeatScheduler] Cron job {job.id} updated in place: {sorted(changes)}.")
 
-            logger.info(f"[BeatScheduler] Cron job {job.id} registered in DB.")
+            notify_schedule_changed()
 
         except ValueError as ve:
             logger.error(f"[BeatScheduler] Invalid cron format for job {job.id}: {ve}")
@@ -77,6 +101,27 @@ class BeatSchedulerEngine:
         else:
             logger.warning(f"[BeatScheduler] No PeriodicTask found for job {job_id}.")
 
+    def set_enabled(self, job_ids, enabled: bool) -> set:
+        """
+        Enable or disable the periodic tasks of many jobs with a single UPDATE.
+        Returns the ids of the jobs that had a periodic task.
+        """
+        names = {f"scheduler.job.{job_id}": job_id for job_id in job_ids}
+        tasks = PeriodicTask.objects.filter(name__in=names)
+        found = {names[name] for name in tasks.values_list('name', flat=True)}
+        if not found:
+            return found
+
+        changes = {"enabled": enabled, "date_changed": timezone.now()}
+        if not enabled:
+            # Mirrors PeriodicTask.save(): re-enabled tasks must not catch up on missed runs
+            changes["last_run_at"] = None
+        tasks.update(**changes)
+
+        notify_schedule_changed()
+        logger.info(f"[BeatScheduler] {'Enabled' if enabled else 'Disabled'} {len(found)} periodic task(s).")
+        return found
+
 
 # Singleton instance
 beat_scheduler_engine = BeatSchedulerEngine()
@@ -0,0 +1,140 @@
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django_celery_beat.models import PeriodicTasks
+from django_celery_beat.schedulers import DatabaseScheduler
+
+logger = logging.getLogger(__name__)
+
+# Set while a debounced PeriodicTasks bump is pending
+NOTIFY_PENDING_KEY = 'scheduler:beat:notify-pending'
+
+# PeriodicTask columns that define an entry; beat's own bookkeeping writes are ignored
+ENTRY_FIELDS = (
+    'task', 'crontab_id', 'interval_id', 'solar_id', 'clocked_id', 'args', 'kwargs',
+    'queue', 'exchange', 'routing_key', 'priority', 'headers', 'enabled', 'expires', 'start_time', 'one_off',
+)
+
+
+def notify_schedule_changed():
+    """
+    Tell beat that periodic tasks changed in place.
+
+    With `SCHEDULER_BEAT_INCREMENTAL_SYNC`, `IncrementalDatabaseScheduler` picks up rows by
+    `date_changed` and nothing needs to be signalled. Otherwise the `PeriodicTasks` timestamp
+    (which makes beat reload its whole schedule) is bumped once at the end of each debounce
+    window, however many changes happened within it.
+    """
+    if settings.SCHEDULER_BEAT_INCREMENTAL_SYNC:
+        return
+
+    from scheduler.tasks import notify_beat_schedule_changed
+
+    debounce = settings.SCHEDULER_BEAT_SYNC_DEBOUNCE
+    try:
+        pending = not cache.add(NOTIFY_PENDING_KEY, 1, timeout=debounce)
+    except Exception as e:
+        logger.debug(f"[BeatSync] Failed to coalesce notification: {e}")
+        pending = False
+    if not pending:
+        notify_beat_schedule_changed.apply_async(countdown=debounce)
+
+
+def bump_schedule_changed():
+    """
+    Bump the `PeriodicTasks` timestamp, forcing a full reload of every beat scheduler.
+    """
+    cache.delete(NOTIFY_PENDING_KEY)
+    PeriodicTasks.update_changed()
+    logger.info("[BeatSync] Signalled beat to reload the schedule.")
+
+
+class IncrementalDatabaseScheduler(DatabaseScheduler):
+    """
+    DatabaseScheduler that patches its in-memory schedule with PeriodicTask rows changed
+    in place, instead of reloading every row.
+
+    Changed rows are found by `date_changed`, at most once per `SCHEDULER_BEAT_SYNC_DEBOUNCE`
+    seconds, so a burst of edits is applied as one batch. Rows whose entry columns did not
+    change (e.g. beat's own `last_run_at` writes) are skipped. Deletions and changes signalled
+    through `PeriodicTasks` still trigger the regular full reload.
+
+    Job fires also get their deadline priority and expiry here, at send time (see
+    `DeadlinePriority.periodic_task_options`).
+
+    Run beat with `--scheduler core.utils.scheduler.beat_sync:IncrementalDatabaseScheduler`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._watermark = None
+        self._next_poll = 0
+        self._fingerprints = {}
+        self._reloaded_at = None
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def fingerprint(model) -> tuple:
+        return tuple(getattr(model, field) for field in ENTRY_FIELDS)
+
+    @property
+    def schedule(self):
+        schedule = super().schedule
+
+        if self._last_full_sync != self._reloaded_at:
+            # Full (re)load: the schedule reflects every row as of now
+            self._reloaded_at = self._last_full_sync
+            self._fingerprints = {name: self.fingerprint(entry.model) for name, entry in schedule.items()}
+            self._watermark = timezone.now()
+            self._next_poll = time.monotonic() + settings.SCHEDULER_BEAT_SYNC_DEBOUNCE
+        elif time.monotonic() >= self._next_poll:
+            self._next_poll = time.monotonic() + settings.SCHEDULER_BEAT_SYNC_DEBOUNCE
+            self.apply_changes()
+        return self._schedule
+
+    def apply_changes(self) -> int:
+        """
+        Apply PeriodicTask rows changed since the last poll. Returns the number of entries patched.
+        """
+        # Overlap the previous poll so rows committed late with an earlier date_changed are not lost
+        since = self._watermark - timedelta(seconds=settings.SCHEDULER_BEAT_SYNC_DEBOUNCE)
+        self._watermark = timezone.now()
+        try:
+            changed = list(self.Model.objects.filter(date_changed__gte=since))
+        except Exception as e:
+            logger.warning(f"[BeatSync] Failed to read changed periodic tasks: {e}")
+            return 0
+
+        changed = [model for model in changed if self._fingerprints.get(model.name) != self.fingerprint(model)]
+        if not changed:
+            return 0
+
+        # Flush pending last_run_at writes so rebuilt entries do not fire a slot twice
+        self.sync()
+        for model in changed:
+            self._fingerprints[model.name] = self.fingerprint(model)
+            self._schedule.pop(model.name, None)
+            if not model.enabled:
+                continue
+            try:
+                self._schedule[model.name] = self.Entry(model, app=self.app)
+            except ValueError:
+                pass
+
+        # Same as a full reload: rebuild the heap on the next tick
+        self._heap = []
+        self._heap_invalidated = True
+        logger.info(f"[BeatSync] Applied {len(changed)} changed periodic task(s) incrementally.")
+        return len(changed)
+
+    def apply_async(self, entry, producer=None, advance=True, **kwargs):
+        # Advancing rebuilds the entry from its row, so options are set on the advanced one
+        entry = self.reserve(entry) if advance else entry
+        if entry.task == 'run_scheduled_job':
+            from scheduler.priority import deadline_priority
+
+            entry.options.update(deadline_priority.periodic_task_options(entry.model))
+        return super().apply_async(entry, producer, advance=False, **kwargs)
@@ -0,0 +1,287 @@
+import logging
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from croniter import croniter
+from django.conf import settings
+from django.utils import timezone
+
+from core.utils.redis import get_redis_client
+from scheduler.claims import run_claims
+from scheduler.models import ScheduledJob
+from scheduler.priority import deadline_priority
+from scheduler.tasks import run_scheduled_job
+from scheduler.tenants import DeficitRoundRobin
+
+logger = logging.getLogger(__name__)
+
+# Atomically move up to ARGV[2] members scored at or before ARGV[1] from KEYS[1] to the processing set KEYS[2]
+POP_DUE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, ARGV[2])
+for i = 1, #due, 2 do
+    redis.call('ZREM', KEYS[1], due[i])
+    redis.call('ZADD', KEYS[2], due[i + 1], due[i])
+end
+return due
+"""
+
+
+class RedisIndexSchedulerEngine:
+    """
+    Scheduler engine keeping every active job's next fire time in one Redis sorted set
+    per tenant (member = job id, score = epoch seconds).
+
+    A frequent `dispatch_due_jobs` task claims due members with ZRANGEBYSCORE + ZREM in one
+    Lua call (O(log n) per job, safe across concurrent dispatchers), dispatches them and
+    re-adds cron jobs at their next fire time. Each batch is filled across tenants by
+    deficit round robin, so one tenant's burst cannot starve the others, and every
+    message carries its deadline priority (see `DeadlinePriority`).
+
+    Claimed members are parked in a per-tenant processing set until their jobs are
+    dispatched and re-added, so a dispatcher dying in between loses no job:
+    `reconcile_schedule_index` (`rebuild`) re-indexes them. After an outage, a cron job
+    runs once for all the fires it missed and then resumes at its next fire after now.
+    """
+
+    key = 'scheduler:index:next_run'
+
+    def __init__(self):
+        self._pop_due = None
+        self._fair = DeficitRoundRobin()
+
+    @property
+    def tenants_key(self):
+        return f"{self.key}:tenants"
+
+    def tenant_key(self, tenant: str) -> str:
+        return f"{self.key}:tenant:{tenant}"
+
+    def processing_key(self, tenant: str) -> str:
+        return f"{self.key}:processing:{tenant}"
+
+    def _add(self, client, job: ScheduledJob, score: float):
+        client.sadd(self.tenants_key, job.tenant)
+        client.zadd(self.tenant_key(job.tenant), {job.id: score})
+
+    def _tenants_of(self, job_ids) -> dict:
+        """
+        Group `job_ids` by tenant; ids missing from the database map to every known tenant.
+        """
+        grouped = {}
+        found = set()
+        for job_id, tenant in ScheduledJob.objects.filter(id__in=job_ids).values_list('id', 'tenant'):
+            grouped.setdefault(tenant, []).append(job_id)
+            found.add(job_id)
+        missing = [job_id for job_id in job_ids if job_id not in found]
+        if missing:
+            for tenant in self.client.smembers(self.tenants_key):
+                grouped.setdefault(tenant.decode(), []).extend(missing)
+        return grouped
+
+    @property
+    def client(self):
+        return get_redis_client()
+
+    @staticmethod
+    def next_fire(job: ScheduledJob, base=None):
+        """
+        Next fire time of `job` after `base`, or None when it has none (or it is past `end_time`).
+        """
+        base = base or timezone.now()
+        if job.cron_expression:
+            fire = croniter(job.cron_expression, base).get_next(datetime)
+        elif job.one_off_run_time and job.one_off_run_time > base:
+            fire = job.one_off_run_time
+        else:
+            return None
+
+        if job.end_time and fire > job.end_time:
+            return None
+        return fire
+
+    def schedule_one_off(self, job: ScheduledJob):
+        """
+        Index a one-time job at its `one_off_run_time`.
+        """
+        eta = self.next_fire(job)
+        if eta is None:
+            logger.warning(f"[RedisIndex] Invalid or past datetime for job {job.id}: {job.one_off_run_time}")
+            return
+        self._add(self.client, job, eta.timestamp())
+        logger.info(f"[RedisIndex] One-off job {job.id} indexed at {eta}.")
+
+    def schedule_cron(self, job: ScheduledJob):
+        """
+        Index a recurring job at its next cron fire time.
+        """
+        try:
+            fire = self.next_fire(job)
+        except (ValueError, KeyError) as e:
+            logger.error(f"[RedisIndex] Malformed cron expression for job {job.id}: {job.cron_expression}. Error: {e}")
+            return
+
+        if fire is None:
+            logger.info(f"[RedisIndex] Job {job.id} has no fire time before its end_time.")
+            return
+        self._add(self.client, job, fire.timestamp() + job.spread_offset)
+        logger.info(f"[RedisIndex] Cron job {job.id} indexed at {fire}.")
+
+    def remove_job(self, job_id: int):
+        """
+        Drop the job from the index.
+        """
+        for tenant, job_ids in self._tenants_of([job_id]).items():
+            if self.client.zrem(self.tenant_key(tenant), *job_ids):
+                logger.info(f"[RedisIndex] Job {job_id} removed from index.")
+
+    def set_enabled(self, job_ids, enabled: bool) -> set:
+        """
+        Drop many jobs from the index in one ZREM, or index them at their next fire time
+        in one pipeline. Returns the ids handled, i.e. all of them.
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return set()
+
+        if not enabled:
+            pipe = self.client.pipeline(transaction=False)
+            for tenant, tenant_job_ids in self._tenants_of(job_ids).items():
+                pipe.zrem(self.tenant_key(tenant), *tenant_job_ids)
+            pipe.execute()
+            logger.info(f"[RedisIndex] Removed {len(job_ids)} job(s) from index.")
+            return set(job_ids)
+
+        jobs = ScheduledJob.objects.filter(id__in=job_ids).only(
+            'id', 'tenant', 'cron_expression', 'one_off_run_time', 'end_time', 'spread_seconds'
+        )
+        pipe = self.client.pipeline(transaction=False)
+        indexed = 0
+        for job in jobs:
+            try:
+                fire = self.next_fire(job)
+            except (ValueError, KeyError):
+                fire = None
+            if fire:
+                self._add(pipe, job, fire.timestamp() + (job.spread_offset if job.cron_expression else 0))
+                indexed += 1
+        pipe.execute()
+        logger.info(f"[RedisIndex] Indexed {indexed} of {len(job_ids)} activated job(s).")
+        return set(job_ids)
+
+    def pop_due(self, now=None, limit=None):
+        """
+        Atomically claim up to `limit` due jobs, shared fairly between tenants by weight,
+        moving them to their tenant's processing set. Returns `(job_id, fire_time, tenant)` triples.
+        """
+        if self._pop_due is None:
+            self._pop_due = self.client.register_script(POP_DUE_SCRIPT)
+
+        now = now or timezone.now()
+        limit = limit or settings.SCHEDULER_DISPATCH_BATCH_SIZE
+
+        def take(tenant, count):
+            raw = self._pop_due(keys=[self.tenant_key(tenant), self.processing_key(tenant)],
+                                args=[now.timestamp(), count])
+            return [
+                (int(member), datetime.fromtimestamp(float(score), tz=dt_timezone.utc), tenant)
+                for member, score in zip(raw[::2], raw[1::2])
+            ]
+
+        tenants = [tenant.decode() for tenant in self.client.smembers(self.tenants_key)]
+        return self._fair.select(tenants, limit, take)
+
+    def dispatch_due(self, now=None, limit=None) -> int:
+        """
+        Dispatch every due job and advance cron jobs to their next fire time after `now`.
+        """
+        now = now or timezone.now()
+        claimed = self.pop_due(now=now, limit=limit)
+        if not claimed:
+            return 0
+        due = {job_id: fire for job_id, fire, _ in claimed}
+
+        jobs = ScheduledJob.objects.filter(id__in=due, is_active=True).only(
+            'id', 'tenant', 'cron_expression', 'one_off_run_time', 'end_time', 'is_active', 'next_run_at',
+            'spread_seconds',
+        )
+        advanced = []
+        pipe = self.client.pipeline(transaction=False)
+
+        for job in jobs:
+            if job.cron_expression:
+                # Scores of cron jobs include the spread offset; keys use the logical fire time
+                fire = due[job.id] - timedelta(seconds=job.spread_offset)
+                run_key = f"{job.id}:{fire.isoformat()}"
+            else:
+                fire = due[job.id]
+                run_key = run_claims.one_off_run_key(job)
+            run_scheduled_job.apply_async(
+                args=[job.id], kwargs={'run_key': run_key}, **deadline_priority.options(job, fire, now),
+            )
+
+            if job.cron_expression:
+                # Fires missed while dispatch was down are covered by this run, not replayed one by one
+                next_fire = self.next_fire(job, base=max(fire, now - timedelta(seconds=job.spread_offset)))
+                job.next_run_at = next_fire + timedelta(seconds=job.spread_offset) if next_fire else None
+                if job.next_run_at:
+                    self._add(pipe, job, job.next_run_at.timestamp())
+                advanced.append(job)
+
+        for tenant in {tenant for _, _, tenant in claimed}:
+            pipe.zrem(self.processing_key(tenant), *(job_id for job_id, _, owner in claimed if owner == tenant))
+        pipe.execute()
+        if advanced:
+            ScheduledJob.objects.bulk_update(advanced, ['next_run_at'])
+
+        logger.info(f"[RedisIndex] Dispatched {len(due)} due job(s).")
+        return len(due)
+
+    def rebuild(self, chunk_size=1000) -> int:
+        """
+        Rebuild the index from the database, streaming active jobs in chunks into
+        temporary per-tenant keys that then replace the live ones. Members left in the
+        processing sets by a dispatcher that died are dropped, as their jobs are re-indexed.
+        """
+        now = timezone.now()
+        indexed = 0
+        tenants = set()
+        previous = {tenant.decode() for tenant in self.client.smembers(self.tenants_key)}
+        active = ScheduledJob.objects.filter(is_active=True)
+        stale = set(active.values_list('tenant', flat=True).distinct().order_by())
+        if stale:
+            self.client.delete(*(f"{self.key}:rebuild:{tenant}" for tenant in stale))
+
+        jobs = active.only(
+            'id', 'tenant', 'cron_expression', 'one_off_run_time', 'end_time', 'spread_seconds'
+        ).order_by('id')
+        pipe = self.client.pipeline(transaction=False)
+
+        for position, job in enumerate(jobs.iterator(chunk_size=chunk_size), start=1):
+            try:
+                fire = self.next_fire(job, base=now)
+            except (ValueError, KeyError):
+                fire = None
+            if fire:
+                offset = job.spread_offset if job.cron_expression else 0
+                pipe.zadd(f"{self.key}:rebuild:{job.tenant}", {job.id: fire.timestamp() + offset})
+                tenants.add(job.tenant)
+                indexed += 1
+            if position % chunk_size == 0:
+                pipe.execute()
+        pipe.execute()
+
+        pipe = self.client.pipeline(transaction=True)
+        for tenant in tenants:
+            pipe.rename(f"{self.key}:rebuild:{tenant}", self.tenant_key(tenant))
+        for tenant in previous - tenants:
+            pipe.delete(self.tenant_key(tenant))
+        for tenant in previous | tenants:
+            pipe.delete(self.processing_key(tenant))
+        pipe.delete(self.tenants_key, self.key)  # self.key: pre-tenant single index
+        if tenants:
+            pipe.sadd(self.tenants_key, *tenants)
+        pipe.execute()
+        return indexed
+
+
+# Singleton instance
+redis_index_engine = RedisIndexSchedulerEngine()
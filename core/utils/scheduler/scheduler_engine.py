@@ -2,7 +2,9 @@ import logging
 from celery import current_app
 from celery.schedules import crontab
 from django.utils import timezone
+from scheduler.claims import run_claims
 from scheduler.models import ScheduledJob
+from scheduler.priority import deadline_priority
 from scheduler.tasks import run_scheduled_job
 
 logger = logging.getLogger(__name__)
@@ -24,7 +26,12 @@ class SchedulerEngine:
         eta = job.one_off_run_time
 
         if eta and eta > timezone.now():
-            run_scheduled_job.apply_async(args=[job.id], eta=eta, expires=job.end_time)
+            run_scheduled_job.apply_async(
+                args=[job.id],
+                kwargs={'run_key': run_claims.one_off_run_key(job)},
+                eta=eta,
+                **deadline_priority.options(job, eta),
+            )
             logger.info(f"[SchedulerEngine] One-off job {job.id} scheduled at {eta}.")
         else:
             logger.warning(f"[SchedulerEngine] Invalid or past datetime for job {job.id}: {eta}")
@@ -51,7 +58,7 @@ class SchedulerEngine:
 
             current_app.add_periodic_task(
                 schedule,
-                run_scheduled_job.s(job.id),
+                run_scheduled_job.s(job.id, spread=job.spread_offset),
                 name=task_name,
                 options={'queue': 'default'}
             )
@@ -71,6 +78,13 @@ class SchedulerEngine:
         """
         logger.warning(f"[SchedulerEngine] Removal of job {job_id} is not supported in this setup.")
 
+    def set_enabled(self, job_ids, enabled: bool) -> set:
+        """
+        In-process periodic tasks cannot be toggled. Inactive jobs are skipped by the worker,
+        and activated jobs are rescheduled one by one by the caller.
+        """
+        return set()
+
 
 # Singleton instance used throughout the project
 scheduler_engine = SchedulerEngine()
@@ -0,0 +1,53 @@
+import hashlib
+from datetime import datetime
+from functools import lru_cache
+
+from croniter import croniter
+from django.conf import settings
+
+# Fires sampled to find an expression's shortest gap
+INTERVAL_SAMPLE_FIRES = 500
+
+
+def spread_offset(job_id: int, spread_seconds=None, expression=None) -> int:
+    """
+    Deterministic dispatch offset of a job within its spread window, in seconds.
+
+    The offset is derived from a hash of the job id, so it is stable across processes
+    and restarts while spreading jobs that share a cron expression across the window.
+    `spread_seconds=None` falls back to the global SCHEDULER_DEFAULT_SPREAD_SECONDS policy,
+    kept below the shortest interval of the job's cron `expression` (an explicit window is
+    validated against it instead).
+    """
+    window = settings.SCHEDULER_DEFAULT_SPREAD_SECONDS if spread_seconds is None else spread_seconds
+    if spread_seconds is None and window and expression:
+        try:
+            window = min(window, min_cron_interval(expression) - 1)
+        except (ValueError, KeyError):
+            pass
+    if not window:
+        return 0
+    digest = hashlib.blake2b(str(job_id).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % window
+
+
+@lru_cache(maxsize=1024)
+def min_cron_interval(expression: str) -> int:
+    """
+    Shortest gap, in seconds, between consecutive fires of `expression`.
+
+    Sampled over the first INTERVAL_SAMPLE_FIRES fires from a fixed, naive start, so the
+    result is deterministic; a spread window must stay below it, or deferred dispatches of
+    one fire overlap the next.
+    """
+    fires = croniter(expression, datetime(2000, 1, 1))
+    previous = fires.get_next(datetime)
+    shortest = None
+    for _ in range(INTERVAL_SAMPLE_FIRES):
+        current = fires.get_next(datetime)
+        gap = int((current - previous).total_seconds())
+        shortest = gap if shortest is None else min(shortest, gap)
+        if shortest <= 60:
+            break
+        previous = current
+    return shortest
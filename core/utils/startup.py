@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+
+# What a worker process does before it can take its first task
+WORKER_STARTUP_STATEMENT = (
+    "import django; django.setup(); "
+    "from config.celery import app; app.loader.import_default_modules()"
+)
+
+
+def measure_imports(settings_module: str, statement: str = WORKER_STARTUP_STATEMENT, env=None) -> dict:
+    """
+    Run `statement` in a fresh interpreter under `python -X importtime` and parse the report.
+
+    Returns a dict with:
+    - `wall_ms`: time spent running the statement
+    - `total_ms` / `modules`: importtime totals of the top-level imports (those not triggered by
+      another module). Modules loaded through `importlib.import_module` (Django app loading, Celery
+      task discovery) are not reported by importtime, so this is a lower bound of the import cost
+    - `imported`: every module in `sys.modules` once the statement finished
+    Raises `RuntimeError` if the statement fails.
+    """
+    environ = {**os.environ, **(env or {}), 'DJANGO_SETTINGS_MODULE': settings_module}
+    probe = (
+        f"import sys, time; _started = time.perf_counter()\n{statement}\n"
+        "print((time.perf_counter() - _started) * 1000); print(','.join(sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', probe],
+        env=environ,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode:
+        raise RuntimeError(f"Startup statement failed:\n{completed.stderr[-2000:]}")
+
+    modules = {}
+    for line in completed.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        if not cumulative_us.strip().isdigit():
+            continue  # header line
+        # Nested imports are indented by two spaces per level after the single separator space
+        if not name[1:].startswith(' '):
+            name = name.strip()
+            modules[name] = modules.get(name, 0) + int(cumulative_us) / 1000
+
+    wall_ms, imported = completed.stdout.splitlines()[-2:]
+    return {
+        'wall_ms': round(float(wall_ms), 1),
+        'total_ms': round(sum(modules.values()), 1),
+        'modules': modules,
+        'imported': set(imported.split(',')),
+    }
@@ -1,5 +1,40 @@
+from django import forms
 from django.contrib import admin
-from scheduler.models import ScheduledJob
+from django.utils.translation import gettext_lazy as _
+
+from core.utils.admin import CachedChoicesFilter, EstimatedCountPaginator
+from scheduler.dag import DependencyCycleError, dependency_graph
+from scheduler.models import ArchivedJob, JobTemplate, JobTemplateParameter, ScheduledJob, TenantQuota
+
+
+class TenantFilter(CachedChoicesFilter):
+    title = _('tenant')
+    parameter_name = 'tenant'
+
+
+class CronExpressionFilter(CachedChoicesFilter):
+    title = _('cron expression')
+    parameter_name = 'cron_expression'
+
+
+class ScheduledJobAdminForm(forms.ModelForm):
+    class Meta:
+        model = ScheduledJob
+        fields = '__all__'
+
+    def clean(self):
+        """
+        Reject upstream jobs that would close a dependency cycle, as a form error rather than
+        the signal's last-resort ValidationError (which the admin does not catch).
+        """
+        cleaned_data = super().clean()
+        upstream_jobs = cleaned_data.get('upstream_jobs')
+        if upstream_jobs and self.instance.pk:
+            try:
+                dependency_graph.ensure_acyclic(self.instance.pk, [job.id for job in upstream_jobs])
+            except DependencyCycleError as e:
+                self.add_error('upstream_jobs', str(e))
+        return cleaned_data
 
 
 @admin.register(ScheduledJob)
@@ -7,18 +42,32 @@ class ScheduledJobAdmin(admin.ModelAdmin):
     """
     Admin configuration for ScheduledJob model.
     Allows viewing and managing scheduled tasks from the Django admin panel.
+
+    Built for tables of millions of rows: estimated counts, cached filter choices,
+    searches served by trigram indexes (PostgreSQL) and wide columns deferred on the changelist.
     """
-    list_display = ('id', 'name', 'task_path', 'status', 'is_active', 'next_run_at', 'last_run_at')
-    list_filter = ('status', 'is_active', 'cron_expression')
+    form = ScheduledJobAdminForm
+    list_display = ('id', 'name', 'tenant', 'task_path', 'status', 'is_active', 'next_run_at', 'last_run_at')
+    list_filter = ('status', 'is_active', TenantFilter, CronExpressionFilter)
     search_fields = ('name', 'task_path', 'description')
     ordering = ('-created_at',)
-    readonly_fields = ('created_at', 'updated_at', 'last_run_at', 'next_run_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # Columns the changelist never shows
+    changelist_deferred_fields = ('description', 'args', 'kwargs', 'error_message')
+    raw_id_fields = ('upstream_jobs',)
+    readonly_fields = ('created_at', 'updated_at', 'last_run_at', 'next_run_at', 'last_result', 'result_digest')
     fieldsets = (
         (None, {
-            'fields': ('name', 'description', 'task_path', 'args', 'kwargs')
+            'fields': ('name', 'tenant', 'description', 'task_path', 'args', 'kwargs')
         }),
         ('Schedule', {
-            'fields': ('one_off_run_time', 'cron_expression', 'end_time', 'max_retries')
+            'fields': ('one_off_run_time', 'cron_expression', 'end_time', 'max_retries', 'spread_seconds', 'upstream_jobs')
+        }),
+        ('Limits', {
+            'fields': (
+                'soft_time_limit', 'time_limit', 'max_memory_mb', 'result_cache_ttl', 'result_backend', 'result_expires',
+            )
         }),
         ('Status', {
             'fields': ('status', 'is_active', 'last_run_at', 'next_run_at')
@@ -27,6 +76,63 @@ class ScheduledJobAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'updated_at')
         }),
         ('Display processing information', {
-            'fields': ('result', 'error_message')
+            'fields': ('last_result', 'result_digest', 'error_message')
         }),
     )
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if request.resolver_match and request.resolver_match.url_name.endswith('_changelist'):
+            queryset = queryset.defer(*self.changelist_deferred_fields)
+        return queryset
+
+
+@admin.register(TenantQuota)
+class TenantQuotaAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for per-tenant quotas and dispatch weights.
+    """
+    list_display = ('tenant', 'weight', 'max_concurrency', 'max_runs_per_minute', 'updated_at')
+    search_fields = ('tenant',)
+
+
+@admin.register(JobTemplate)
+class JobTemplateAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for job templates; parameter rows are managed on their own page.
+    """
+    list_display = ('id', 'name', 'tenant', 'task_path', 'cron_expression', 'is_active', 'last_run_at')
+    list_filter = ('is_active', 'tenant')
+    search_fields = ('name', 'task_path')
+    readonly_fields = ('created_at', 'updated_at', 'last_run_at', 'last_expansion')
+
+
+@admin.register(JobTemplateParameter)
+class JobTemplateParameterAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for template parameter rows.
+    """
+    list_display = ('id', 'template', 'key', 'is_active')
+    list_filter = ('is_active',)
+    search_fields = ('key',)
+    raw_id_fields = ('template',)
+    list_select_related = ('template',)
+
+
+@admin.register(ArchivedJob)
+class ArchivedJobAdmin(admin.ModelAdmin):
+    """
+    Read-only admin for archived one-off jobs.
+    """
+    list_display = ('original_id', 'name', 'tenant', 'task_path', 'status', 'one_off_run_time', 'archived_at')
+    list_filter = ('status', TenantFilter)
+    search_fields = ('name', 'task_path')
+    exclude = ('result_payload',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -6,3 +6,7 @@ class SchedulerConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'scheduler'
     verbose_name = _('Scheduler')
+
+    def ready(self):
+        # Register dependency graph signal handlers
+        from scheduler import signals  # noqa: F401
@@ -0,0 +1,158 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from scheduler.models import ArchivedJob, JobResult, JobRun, JobStats, JobStatus, ResultStorage, ScheduledJob
+from scheduler.results import result_store
+
+logger = logging.getLogger(__name__)
+
+# Only finished runs are archived; pending or running one-offs stay live
+TERMINAL_STATUSES = (JobStatus.SUCCESS, JobStatus.FAILED)
+
+
+class JobArchiver:
+    """
+    Moves finished one-off jobs out of `ScheduledJob` into `ArchivedJob`.
+
+    Terminal one-offs whose run time is older than the retention window are copied and
+    deleted in primary-key batches, each in its own short transaction, so the live table
+    and its indexes stay proportional to pending work. Jobs other jobs depend on are kept
+    so DAG edges stay intact. Each archived row keeps the job's latest result; older
+    results, runs and per-job stats go with the live row, and the job's history gets one
+    bulk-written deletion record.
+    """
+
+    @staticmethod
+    def cutoff(older_than=None):
+        """
+        Run time before which finished one-offs are archived.
+        """
+        return timezone.now() - (older_than or timedelta(days=settings.SCHEDULER_ARCHIVE_AFTER_DAYS))
+
+    @staticmethod
+    def eligible(cutoff):
+        return ScheduledJob.objects.filter(
+            one_off_run_time__lt=cutoff,
+            status__in=TERMINAL_STATUSES,
+            downstream_jobs__isnull=True,
+        ).filter(Q(cron_expression__isnull=True) | Q(cron_expression=''))
+
+    def archive(self, cutoff, batch_size=None) -> int:
+        """
+        Archive every eligible job, one batch at a time. Returns the number archived.
+        """
+        batch_size = batch_size or settings.SCHEDULER_ARCHIVE_BATCH_SIZE
+        archived_total = 0
+        while True:
+            archived = self.archive_batch(cutoff, batch_size)
+            if not archived:
+                break
+            archived_total += archived
+            logger.info(f"[Archive] Archived {archived} job(s).")
+
+        if archived_total:
+            from scheduler.dag import dependency_graph
+
+            dependency_graph.invalidate()
+        return archived_total
+
+    def archive_batch(self, cutoff, batch_size: int) -> int:
+        with transaction.atomic():
+            jobs = list(
+                self.eligible(cutoff).select_related('last_result')
+                .select_for_update(of=('self',), skip_locked=True).order_by('id')[:batch_size]
+            )
+            if not jobs:
+                return 0
+
+            ArchivedJob.objects.bulk_create([self._to_archive(job) for job in jobs], ignore_conflicts=True)
+
+            # Offloaded payloads of superseded results would be orphaned by the cascade
+            kept = [job.last_result_id for job in jobs if job.last_result_id]
+            orphaned = list(
+                JobResult.objects.filter(job__in=jobs, storage=ResultStorage.FILE)
+                .exclude(id__in=kept).values_list('location', flat=True)
+            )
+            ScheduledJob.history.model.objects.bulk_create([self._deletion_history(job) for job in jobs])
+            self._delete_jobs([job.id for job in jobs])
+            if orphaned:
+                transaction.on_commit(lambda: result_store.delete_files(orphaned))
+
+        return len(jobs)
+
+    @staticmethod
+    def _delete_jobs(job_ids):
+        """
+        Delete the jobs and everything attached to them with one statement per table.
+
+        The deletion collector would fetch every row and send `post_delete` for each one,
+        i.e. a history INSERT and a DAG cache invalidation per job; the history is bulk-written
+        instead and `archive()` invalidates the DAG once. Foreign keys are checked at commit.
+        """
+        edges = ScheduledJob.upstream_jobs.through.objects.filter(
+            Q(from_scheduledjob_id__in=job_ids) | Q(to_scheduledjob_id__in=job_ids)
+        )
+        for queryset in (
+            edges,
+            JobRun.objects.filter(job_id__in=job_ids),
+            JobStats.objects.filter(job_id__in=job_ids),
+            JobResult.objects.filter(job_id__in=job_ids),
+            ScheduledJob.objects.filter(id__in=job_ids),
+        ):
+            queryset._raw_delete(queryset.db)
+
+    @staticmethod
+    def _deletion_history(job: ScheduledJob):
+        history_model = ScheduledJob.history.model
+        return history_model(
+            history_date=timezone.now(),
+            history_type='-',
+            history_change_reason='Archived',
+            **{field.attname: getattr(job, field.attname) for field in history_model.tracked_fields},
+        )
+
+    @staticmethod
+    def _to_archive(job: ScheduledJob) -> ArchivedJob:
+        archived = ArchivedJob(
+            original_id=job.id,
+            name=job.name,
+            tenant=job.tenant,
+            task_path=job.task_path,
+            args=job.args,
+            kwargs=job.kwargs,
+            one_off_run_time=job.one_off_run_time,
+            status=job.status,
+            last_run_at=job.last_run_at,
+            error_message=job.error_message,
+            created_at=job.created_at,
+        )
+        job_result = job.last_result
+        if job_result is not None:
+            archived.result = {
+                'digest': job_result.digest,
+                'encoding': job_result.encoding,
+                'compression': job_result.compression,
+                'size': job_result.size,
+                'storage': job_result.storage,
+                'location': job_result.location,
+            }
+            archived.result_payload = job_result.payload
+        return archived
+
+    @staticmethod
+    def load_result(archived: ArchivedJob):
+        """
+        Decode the archived job's latest result, or None if it had none.
+        """
+        if not archived.result:
+            return None
+        return result_store.load(JobResult(payload=archived.result_payload, **archived.result))
+
+
+# Singleton instance used across the application
+job_archiver = JobArchiver()
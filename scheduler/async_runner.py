@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import os
+import threading
+from collections import Counter
+from concurrent.futures import wait
+
+from asgiref.sync import sync_to_async
+from celery.signals import worker_process_shutdown, worker_shutdown
+from django.conf import settings
+from django.utils import timezone
+
+from scheduler.models import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJobRunner:
+    """
+    Runs `async def` job callables on one long-lived event loop per worker process.
+
+    The loop lives in a daemon thread started on first use. `submit` hands the coroutine
+    over and returns, so the Celery task, and with it the pool child, moves on to the
+    next message while the coroutine awaits I/O. At most `SCHEDULER_ASYNC_MAX_IN_FLIGHT`
+    coroutines run at once; `submit` blocks while the cap is reached.
+
+    Completion callbacks are synchronous (ORM) code and run through `sync_to_async`, i.e.
+    serialized on a single thread with its own database connection. The leases of all
+    in-flight jobs are renewed together by one coroutine instead of a thread per job.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop = None
+        self._pid = None
+        self._slots = None
+        self._pending = set()
+        self._in_flight = Counter()
+
+    def _ensure_loop(self):
+        with self._lock:
+            # A forked pool child inherits this object but not the parent's loop thread
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._pid = os.getpid()
+                self._slots = threading.BoundedSemaphore(settings.SCHEDULER_ASYNC_MAX_IN_FLIGHT)
+                self._pending = set()
+                self._in_flight = Counter()
+                threading.Thread(target=self._loop.run_forever, name='async-jobs', daemon=True).start()
+                if settings.SCHEDULER_HEARTBEAT_INTERVAL:
+                    asyncio.run_coroutine_threadsafe(self._heartbeat(settings.SCHEDULER_HEARTBEAT_INTERVAL), self._loop)
+                logger.info(f"[AsyncRunner] Started event loop in process {self._pid}.")
+            return self._loop
+
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def submit(self, job: ScheduledJob, coroutine, on_done, timeout=None):
+        """
+        Run `coroutine` for `job` on the loop, bounded by `timeout` seconds.
+        `on_done(result, error)` is called once it finished, with `error` None on success.
+
+        Returns the `concurrent.futures.Future` of the run.
+        """
+        loop = self._ensure_loop()
+        if not self._slots.acquire(blocking=False):
+            logger.info(f"[AsyncRunner] {settings.SCHEDULER_ASYNC_MAX_IN_FLIGHT} job(s) in flight; waiting for a slot.")
+            self._slots.acquire()
+
+        future = asyncio.run_coroutine_threadsafe(self._run(job, coroutine, on_done, timeout), loop)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    async def _run(self, job, coroutine, on_done, timeout):
+        # Only touched from the loop thread
+        self._in_flight[job.id] += 1
+        try:
+            try:
+                result = await asyncio.wait_for(coroutine, timeout) if timeout else await coroutine
+            except asyncio.TimeoutError:
+                outcome = (None, TimeoutError(f"Job {job.id} exceeded its {timeout}s time limit."))
+            except Exception as exc:
+                outcome = (None, exc)
+            else:
+                outcome = (result, None)
+
+            try:
+                await sync_to_async(on_done)(*outcome)
+            except Exception as e:
+                logger.error(f"[AsyncRunner] Failed to record the outcome of job {job.id}: {e}")
+        finally:
+            self._in_flight[job.id] -= 1
+            if self._in_flight[job.id] <= 0:
+                del self._in_flight[job.id]
+            self._slots.release()
+
+    async def _heartbeat(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            job_ids = list(self._in_flight)
+            if not job_ids:
+                continue
+            try:
+                await sync_to_async(self._renew_leases)(job_ids)
+            except Exception as e:
+                logger.error(f"[AsyncRunner] Failed to renew leases of {len(job_ids)} job(s): {e}")
+
+    @staticmethod
+    def _renew_leases(job_ids):
+        ScheduledJob.objects.filter(pk__in=job_ids).update(heartbeat_at=timezone.now())
+        logger.debug(f"[AsyncRunner] Renewed leases of {len(job_ids)} job(s).")
+
+    def drain(self, timeout=None) -> int:
+        """
+        Wait up to `timeout` seconds for in-flight jobs to finish; returns how many did not.
+        Jobs cut off by a process exit keep their RUNNING status until the reaper expires their lease.
+        """
+        if self._pid != os.getpid() or not self._pending:
+            return 0
+        timeout = settings.SCHEDULER_ASYNC_DRAIN_TIMEOUT if timeout is None else timeout
+        logger.info(f"[AsyncRunner] Draining {len(self._pending)} in-flight job(s)...")
+        _, not_done = wait(list(self._pending), timeout=timeout)
+        if not_done:
+            logger.warning(f"[AsyncRunner] {len(not_done)} job(s) still running after {timeout}s.")
+        return len(not_done)
+
+
+# Singleton instance used across the application
+async_runner = AsyncJobRunner()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def drain_async_jobs(**kwargs):
+    """
+    Let in-flight coroutines finish before a pool child is recycled or the worker stops.
+    """
+    async_runner.drain()
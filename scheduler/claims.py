@@ -0,0 +1,98 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from core.utils.metrics import incr_counter
+from scheduler.models import JobRun, ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+# Separates the job id from the upstream completion time in dependency-triggered run keys
+DEPENDENCY_MARKER = ':after:'
+
+
+class RunClaims:
+    """
+    Exactly-once execution claims for dispatched jobs.
+
+    Each dispatch carries a run key (job id + scheduled fire time, or the Celery task id
+    for beat-driven fires). Before executing, a worker claims `run_key:attempt` either with
+    a unique `JobRun` row ('db' backend) or a cache `add` with TTL, i.e. Redis SETNX
+    ('cache' backend). Broker redeliveries of the same message fail the claim and are dropped.
+    """
+
+    @property
+    def backend(self):
+        return getattr(settings, 'SCHEDULER_RUN_CLAIM_BACKEND', 'db')
+
+    @property
+    def ttl(self):
+        return getattr(settings, 'SCHEDULER_RUN_CLAIM_TTL', 24 * 60 * 60)
+
+    @staticmethod
+    def one_off_run_key(job: ScheduledJob) -> str:
+        """
+        Run key of a one-off job's single fire.
+        """
+        return f"{job.id}:{job.one_off_run_time.isoformat()}"
+
+    @staticmethod
+    def dependency_run_key(job_id: int, upstream_finished_at) -> str:
+        """
+        Run key of a fire triggered by upstream jobs; identical for every upstream of the same fan-in.
+        """
+        return f"{job_id}{DEPENDENCY_MARKER}{upstream_finished_at.isoformat()}"
+
+    def is_stale(self, job: ScheduledJob, run_key: str) -> bool:
+        """
+        A one-off dispatch is stale once the job has been re-scheduled to another time.
+        """
+        if not run_key or not job.one_off_run_time or DEPENDENCY_MARKER in run_key:
+            return False
+        return run_key != self.one_off_run_key(job)
+
+    @staticmethod
+    def attempt_key(run_key: str, attempt: int) -> str:
+        """
+        Retries re-run the same fire, so each attempt is claimed separately.
+        """
+        return f"{run_key}#{attempt}"
+
+    def claim(self, job: ScheduledJob, key: str, worker=None) -> bool:
+        """
+        Atomically claim `key` for execution. Returns False for duplicates.
+        """
+        if self.backend == 'cache':
+            claimed = cache.add(f"scheduler:run:{key}", worker or 1, timeout=self.ttl)
+        else:
+            try:
+                with transaction.atomic():
+                    JobRun.objects.create(job=job, run_key=key, worker=worker)
+                claimed = True
+            except IntegrityError:
+                claimed = False
+
+        if not claimed:
+            incr_counter('scheduler.duplicate_runs')
+            logger.info(f"[RunClaims] Run {key} of job {job.id} already claimed; skipping duplicate.")
+        return claimed
+
+    def finish(self, key: str, status: str, profile=None):
+        """
+        Record the outcome of a claimed run, with its profile when the run was sampled.
+        """
+        if self.backend != 'db':
+            if profile:
+                logger.info(f"[RunClaims] Profile of run {key}: {profile}")
+            return
+        changes = {'status': status, 'finished_at': timezone.now()}
+        if profile:
+            changes['profile'] = profile
+        JobRun.objects.filter(run_key=key).update(**changes)
+
+
+# Singleton instance used across the application
+run_claims = RunClaims()
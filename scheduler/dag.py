@@ -0,0 +1,164 @@
+import logging
+from collections import deque
+
+from django.core.cache import cache
+
+from scheduler.models import ScheduledJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+# Shared version of the dependency edges; bumped on every change so other processes drop their index
+GRAPH_VERSION_KEY = 'scheduler:dag:version'
+
+
+class DependencyCycleError(ValueError):
+    """
+    Raised when adding upstream dependencies would create a cycle.
+    """
+
+
+class DagIndex:
+    """
+    Topological index of one DAG (a weakly connected component of the dependency graph).
+    """
+
+    def __init__(self, upstream: dict, downstream: dict):
+        self.upstream = upstream
+        self.downstream = downstream
+        self.order = self._topological_order()
+        self.position = {node: position for position, node in enumerate(self.order)}
+
+    def _topological_order(self):
+        in_degree = {node: len(self.upstream[node]) for node in self.upstream}
+        queue = deque(sorted(node for node, degree in in_degree.items() if not degree))
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for child in sorted(self.downstream[node]):
+                in_degree[child] -= 1
+                if not in_degree[child]:
+                    queue.append(child)
+        return order
+
+
+class DependencyGraph:
+    """
+    Dependency graph between scheduled jobs with an in-memory topological index cached per DAG.
+
+    The index is rebuilt lazily the first time a DAG is touched after its edges changed.
+    """
+
+    def __init__(self):
+        self._indexes = {}
+        self._shared_version = None
+
+    @property
+    def edges(self):
+        return ScheduledJob.upstream_jobs.through.objects
+
+    def invalidate(self):
+        """
+        Drop cached indexes in this process and signal other processes to do the same.
+        """
+        self._indexes.clear()
+        try:
+            if not cache.add(GRAPH_VERSION_KEY, 1, timeout=None):
+                cache.incr(GRAPH_VERSION_KEY)
+        except Exception as e:
+            logger.debug(f"[DependencyGraph] Failed to bump shared version: {e}")
+
+    def _sync_version(self):
+        try:
+            shared = cache.get(GRAPH_VERSION_KEY)
+        except Exception:
+            shared = None
+        if shared != self._shared_version:
+            self._indexes.clear()
+            self._shared_version = shared
+
+    def ensure_acyclic(self, job_id: int, upstream_ids):
+        """
+        Raise `DependencyCycleError` if `job_id` is reachable upstream from any of `upstream_ids`,
+        i.e. if making them upstream of `job_id` would close a cycle.
+        """
+        frontier = set(upstream_ids)
+        seen = set()
+        while frontier:
+            if job_id in frontier:
+                raise DependencyCycleError(f"Adding these dependencies to job {job_id} would create a cycle.")
+            seen |= frontier
+            frontier = set(
+                self.edges.filter(from_scheduledjob_id__in=frontier).values_list('to_scheduledjob_id', flat=True)
+            ) - seen
+
+    def index_for(self, job_id: int) -> DagIndex:
+        """
+        Return the cached topological index of the DAG containing `job_id`.
+        """
+        self._sync_version()
+        index = self._indexes.get(job_id)
+        if index is None:
+            index = self._build_index(job_id)
+            for node in index.upstream:
+                self._indexes[node] = index
+        return index
+
+    def _build_index(self, job_id: int) -> DagIndex:
+        upstream = {job_id: set()}
+        downstream = {job_id: set()}
+
+        frontier, seen = {job_id}, {job_id}
+        while frontier:
+            edges = self.edges.filter(from_scheduledjob_id__in=frontier) | self.edges.filter(
+                to_scheduledjob_id__in=frontier
+            )
+            discovered = set()
+            for child, parent in edges.values_list('from_scheduledjob_id', 'to_scheduledjob_id'):
+                upstream.setdefault(child, set()).add(parent)
+                upstream.setdefault(parent, set())
+                downstream.setdefault(parent, set()).add(child)
+                downstream.setdefault(child, set())
+                discovered |= {child, parent}
+            frontier = discovered - seen
+            seen |= discovered
+
+        logger.debug(f"[DependencyGraph] Indexed DAG of job {job_id} with {len(seen)} job(s).")
+        return DagIndex(upstream, downstream)
+
+    def ready_downstream(self, job: ScheduledJob):
+        """
+        Return `(job_id, marker)` pairs for direct downstream jobs whose upstream jobs have all
+        succeeded since the downstream job last ran. `marker` is the latest upstream completion,
+        identical for every upstream that observes the same fan-in.
+        """
+        index = self.index_for(job.id)
+        children = index.downstream.get(job.id, set())
+        if not children:
+            return []
+
+        related = set(children)
+        for child in children:
+            related |= index.upstream[child]
+        state = {
+            row['id']: row
+            for row in ScheduledJob.objects.filter(id__in=related).values('id', 'status', 'last_run_at', 'is_active')
+        }
+
+        ready = []
+        for child in sorted(children, key=index.position.get):
+            downstream_job = state.get(child)
+            if not downstream_job or not downstream_job['is_active']:
+                continue
+            parents = [state.get(parent) for parent in index.upstream[child]]
+            if not all(parent and parent['status'] == JobStatus.SUCCESS and parent['last_run_at'] for parent in parents):
+                continue
+            last_run_at = downstream_job['last_run_at']
+            if last_run_at and any(parent['last_run_at'] <= last_run_at for parent in parents):
+                continue
+            ready.append((child, max(parent['last_run_at'] for parent in parents)))
+        return ready
+
+
+# Singleton instance used across the application
+dependency_graph = DependencyGraph()
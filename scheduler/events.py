@@ -0,0 +1,152 @@
+import asyncio
+import json
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from core.utils.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class _Listener:
+    """
+    One connected client: its filters and a bounded queue of matching events.
+    """
+
+    def __init__(self, job_ids=None, statuses=None, tenant=None):
+        self.job_ids = set(job_ids) if job_ids else None
+        self.statuses = set(statuses) if statuses else None
+        self.tenant = tenant
+        self.queue = asyncio.Queue(maxsize=settings.SCHEDULER_STATUS_EVENTS_BUFFER)
+        self.dropped = 0
+
+    def matches(self, event: dict) -> bool:
+        return (
+            (self.job_ids is None or event['job_id'] in self.job_ids)
+            and (self.statuses is None or event['status'] in self.statuses)
+            and (self.tenant is None or event['tenant'] == self.tenant)
+        )
+
+
+class JobEventStream:
+    """
+    Publishes job status transitions on Redis pub/sub and streams them to clients as Server-Sent Events.
+
+    Workers and `JobService` publish one small JSON message per transition (after the
+    surrounding transaction commits). Each web process holds a single subscription, shared
+    by every connected client: events are filtered per client (job ids, statuses, tenant)
+    and queued to it, so watching jobs costs no database reads at all. A client too slow to
+    drain its queue loses events and is sent a `dropped` event telling it to resynchronize
+    through the REST API.
+    """
+
+    def __init__(self):
+        self._listeners = set()
+        self._reader = None
+
+    @property
+    def enabled(self) -> bool:
+        return settings.SCHEDULER_STATUS_EVENTS
+
+    @property
+    def channel(self) -> str:
+        return settings.SCHEDULER_STATUS_EVENTS_CHANNEL
+
+    def publish(self, job, status=None):
+        """
+        Announce that `job` moved to `status` (default: its current status).
+        """
+        self.publish_many([job.id], status or job.status, tenant=job.tenant)
+
+    def publish_many(self, job_ids, status, tenant=None):
+        """
+        Announce that the jobs in `job_ids` moved to `status`. Best-effort; never raises into the caller.
+        """
+        if not self.enabled or not job_ids:
+            return
+        at = timezone.now().isoformat()
+        messages = [json.dumps({'job_id': job_id, 'status': status, 'tenant': tenant, 'at': at}) for job_id in job_ids]
+        transaction.on_commit(lambda: self._send(messages))
+
+    def _send(self, messages):
+        try:
+            pipe = get_redis_client().pipeline(transaction=False)
+            for message in messages:
+                pipe.publish(self.channel, message)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"[JobEvents] Failed to publish {len(messages)} status event(s): {e}")
+
+    def _dispatch(self, data):
+        """
+        Queue a published event to every listener whose filters match it.
+        """
+        event = json.loads(data)
+        for listener in list(self._listeners):
+            if not listener.matches(event):
+                continue
+            try:
+                listener.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                listener.dropped += 1
+
+    async def _read(self):
+        import redis.asyncio
+
+        while self._listeners:
+            client = redis.asyncio.Redis.from_url(settings.SCHEDULER_REDIS_URL)
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                logger.info(f"[JobEvents] Subscribed to {self.channel}.")
+                async for message in pubsub.listen():
+                    if message['type'] == 'message':
+                        self._dispatch(message['data'])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[JobEvents] Subscription to {self.channel} lost, retrying: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
+
+    def _register(self, listener: _Listener):
+        self._listeners.add(listener)
+        # The reader belongs to the event loop that started it
+        if self._reader is None or self._reader.done() or self._reader.get_loop() is not asyncio.get_running_loop():
+            self._reader = asyncio.ensure_future(self._read())
+
+    def _unregister(self, listener: _Listener):
+        self._listeners.discard(listener)
+        if not self._listeners and self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+
+    async def stream(self, job_ids=None, statuses=None, tenant=None):
+        """
+        Async iterator of SSE frames for the matching transitions, with keep-alive comments while idle.
+        """
+        listener = _Listener(job_ids, statuses, tenant)
+        self._register(listener)
+        try:
+            yield f"retry: {settings.SCHEDULER_STATUS_EVENTS_RETRY_MS}\n\n"
+            while True:
+                if listener.dropped:
+                    yield f"event: dropped\ndata: {json.dumps({'count': listener.dropped})}\n\n"
+                    listener.dropped = 0
+                try:
+                    event = await asyncio.wait_for(listener.queue.get(), settings.SCHEDULER_STATUS_EVENTS_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: status\ndata: {json.dumps(event)}\n\n"
+        finally:
+            self._unregister(listener)
+
+
+# Singleton instance used across the application
+job_events = JobEventStream()
@@ -0,0 +1,52 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from scheduler.models import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+
+class Heartbeat:
+    """
+    Renews a running job's lease (`heartbeat_at`) from a background thread.
+
+    If the worker dies mid-execution the lease stops being renewed and the
+    reaper transitions the job out of RUNNING once it expires. `on_beat` is called
+    after each renewal, to extend other leases held by the run.
+    """
+
+    def __init__(self, job_id: int, interval=None, on_beat=None):
+        self.job_id = job_id
+        self.on_beat = on_beat
+        self.interval = interval if interval is not None else settings.SCHEDULER_HEARTBEAT_INTERVAL
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if self.interval:
+            self._thread = threading.Thread(target=self._beat, name=f'job-heartbeat-{self.job_id}', daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        return False
+
+    def _beat(self):
+        try:
+            while not self._stop.wait(self.interval):
+                ScheduledJob.objects.filter(pk=self.job_id).update(heartbeat_at=timezone.now())
+                if self.on_beat is not None:
+                    self.on_beat()
+                logger.debug(f"[Heartbeat] Renewed lease of job {self.job_id}.")
+        except Exception as e:
+            logger.error(f"[Heartbeat] Failed to renew lease of job {self.job_id}: {e}")
+        finally:
+            # Connections are per thread; don't leak this one
+            connections.close_all()
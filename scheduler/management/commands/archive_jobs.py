@@ -0,0 +1,49 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from scheduler.archive import job_archiver
+from scheduler.management.commands.prune_job_history import parse_duration
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Move finished one-off jobs older than a given age to the archive table, in bounded batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than',
+            help="Age of the one-off run time, e.g. 30d, 12h or 90m (bare numbers are days). "
+                 "Defaults to SCHEDULER_ARCHIVE_AFTER_DAYS.",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help="Maximum number of jobs moved per transaction. Defaults to SCHEDULER_ARCHIVE_BATCH_SIZE.",
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Only report how many jobs would be archived.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Copy eligible jobs into ArchivedJob and delete them from the live table, one batch at a time.
+        """
+        if options['batch_size'] is not None and options['batch_size'] <= 0:
+            raise CommandError("--batch-size must be positive.")
+
+        older_than = parse_duration(options['older_than']) if options['older_than'] else None
+        cutoff = job_archiver.cutoff(older_than)
+
+        if options['dry_run']:
+            count = job_archiver.eligible(cutoff).count()
+            self.stdout.write(self.style.NOTICE(f"{count} finished one-off job(s) ran before {cutoff}."))
+            return
+
+        self.stdout.write(self.style.NOTICE(f"Archiving finished one-off jobs that ran before {cutoff}..."))
+        archived = job_archiver.archive(cutoff, batch_size=options['batch_size'])
+        logger.info(f"[ArchiveJobs] Archived {archived} job(s).")
+        self.stdout.write(self.style.SUCCESS(f"{archived} job(s) archived."))
@@ -0,0 +1,83 @@
+import hashlib
+import logging
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+
+from scheduler.models import ResultBackendMode, ScheduledJob
+from scheduler.results import backend_results
+from scheduler.tasks import run_scheduled_job
+
+logger = logging.getLogger(__name__)
+
+# Keys deleted per round trip when cleaning up
+DELETE_CHUNK = 1000
+
+
+class Command(BaseCommand):
+    help = "Measure the Redis result backend memory used by run results, per result_backend mode."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=100_000,
+            help="Number of run results written per mode.",
+        )
+        parser.add_argument(
+            '--result-size',
+            type=int,
+            default=1024,
+            help="Size in bytes of the simulated job result.",
+        )
+        parser.add_argument(
+            '--mode',
+            action='append',
+            choices=ResultBackendMode.values,
+            help="Mode to measure. Repeatable; defaults to all of them.",
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help="Leave the written entries in Redis instead of deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Write `--runs` results the way `run_scheduled_job` does for each mode and report
+        the growth of Redis `used_memory`, scaled to 100k runs.
+        """
+        backend = run_scheduled_job.backend
+        client = getattr(backend, 'client', None)
+        if not hasattr(client, 'info'):
+            raise CommandError(f"A Redis result backend is required, got {type(backend).__name__}.")
+        runs = options['runs']
+        if runs <= 0:
+            raise CommandError("--runs must be positive.")
+
+        result = {'data': 'x' * options['result_size']}
+        digest = hashlib.sha256(result['data'].encode()).hexdigest()
+        for mode in options['mode'] or ResultBackendMode.values:
+            job = ScheduledJob(id=1, result_backend=mode, last_result_id=1, result_digest=digest)
+            self.stdout.write(self.style.NOTICE(f"Writing {runs} result(s) in '{mode}' mode..."))
+
+            prefix = f"benchmark-{uuid.uuid4().hex}"
+            task_ids = [f"{prefix}-{i}" for i in range(runs)]
+            before = client.info('memory')['used_memory']
+            started = time.perf_counter()
+            for task_id in task_ids:
+                backend_results.write(backend, task_id, job, result)
+            elapsed = time.perf_counter() - started
+            used = max(client.info('memory')['used_memory'] - before, 0)
+
+            if not options['keep']:
+                keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+                for i in range(0, len(keys), DELETE_CHUNK):
+                    client.delete(*keys[i:i + DELETE_CHUNK])
+
+            per_100k = used * 100_000 / runs / (1024 * 1024)
+            logger.info(f"[ResultBackendBenchmark] {mode}: {used} bytes for {runs} run(s) in {elapsed:.1f}s.")
+            self.stdout.write(f"  {mode:<7} {used / runs:10.1f} bytes/run  {per_100k:10.2f} MB per 100k runs")
+
+        self.stdout.write(self.style.SUCCESS("Done."))
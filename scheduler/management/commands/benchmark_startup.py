@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+import logging
+
+from core.utils.startup import measure_imports
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Measure worker start-up import time with `python -X importtime`."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--settings-module',
+            default='config.settings.worker',
+            help="DJANGO_SETTINGS_MODULE the worker is started with.",
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=15,
+            help="Number of slowest top-level imports to list.",
+        )
+        parser.add_argument(
+            '--budget-ms',
+            type=float,
+            help="Fail if start-up takes longer than this many milliseconds.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Start a fresh interpreter the way a worker boots (django.setup(), Celery task discovery)
+        and report the start-up time and the heaviest top-level imports.
+        """
+        self.stdout.write(self.style.NOTICE(f"Measuring worker start-up with {options['settings_module']}..."))
+        try:
+            report = measure_imports(options['settings_module'])
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        slowest = sorted(report['modules'].items(), key=lambda item: item[1], reverse=True)[:options['top']]
+        for name, ms in slowest:
+            self.stdout.write(f"{ms:10.1f} ms  {name}")
+
+        self.stdout.write(f"{len(report['imported'])} module(s) loaded, {report['total_ms']} ms reported by importtime.")
+
+        logger.info(f"[StartupBenchmark] {options['settings_module']}: start-up took {report['wall_ms']} ms.")
+        budget = options['budget_ms']
+        if budget is not None and report['wall_ms'] > budget:
+            raise CommandError(f"Start-up took {report['wall_ms']} ms, over the {budget} ms budget.")
+        self.stdout.write(self.style.SUCCESS(f"Start-up time: {report['wall_ms']} ms."))
@@ -0,0 +1,59 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from scheduler.management.commands.prune_job_history import parse_duration
+from scheduler.retention import job_data_pruner
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Delete old run claims, stats buckets and superseded results, in bounded batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than',
+            required=True,
+            help="Age of the rows to delete, e.g. 30d, 12h or 90m (bare numbers are days).",
+        )
+        parser.add_argument(
+            '--stats-older-than',
+            help="Age of the stats buckets to delete, if they should be kept longer than runs and results.",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help="Maximum number of rows deleted per statement.",
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Only report how many rows would be deleted.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Delete each kind of per-run row older than its cutoff, one primary-key batch at a time.
+        """
+        if options['batch_size'] <= 0:
+            raise CommandError("--batch-size must be positive.")
+
+        now = timezone.now()
+        cutoff = now - parse_duration(options['older_than'])
+        stats_cutoff = now - parse_duration(options['stats_older_than']) if options['stats_older_than'] else cutoff
+        querysets = {
+            'run claim(s)': job_data_pruner.runs(cutoff),
+            'stats bucket(s)': job_data_pruner.stats(stats_cutoff),
+            'superseded result(s)': job_data_pruner.results(cutoff),
+        }
+
+        for label, queryset in querysets.items():
+            if options['dry_run']:
+                self.stdout.write(self.style.NOTICE(f"{queryset.count()} {label} to delete."))
+                continue
+            deleted = job_data_pruner.prune(queryset, options['batch_size'])
+            logger.info(f"[PruneJobData] Deleted {deleted} {label}.")
+            self.stdout.write(self.style.SUCCESS(f"{deleted} {label} deleted."))
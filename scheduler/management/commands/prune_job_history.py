@@ -0,0 +1,77 @@
+import logging
+import re
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from scheduler.models import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+# Units accepted by --older-than, e.g. "30d", "12h", "90m"
+DURATION_UNITS = {'d': 'days', 'h': 'hours', 'm': 'minutes'}
+
+
+def parse_duration(value: str) -> timedelta:
+    """
+    Parse a duration such as '30d', '12h' or '90m'. A bare number means days.
+    """
+    match = re.fullmatch(r'(\d+)([dhm]?)', value.strip())
+    if not match:
+        raise CommandError(f"Invalid duration '{value}'. Use e.g. 30d, 12h or 90m.")
+    amount, unit = match.groups()
+    return timedelta(**{DURATION_UNITS[unit or 'd']: int(amount)})
+
+
+class Command(BaseCommand):
+    help = "Delete historical ScheduledJob records older than a given age, in bounded batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than',
+            required=True,
+            help="Age of the records to delete, e.g. 30d, 12h or 90m (bare numbers are days).",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help="Maximum number of rows deleted per statement.",
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Only report how many records would be deleted.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Delete history rows older than the cutoff, one primary-key batch at a time,
+        so each statement holds locks only briefly.
+        """
+        if options['batch_size'] <= 0:
+            raise CommandError("--batch-size must be positive.")
+
+        cutoff = timezone.now() - parse_duration(options['older_than'])
+        history = ScheduledJob.history.model.objects.filter(history_date__lt=cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(self.style.NOTICE(f"{history.count()} history record(s) older than {cutoff}."))
+            return
+
+        self.stdout.write(self.style.NOTICE(f"Pruning job history older than {cutoff}..."))
+        deleted_total = 0
+
+        while True:
+            batch = list(
+                history.order_by('history_id').values_list('history_id', flat=True)[:options['batch_size']]
+            )
+            if not batch:
+                break
+
+            deleted, _ = ScheduledJob.history.model.objects.filter(history_id__in=batch).delete()
+            deleted_total += deleted
+            logger.info(f"[PruneHistory] Deleted {deleted} history record(s).")
+
+        self.stdout.write(self.style.SUCCESS(f"{deleted_total} history record(s) deleted."))
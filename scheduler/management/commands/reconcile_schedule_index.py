@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+import logging
+
+from core.utils.scheduler.redis_index_engine import redis_index_engine
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Redis scheduling index from the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help="Number of jobs streamed from the database and written to Redis per round trip.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Stream all active jobs and replace the per-tenant sorted sets with their next fire times.
+        Useful after a Redis flush, a dispatcher crash (claimed jobs left in the processing
+        sets are re-indexed) or when the index drifted from the database.
+        """
+        self.stdout.write(self.style.NOTICE("Rebuilding scheduling index..."))
+        indexed = redis_index_engine.rebuild(chunk_size=options['chunk_size'])
+        logger.info(f"[ReconcileIndex] Indexed {indexed} job(s).")
+        self.stdout.write(self.style.SUCCESS(f"{indexed} job(s) indexed."))
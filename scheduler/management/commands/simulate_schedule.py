@@ -0,0 +1,121 @@
+import json
+import logging
+from datetime import timedelta
+
+from croniter import croniter
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from scheduler.simulation import ScheduleSimulator
+
+logger = logging.getLogger(__name__)
+
+
+def parse_moment(value: str):
+    """
+    Parse an ISO 8601 datetime; naive values are taken as UTC.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        raise CommandError(f"Invalid datetime '{value}'. Use ISO 8601, e.g. 2030-01-01T00:00:00Z.")
+    return moment if timezone.is_aware(moment) else timezone.make_aware(moment, timezone.utc)
+
+
+class Command(BaseCommand):
+    help = "Replay the dispatches of a time window on a virtual clock and report the load they produce."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--from',
+            dest='start',
+            help="Start of the window (ISO 8601). Defaults to now.",
+        )
+        parser.add_argument(
+            '--to',
+            dest='end',
+            help="End of the window (ISO 8601). Defaults to one week after the start.",
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=1.0,
+            help="Run duration in seconds assumed for jobs without execution stats.",
+        )
+        parser.add_argument(
+            '--add',
+            nargs=2,
+            action='append',
+            default=[],
+            metavar=('CRON', 'COUNT'),
+            help="Simulate COUNT additional jobs on CRON, e.g. --add '*/5 * * * *' 500. Repeatable.",
+        )
+        parser.add_argument(
+            '--spread',
+            type=int,
+            help="Spread window (seconds) of the jobs added with --add. Defaults to SCHEDULER_DEFAULT_SPREAD_SECONDS.",
+        )
+        parser.add_argument(
+            '--max-per-second',
+            type=int,
+            help="Fail if any second sees more dispatches than this.",
+        )
+        parser.add_argument(
+            '--max-concurrency',
+            type=int,
+            help="Fail if more runs than this overlap at any time.",
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help="Print the report as JSON.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Simulate the window and print per-second dispatch load, peak concurrency and quota decisions.
+        """
+        start = parse_moment(options['start']) if options['start'] else timezone.now()
+        end = parse_moment(options['end']) if options['end'] else start + timedelta(days=7)
+        if end <= start:
+            raise CommandError("--to must be after --from.")
+
+        extra_jobs = []
+        for expression, count in options['add']:
+            if not croniter.is_valid(expression):
+                raise CommandError(f"Invalid cron expression '{expression}'.")
+            if not count.isdigit():
+                raise CommandError(f"Invalid job count '{count}'.")
+            extra_jobs.append((expression, int(count), options['spread']))
+
+        if not options['json']:
+            self.stdout.write(self.style.NOTICE(f"Simulating dispatches from {start} to {end}..."))
+        report = ScheduleSimulator(start, end, default_duration=options['duration'], extra_jobs=extra_jobs).run()
+        logger.info(f"[SimulateSchedule] {report['dispatches']} dispatch(es) replayed in {report['elapsed_seconds']}s.")
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, cls=DjangoJSONEncoder, indent=2))
+        else:
+            self._print(report)
+
+        failures = []
+        if options['max_per_second'] is not None and report['peak_per_second'] > options['max_per_second']:
+            failures.append(f"peak of {report['peak_per_second']} dispatches/s exceeds {options['max_per_second']}")
+        if options['max_concurrency'] is not None and report['peak_concurrency'] > options['max_concurrency']:
+            failures.append(f"peak concurrency of {report['peak_concurrency']} exceeds {options['max_concurrency']}")
+        if failures:
+            raise CommandError("; ".join(failures))
+
+    def _print(self, report):
+        self.stdout.write(f"Jobs simulated:        {report['jobs']}")
+        self.stdout.write(f"Dispatches:            {report['dispatches']} over {report['busy_seconds']} busy second(s)")
+        self.stdout.write(f"Peak per second:       {report['peak_per_second']} (p99 of busy seconds: "
+                          f"{report['p99_per_busy_second']})")
+        self.stdout.write(f"Peak concurrency:      {report['peak_concurrency']} at {report['peak_concurrency_at']}")
+        self.stdout.write(f"Overlapping runs:      {report['overlaps']}")
+        self.stdout.write(f"Deferred by quotas:    {report['deferred']} ({report['dropped']} pushed past the window)")
+        self.stdout.write("Busiest seconds:")
+        for second, count in report['busiest_seconds']:
+            self.stdout.write(f"  {second.isoformat()}  {count}")
+        self.stdout.write(self.style.SUCCESS(f"Replayed in {report['elapsed_seconds']}s."))
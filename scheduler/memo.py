@@ -0,0 +1,112 @@
+import hashlib
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core.utils.metrics import incr_counter
+from scheduler.models import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+# Prefix of memoized results (and their locks) in the default cache
+KEY_PREFIX = 'scheduler:memo'
+
+# Distinguishes a cached None result from a miss
+MISSING = object()
+
+
+class ResultCache:
+    """
+    Memoizes the results of jobs with a `result_cache_ttl` in the default cache.
+
+    Results are keyed by a hash of the call, `(task_path, args, kwargs)`, so every job
+    making the same call shares them. On a miss one run takes the call's lock and
+    computes; identical runs arriving meanwhile poll for its result instead of invoking
+    the callable too (single flight). Failures are never cached: the lock is released
+    and the next run computes again. The cache is an optimization only, so cache errors
+    fall back to invoking the callable.
+    """
+
+    @staticmethod
+    def key(job: ScheduledJob) -> str:
+        call = json.dumps(
+            [job.task_path, job.args or [], job.kwargs or {}],
+            cls=DjangoJSONEncoder, sort_keys=True, separators=(',', ':'),
+        )
+        return f"{KEY_PREFIX}:{hashlib.sha256(call.encode()).hexdigest()}"
+
+    def get_or_compute(self, job: ScheduledJob, compute):
+        """
+        Return the cached result of the job's call, or `compute()` it and cache it for `result_cache_ttl` seconds.
+        """
+        if not job.result_cache_ttl:
+            return compute()
+
+        key = self.key(job)
+        lock_key = f"{key}:lock"
+        # The lock outlives a run cut off at its hard limit only until the same deadline
+        lock_timeout = job.time_limit or settings.SCHEDULER_RESULT_CACHE_LOCK_TIMEOUT
+        deadline = time.monotonic() + lock_timeout
+
+        cached = self._get(key)
+        while cached is MISSING:
+            if self._lock(lock_key, lock_timeout):
+                try:
+                    # The previous holder may have stored the result just before releasing
+                    cached = self._get(key)
+                    if cached is not MISSING:
+                        break
+                    return self._compute(job, key, compute)
+                finally:
+                    self._unlock(lock_key)
+
+            if time.monotonic() >= deadline:
+                logger.warning(f"[ResultCache] Gave up waiting for the result of job {job.id}'s call; computing it.")
+                return self._compute(job, key, compute)
+            time.sleep(settings.SCHEDULER_RESULT_CACHE_POLL_INTERVAL)
+            cached = self._get(key)
+
+        incr_counter('scheduler.result_cache.hit')
+        logger.info(f"[ResultCache] Job {job.id} served from the result cache.")
+        return cached
+
+    def _compute(self, job: ScheduledJob, key: str, compute):
+        incr_counter('scheduler.result_cache.miss')
+        result = compute()
+        try:
+            cache.set(key, result, timeout=job.result_cache_ttl)
+        except Exception as e:
+            logger.warning(f"[ResultCache] Failed to cache the result of job {job.id}: {e}")
+        return result
+
+    @staticmethod
+    def _get(key: str):
+        try:
+            return cache.get(key, MISSING)
+        except Exception as e:
+            logger.warning(f"[ResultCache] Failed to read {key}: {e}")
+            return MISSING
+
+    @staticmethod
+    def _lock(lock_key: str, timeout: int) -> bool:
+        try:
+            return cache.add(lock_key, 1, timeout=timeout)
+        except Exception as e:
+            # Better a duplicate computation than a run waiting on an unreachable cache
+            logger.warning(f"[ResultCache] Failed to lock {lock_key}, computing anyway: {e}")
+            return True
+
+    @staticmethod
+    def _unlock(lock_key: str):
+        try:
+            cache.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"[ResultCache] Failed to release {lock_key}: {e}")
+
+
+# Singleton instance used across the application
+result_cache = ResultCache()
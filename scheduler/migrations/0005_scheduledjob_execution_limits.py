@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0004_scheduledjob_error_message_scheduledjob_result_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='max_memory_mb',
+            field=models.PositiveIntegerField(blank=True, help_text='Optional RSS ceiling in MB for the worker process while the task runs.', null=True, verbose_name='Max Memory (MB)'),
+        ),
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='soft_time_limit',
+            field=models.PositiveIntegerField(blank=True, help_text='Seconds after which the task is interrupted and marked as failed.', null=True, verbose_name='Soft Time Limit'),
+        ),
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='time_limit',
+            field=models.PositiveIntegerField(blank=True, help_text='Hard limit in seconds; the worker process is recycled when exceeded.', null=True, verbose_name='Time Limit'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='max_memory_mb',
+            field=models.PositiveIntegerField(blank=True, help_text='Optional RSS ceiling in MB for the worker process while the task runs.', null=True, verbose_name='Max Memory (MB)'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='soft_time_limit',
+            field=models.PositiveIntegerField(blank=True, help_text='Seconds after which the task is interrupted and marked as failed.', null=True, verbose_name='Soft Time Limit'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='time_limit',
+            field=models.PositiveIntegerField(blank=True, help_text='Hard limit in seconds; the worker process is recycled when exceeded.', null=True, verbose_name='Time Limit'),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:40
+
+import hashlib
+import json
+import zlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def move_results_to_job_results(apps, schema_editor):
+    """
+    Carry the truncated text results over into the results table before dropping the column.
+    """
+    ScheduledJob = apps.get_model('scheduler', 'ScheduledJob')
+    JobResult = apps.get_model('scheduler', 'JobResult')
+
+    for job in ScheduledJob.objects.exclude(result__isnull=True).only('id', 'result').iterator(chunk_size=1000):
+        data = json.dumps(job.result).encode()
+        job_result = JobResult.objects.create(
+            job_id=job.id,
+            digest=hashlib.sha256(data).hexdigest(),
+            encoding='json',
+            compression='zlib',
+            size=len(data),
+            payload=zlib.compress(data),
+        )
+        ScheduledJob.objects.filter(id=job.id).update(last_result=job_result, result_digest=job_result.digest)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0005_scheduledjob_execution_limits'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='result_digest',
+            field=models.CharField(blank=True, help_text='SHA-256 of the serialized latest result.', max_length=64, null=True, verbose_name='Result Digest'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='result_digest',
+            field=models.CharField(blank=True, help_text='SHA-256 of the serialized latest result.', max_length=64, null=True, verbose_name='Result Digest'),
+        ),
+        migrations.CreateModel(
+            name='JobResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, verbose_name='Digest')),
+                ('encoding', models.CharField(help_text='Serialization format of the payload (json or repr).', max_length=16, verbose_name='Encoding')),
+                ('compression', models.CharField(help_text='Compression codec applied to the payload (zlib or none).', max_length=16, verbose_name='Compression')),
+                ('size', models.PositiveIntegerField(help_text='Size in bytes of the serialized, uncompressed payload.', verbose_name='Size')),
+                ('storage', models.CharField(choices=[('db', 'Database'), ('file', 'File Storage')], default='db', max_length=10, verbose_name='Storage')),
+                ('payload', models.BinaryField(blank=True, null=True, verbose_name='Payload')),
+                ('location', models.CharField(blank=True, max_length=255, null=True, verbose_name='Location')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='scheduler.scheduledjob', verbose_name='Job')),
+            ],
+            options={
+                'verbose_name': 'Job Result',
+                'verbose_name_plural': 'Job Results',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='last_result',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='scheduler.jobresult', verbose_name='Last Result'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='last_result',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='scheduler.jobresult', verbose_name='Last Result'),
+        ),
+        migrations.AddIndex(
+            model_name='jobresult',
+            index=models.Index(fields=['job', '-created_at'], name='scheduler_j_job_id_a675f6_idx'),
+        ),
+        migrations.RunPython(move_results_to_job_results, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='historicalscheduledjob',
+            name='result',
+        ),
+        migrations.RemoveField(
+            model_name='scheduledjob',
+            name='result',
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0006_jobresult'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('run_key', models.CharField(max_length=255, unique=True, verbose_name='Run Key')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled'), ('running', 'Running'), ('success', 'Success'), ('failed', 'Failed')], default='running', max_length=20, verbose_name='Status')),
+                ('worker', models.CharField(blank=True, max_length=255, null=True, verbose_name='Worker')),
+                ('claimed_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Claimed At')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished At')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='runs', to='scheduler.scheduledjob', verbose_name='Job')),
+            ],
+            options={
+                'verbose_name': 'Job Run',
+                'verbose_name_plural': 'Job Runs',
+                'ordering': ['-claimed_at'],
+            },
+        ),
+    ]
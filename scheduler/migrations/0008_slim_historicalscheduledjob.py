@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0007_jobrun'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='historicalscheduledjob',
+            name='error_message',
+        ),
+        migrations.RemoveField(
+            model_name='historicalscheduledjob',
+            name='last_result',
+        ),
+        migrations.RemoveField(
+            model_name='historicalscheduledjob',
+            name='last_run_at',
+        ),
+        migrations.RemoveField(
+            model_name='historicalscheduledjob',
+            name='next_run_at',
+        ),
+        migrations.RemoveField(
+            model_name='historicalscheduledjob',
+            name='result_digest',
+        ),
+        migrations.RemoveField(
+            model_name='historicalscheduledjob',
+            name='status',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0008_slim_historicalscheduledjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='upstream_jobs',
+            field=models.ManyToManyField(blank=True, help_text='This job runs as soon as all of these jobs have succeeded.', related_name='downstream_jobs', to='scheduler.scheduledjob', verbose_name='Upstream Jobs'),
+        ),
+    ]
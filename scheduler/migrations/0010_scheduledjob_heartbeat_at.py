@@ -0,0 +1,22 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0009_scheduledjob_upstream_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Heartbeat At'),
+        ),
+        migrations.AddIndex(
+            model_name='scheduledjob',
+            index=models.Index(fields=['status', 'heartbeat_at'], name='scheduler_s_status_03389f_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0010_scheduledjob_heartbeat_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='spread_seconds',
+            field=models.PositiveIntegerField(blank=True, help_text='Offset cron dispatches by up to this many seconds (per-job hash). Empty uses the global default; 0 disables.', null=True, verbose_name='Spread Seconds'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='spread_seconds',
+            field=models.PositiveIntegerField(blank=True, help_text='Offset cron dispatches by up to this many seconds (per-job hash). Empty uses the global default; 0 disables.', null=True, verbose_name='Spread Seconds'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0011_scheduledjob_spread_seconds'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_path', models.CharField(max_length=255, verbose_name='Task Path')),
+                ('bucket', models.DateTimeField(verbose_name='Bucket')),
+                ('runs', models.PositiveIntegerField(default=0, verbose_name='Runs')),
+                ('successes', models.PositiveIntegerField(default=0, verbose_name='Successes')),
+                ('failures', models.PositiveIntegerField(default=0, verbose_name='Failures')),
+                ('total_duration_ms', models.BigIntegerField(default=0, verbose_name='Total Duration (ms)')),
+                ('max_duration_ms', models.BigIntegerField(default=0, verbose_name='Max Duration (ms)')),
+                ('histogram', models.JSONField(default=list, verbose_name='Duration Histogram')),
+                ('job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='scheduler.scheduledjob', verbose_name='Job')),
+            ],
+            options={
+                'verbose_name': 'Job Stats',
+                'verbose_name_plural': 'Job Stats',
+                'ordering': ['-bucket'],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('job__isnull', False)), fields=('job', 'bucket'), name='unique_job_stats_bucket'), models.UniqueConstraint(condition=models.Q(('job__isnull', True)), fields=('task_path', 'bucket'), name='unique_task_path_stats_bucket')],
+            },
+        ),
+    ]
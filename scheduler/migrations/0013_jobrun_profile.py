@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0012_jobstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobrun',
+            name='profile',
+            field=models.JSONField(blank=True, null=True, verbose_name='Profile'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:56
+
+import django.db.models.deletion
+import simple_history.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0013_jobrun_profile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HistoricalTenantQuota',
+            fields=[
+                ('id', models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name='ID')),
+                ('created_at', models.DateTimeField(blank=True, editable=False, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(blank=True, editable=False, verbose_name='Updated At')),
+                ('tenant', models.CharField(db_index=True, max_length=64, verbose_name='Tenant')),
+                ('weight', models.PositiveIntegerField(default=1, help_text='Relative share of dispatch capacity when several tenants have due jobs.', verbose_name='Weight')),
+                ('max_concurrency', models.PositiveIntegerField(blank=True, help_text='Maximum jobs of this tenant running at once. Empty means unlimited.', null=True, verbose_name='Max Concurrency')),
+                ('max_runs_per_minute', models.PositiveIntegerField(blank=True, help_text='Maximum job starts of this tenant per minute. Empty means unlimited.', null=True, verbose_name='Max Runs Per Minute')),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+            ],
+            options={
+                'verbose_name': 'historical Tenant Quota',
+                'verbose_name_plural': 'historical Tenant Quotas',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='TenantQuota',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('tenant', models.CharField(max_length=64, unique=True, verbose_name='Tenant')),
+                ('weight', models.PositiveIntegerField(default=1, help_text='Relative share of dispatch capacity when several tenants have due jobs.', verbose_name='Weight')),
+                ('max_concurrency', models.PositiveIntegerField(blank=True, help_text='Maximum jobs of this tenant running at once. Empty means unlimited.', null=True, verbose_name='Max Concurrency')),
+                ('max_runs_per_minute', models.PositiveIntegerField(blank=True, help_text='Maximum job starts of this tenant per minute. Empty means unlimited.', null=True, verbose_name='Max Runs Per Minute')),
+            ],
+            options={
+                'verbose_name': 'Tenant Quota',
+                'verbose_name_plural': 'Tenant Quotas',
+                'ordering': ['tenant'],
+            },
+        ),
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='tenant',
+            field=models.CharField(default='default', help_text='Tenant the job belongs to. Concurrency/rate quotas and dispatch fairness apply per tenant.', max_length=64, verbose_name='Tenant'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='tenant',
+            field=models.CharField(default='default', help_text='Tenant the job belongs to. Concurrency/rate quotas and dispatch fairness apply per tenant.', max_length=64, verbose_name='Tenant'),
+        ),
+        migrations.AddIndex(
+            model_name='scheduledjob',
+            index=models.Index(fields=['tenant', 'status', 'next_run_at'], name='scheduler_s_tenant_c7f683_idx'),
+        ),
+        migrations.AddField(
+            model_name='historicaltenantquota',
+            name='history_user',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:04
+
+import django.db.models.deletion
+import simple_history.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0014_tenants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobTemplate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='Name')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Description')),
+                ('tenant', models.CharField(default='default', max_length=64, verbose_name='Tenant')),
+                ('task_path', models.CharField(help_text='Import path of the callable run once per parameter row.', max_length=255, verbose_name='Task Path')),
+                ('cron_expression', models.CharField(help_text='Standard 5-field cron expression shared by every instance.', max_length=100, verbose_name='Cron Expression')),
+                ('args', models.JSONField(blank=True, help_text='Positional args used by parameter rows that define none.', null=True, verbose_name='*args')),
+                ('kwargs', models.JSONField(blank=True, help_text='Keyword args shared by every instance; parameter kwargs override them.', null=True, verbose_name='**kwargs')),
+                ('batch_size', models.PositiveIntegerField(default=500, help_text='Number of instances executed by one worker message.', verbose_name='Batch Size')),
+                ('is_active', models.BooleanField(db_index=True, default=True, verbose_name='Is Active')),
+                ('last_run_at', models.DateTimeField(blank=True, null=True, verbose_name='Last Run At')),
+                ('last_expansion', models.JSONField(blank=True, null=True, verbose_name='Last Expansion')),
+            ],
+            options={
+                'verbose_name': 'Job Template',
+                'verbose_name_plural': 'Job Templates',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HistoricalJobTemplate',
+            fields=[
+                ('id', models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name='ID')),
+                ('created_at', models.DateTimeField(blank=True, editable=False, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(blank=True, editable=False, verbose_name='Updated At')),
+                ('name', models.CharField(db_index=True, max_length=255, verbose_name='Name')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Description')),
+                ('tenant', models.CharField(default='default', max_length=64, verbose_name='Tenant')),
+                ('task_path', models.CharField(help_text='Import path of the callable run once per parameter row.', max_length=255, verbose_name='Task Path')),
+                ('cron_expression', models.CharField(help_text='Standard 5-field cron expression shared by every instance.', max_length=100, verbose_name='Cron Expression')),
+                ('args', models.JSONField(blank=True, help_text='Positional args used by parameter rows that define none.', null=True, verbose_name='*args')),
+                ('kwargs', models.JSONField(blank=True, help_text='Keyword args shared by every instance; parameter kwargs override them.', null=True, verbose_name='**kwargs')),
+                ('batch_size', models.PositiveIntegerField(default=500, help_text='Number of instances executed by one worker message.', verbose_name='Batch Size')),
+                ('is_active', models.BooleanField(db_index=True, default=True, verbose_name='Is Active')),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'historical Job Template',
+                'verbose_name_plural': 'historical Job Templates',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='JobTemplateParameter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, verbose_name='Key')),
+                ('args', models.JSONField(blank=True, help_text="Positional args of this instance; empty uses the template's.", null=True, verbose_name='*args')),
+                ('kwargs', models.JSONField(blank=True, help_text="Keyword args of this instance, merged over the template's.", null=True, verbose_name='**kwargs')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('template', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='parameters', to='scheduler.jobtemplate', verbose_name='Template')),
+            ],
+            options={
+                'verbose_name': 'Job Template Parameter',
+                'verbose_name_plural': 'Job Template Parameters',
+                'ordering': ['template', 'id'],
+                'indexes': [models.Index(fields=['template', 'is_active', 'id'], name='scheduler_j_templat_024904_idx')],
+                'constraints': [models.UniqueConstraint(fields=('template', 'key'), name='unique_template_parameter_key')],
+            },
+        ),
+    ]
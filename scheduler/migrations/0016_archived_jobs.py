@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0015_job_templates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.BigIntegerField(unique=True, verbose_name='Original ID')),
+                ('name', models.CharField(max_length=255, verbose_name='Name')),
+                ('tenant', models.CharField(max_length=64, verbose_name='Tenant')),
+                ('task_path', models.CharField(max_length=255, verbose_name='Task Path')),
+                ('args', models.JSONField(blank=True, null=True, verbose_name='*args')),
+                ('kwargs', models.JSONField(blank=True, null=True, verbose_name='**kwargs')),
+                ('one_off_run_time', models.DateTimeField(verbose_name='One-off Run Time')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('scheduled', 'Scheduled'), ('running', 'Running'), ('success', 'Success'), ('failed', 'Failed')], max_length=20, verbose_name='Status')),
+                ('last_run_at', models.DateTimeField(blank=True, null=True, verbose_name='Last Run At')),
+                ('error_message', models.TextField(blank=True, null=True, verbose_name='Error Message')),
+                ('result', models.JSONField(blank=True, help_text='Digest, encoding, compression, size, storage and location of the latest result.', null=True, verbose_name='Result Reference')),
+                ('result_payload', models.BinaryField(blank=True, null=True, verbose_name='Result Payload')),
+                ('created_at', models.DateTimeField(help_text='When the job was originally created.', verbose_name='Created At')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Archived At')),
+            ],
+            options={
+                'verbose_name': 'Archived Job',
+                'verbose_name_plural': 'Archived Jobs',
+                'ordering': ['-one_off_run_time'],
+                'indexes': [models.Index(fields=['tenant', '-one_off_run_time'], name='scheduler_a_tenant_55b3c2_idx'), models.Index(fields=['task_path', '-one_off_run_time'], name='scheduler_a_task_pa_14c9d3_idx')],
+            },
+        ),
+    ]
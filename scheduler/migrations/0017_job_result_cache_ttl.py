@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0016_archived_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='result_cache_ttl',
+            field=models.PositiveIntegerField(blank=True, help_text='Seconds a result is reused for identical (task path, args, kwargs) calls instead of invoking the callable again. Empty disables caching.', null=True, verbose_name='Result Cache TTL'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='result_cache_ttl',
+            field=models.PositiveIntegerField(blank=True, help_text='Seconds a result is reused for identical (task path, args, kwargs) calls instead of invoking the callable again. Empty disables caching.', null=True, verbose_name='Result Cache TTL'),
+        ),
+    ]
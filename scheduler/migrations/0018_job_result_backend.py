@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0017_job_result_cache_ttl'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='result_backend',
+            field=models.CharField(choices=[('none', 'Not Stored'), ('digest', 'Digest'), ('full', 'Full Result')], default='none', help_text='What each run writes to the Celery result backend: nothing, a digest reference or the full result.', max_length=10, verbose_name='Result Backend'),
+        ),
+        migrations.AddField(
+            model_name='historicalscheduledjob',
+            name='result_expires',
+            field=models.PositiveIntegerField(blank=True, help_text="Seconds the result backend keeps a run's entry. Empty uses CELERY_RESULT_EXPIRES.", null=True, verbose_name='Result Expires'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='result_backend',
+            field=models.CharField(choices=[('none', 'Not Stored'), ('digest', 'Digest'), ('full', 'Full Result')], default='none', help_text='What each run writes to the Celery result backend: nothing, a digest reference or the full result.', max_length=10, verbose_name='Result Backend'),
+        ),
+        migrations.AddField(
+            model_name='scheduledjob',
+            name='result_expires',
+            field=models.PositiveIntegerField(blank=True, help_text="Seconds the result backend keeps a run's entry. Empty uses CELERY_RESULT_EXPIRES.", null=True, verbose_name='Result Expires'),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:20
+
+import logging
+
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+CREATED_INDEX = models.Index(fields=['created_at', 'id'], name='scheduler_s_created_534f8a_idx')
+
+# Trigram indexes matching the admin's `icontains` searches, i.e. `UPPER(column::text) LIKE UPPER(%s)`
+TRIGRAM_INDEXES = {
+    'scheduler_job_name_trgm_idx': 'name',
+    'scheduler_job_task_path_trgm_idx': 'task_path',
+    'scheduler_job_description_trgm_idx': 'description',
+}
+
+
+def add_created_index(apps, schema_editor):
+    """
+    Built concurrently on PostgreSQL so a large jobs table stays writable meanwhile.
+    """
+    model = apps.get_model('scheduler', 'ScheduledJob')
+    if schema_editor.connection.vendor != 'postgresql':
+        schema_editor.add_index(model, CREATED_INDEX)
+        return
+    schema_editor.execute(
+        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{CREATED_INDEX.name}" '
+        f'ON "{model._meta.db_table}" ("created_at", "id")'
+    )
+
+
+def remove_created_index(apps, schema_editor):
+    model = apps.get_model('scheduler', 'ScheduledJob')
+    if schema_editor.connection.vendor != 'postgresql':
+        schema_editor.remove_index(model, CREATED_INDEX)
+        return
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{CREATED_INDEX.name}"')
+
+
+def add_trigram_indexes(apps, schema_editor):
+    """
+    PostgreSQL only; without the pg_trgm extension (or the right to create it) searches fall back to scans.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('scheduler', 'ScheduledJob')._meta.db_table
+    try:
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except Exception as e:
+        logger.warning(f"[Migrations] pg_trgm unavailable, skipping admin search indexes: {e}")
+        return
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "{table}" '
+            f'USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+        )
+
+
+def remove_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('scheduler', '0018_job_result_backend'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='scheduledjob', index=CREATED_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(add_created_index, remove_created_index),
+            ],
+        ),
+        migrations.RunPython(add_trigram_indexes, remove_trigram_indexes),
+    ]
@@ -15,6 +15,13 @@ class JobStatus(models.TextChoices):
     FAILED = 'failed', _('Failed')  # Execution failed
 
 
+# What a run leaves in the Celery result backend; the database always keeps the result
+class ResultBackendMode(models.TextChoices):
+    NONE = 'none', _('Not Stored')  # Nothing is written to the result backend
+    DIGEST = 'digest', _('Digest')  # A reference to the stored result (ids and digest)
+    FULL = 'full', _('Full Result')  # The raw return value
+
+
 # Main model for a scheduled task/job
 class ScheduledJob(BaseModel):
     # Human-readable name of the job
@@ -29,6 +36,14 @@ class ScheduledJob(BaseModel):
         help_text="Optional text description for understanding the job purpose."
     )
 
+    # Customer owning the job; quotas and fair dispatch are applied per tenant
+    tenant = models.CharField(
+        verbose_name=_('Tenant'),
+        max_length=64,
+        default='default',
+        help_text="Tenant the job belongs to. Concurrency/rate quotas and dispatch fairness apply per tenant.",
+    )
+
     # Fully-qualified import path to the Celery task function
     task_path = models.CharField(
         verbose_name=_('Task Path'),
@@ -80,6 +95,69 @@ class ScheduledJob(BaseModel):
         help_text="Maximum retry attempts if the task execution fails."
     )
 
+    # Window over which cron dispatches are deterministically offset to avoid top-of-minute spikes
+    spread_seconds = models.PositiveIntegerField(
+        verbose_name=_('Spread Seconds'),
+        blank=True,
+        null=True,
+        help_text="Offset cron dispatches by up to this many seconds (per-job hash). "
+                  "Empty uses the global default; 0 disables.",
+    )
+
+    # Execution bounds enforced by the worker around the task callable
+    soft_time_limit = models.PositiveIntegerField(
+        verbose_name=_('Soft Time Limit'),
+        blank=True,
+        null=True,
+        help_text="Seconds after which the task is interrupted and marked as failed.",
+    )
+    time_limit = models.PositiveIntegerField(
+        verbose_name=_('Time Limit'),
+        blank=True,
+        null=True,
+        help_text="Hard limit in seconds; the worker process is recycled when exceeded.",
+    )
+    max_memory_mb = models.PositiveIntegerField(
+        verbose_name=_('Max Memory (MB)'),
+        blank=True,
+        null=True,
+        help_text="Optional RSS ceiling in MB for the worker process while the task runs.",
+    )
+
+    # Opt-in memoization for deterministic callables: identical calls reuse the cached result
+    result_cache_ttl = models.PositiveIntegerField(
+        verbose_name=_('Result Cache TTL'),
+        blank=True,
+        null=True,
+        help_text="Seconds a result is reused for identical (task path, args, kwargs) calls "
+                  "instead of invoking the callable again. Empty disables caching.",
+    )
+
+    # Celery result backend writes of each run, on top of the result kept in the database
+    result_backend = models.CharField(
+        verbose_name=_('Result Backend'),
+        max_length=10,
+        choices=ResultBackendMode.choices,
+        default=ResultBackendMode.NONE,
+        help_text="What each run writes to the Celery result backend: nothing, a digest reference or the full result.",
+    )
+    result_expires = models.PositiveIntegerField(
+        verbose_name=_('Result Expires'),
+        blank=True,
+        null=True,
+        help_text="Seconds the result backend keeps a run's entry. Empty uses CELERY_RESULT_EXPIRES.",
+    )
+
+    # Jobs that must succeed before this one is triggered (fan-in); cycles are rejected
+    upstream_jobs = models.ManyToManyField(
+        'self',
+        verbose_name=_('Upstream Jobs'),
+        symmetrical=False,
+        related_name='downstream_jobs',
+        blank=True,
+        help_text="This job runs as soon as all of these jobs have succeeded.",
+    )
+
     # Current status of the job
     status = models.CharField(
         verbose_name=_('Status'),
@@ -96,6 +174,13 @@ class ScheduledJob(BaseModel):
         null=True,
     )
 
+    # Lease renewed by the worker while the job is running; expired leases are reaped
+    heartbeat_at = models.DateTimeField(
+        verbose_name=_('Heartbeat At'),
+        blank=True,
+        null=True,
+    )
+
     # When the job is scheduled to run next
     next_run_at = models.DateTimeField(
         verbose_name=_('Next Run At'),
@@ -111,10 +196,21 @@ class ScheduledJob(BaseModel):
         db_index=True  # Often filtered in scheduler logic
     )
 
-    result = models.TextField(
-        verbose_name=_('Result'),
+    # Pointer to the latest stored result; payloads live in `JobResult`
+    last_result = models.ForeignKey(
+        'JobResult',
+        verbose_name=_('Last Result'),
+        on_delete=models.SET_NULL,
+        related_name='+',
+        blank=True,
+        null=True,
+    )
+    result_digest = models.CharField(
+        verbose_name=_('Result Digest'),
+        max_length=64,
         blank=True,
         null=True,
+        help_text="SHA-256 of the serialized latest result.",
     )
     error_message = models.TextField(
         verbose_name=_('Error Message'),
@@ -122,11 +218,36 @@ class ScheduledJob(BaseModel):
         null=True,
     )
 
+    # Definition fields worth auditing; runtime state (status, run times, results) is not
+    history_audited_fields = (
+        'tenant',
+        'name',
+        'description',
+        'task_path',
+        'args',
+        'kwargs',
+        'one_off_run_time',
+        'cron_expression',
+        'end_time',
+        'max_retries',
+        'spread_seconds',
+        'soft_time_limit',
+        'time_limit',
+        'max_memory_mb',
+        'result_cache_ttl',
+        'result_backend',
+        'result_expires',
+        'is_active',
+    )
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['one_off_run_time']),
             models.Index(fields=['cron_expression']),
+            models.Index(fields=['status', 'heartbeat_at']),  # Stale RUNNING lease lookups
+            models.Index(fields=['tenant', 'status', 'next_run_at']),  # Per-tenant quotas and listings
+            models.Index(fields=['created_at', 'id']),  # Admin changelist order, newest first
         ]
         verbose_name = _('Scheduled Job')
         verbose_name_plural = _('Scheduled Jobs')
@@ -138,8 +259,476 @@ class ScheduledJob(BaseModel):
         if self.cron_expression and not croniter.is_valid(self.cron_expression):
             raise ValidationError("Invalid cron expression.")
 
-        if not self.cron_expression and not self.one_off_run_time:
-            raise ValidationError("Either cron_expression or one_off_run_time must be provided.")
+        if not self.cron_expression and not self.one_off_run_time and not (
+                self.pk and self.upstream_jobs.exists()
+        ):
+            raise ValidationError("Either cron_expression, one_off_run_time or upstream_jobs must be provided.")
+
+        if self.soft_time_limit and self.time_limit and self.soft_time_limit >= self.time_limit:
+            raise ValidationError("soft_time_limit must be lower than time_limit.")
+
+        if self.spread_seconds and self.cron_expression:
+            from core.utils.scheduler.spread import min_cron_interval
+
+            if self.spread_seconds >= min_cron_interval(self.cron_expression):
+                raise ValidationError("spread_seconds must be shorter than the shortest interval between cron fires.")
+
+    @property
+    def spread_offset(self) -> int:
+        """
+        Seconds by which cron dispatches of this job are offset.
+        """
+        from core.utils.scheduler.spread import spread_offset
+
+        return spread_offset(self.id, self.spread_seconds, self.cron_expression)
+
+    def __str__(self):
+        return self.name
+
+
+# Per-tenant limits and dispatch weight; tenants without a row are unlimited with weight 1
+class TenantQuota(BaseModel):
+    tenant = models.CharField(
+        verbose_name=_('Tenant'),
+        max_length=64,
+        unique=True,
+    )
+
+    # Share of each dispatch round relative to other tenants (deficit round robin)
+    weight = models.PositiveIntegerField(
+        verbose_name=_('Weight'),
+        default=1,
+        help_text="Relative share of dispatch capacity when several tenants have due jobs.",
+    )
+    max_concurrency = models.PositiveIntegerField(
+        verbose_name=_('Max Concurrency'),
+        blank=True,
+        null=True,
+        help_text="Maximum jobs of this tenant running at once. Empty means unlimited.",
+    )
+    max_runs_per_minute = models.PositiveIntegerField(
+        verbose_name=_('Max Runs Per Minute'),
+        blank=True,
+        null=True,
+        help_text="Maximum job starts of this tenant per minute. Empty means unlimited.",
+    )
+
+    class Meta:
+        ordering = ['tenant']
+        verbose_name = _('Tenant Quota')
+        verbose_name_plural = _('Tenant Quotas')
+
+    def __str__(self):
+        return self.tenant
+
+
+# Where a result payload is kept
+class ResultStorage(models.TextChoices):
+    DATABASE = 'db', _('Database')  # Compressed payload inline in the results table
+    FILE = 'file', _('File Storage')  # Offloaded to the configured storage backend
+
+
+# Serialized and compressed output of a single job execution
+class JobResult(models.Model):
+    job = models.ForeignKey(
+        ScheduledJob,
+        verbose_name=_('Job'),
+        on_delete=models.CASCADE,
+        related_name='results',
+    )
+    digest = models.CharField(
+        verbose_name=_('Digest'),
+        max_length=64,
+    )
+    encoding = models.CharField(
+        verbose_name=_('Encoding'),
+        max_length=16,
+        help_text="Serialization format of the payload (json or repr).",
+    )
+    compression = models.CharField(
+        verbose_name=_('Compression'),
+        max_length=16,
+        help_text="Compression codec applied to the payload (zlib or none).",
+    )
+    size = models.PositiveIntegerField(
+        verbose_name=_('Size'),
+        help_text="Size in bytes of the serialized, uncompressed payload.",
+    )
+    storage = models.CharField(
+        verbose_name=_('Storage'),
+        max_length=10,
+        choices=ResultStorage.choices,
+        default=ResultStorage.DATABASE,
+    )
+
+    # Inline payload for small results
+    payload = models.BinaryField(
+        verbose_name=_('Payload'),
+        blank=True,
+        null=True,
+    )
+
+    # Path inside the storage backend for offloaded results
+    location = models.CharField(
+        verbose_name=_('Location'),
+        max_length=255,
+        blank=True,
+        null=True,
+    )
+    created_at = models.DateTimeField(
+        verbose_name=_('Created At'),
+        auto_now_add=True,
+    )
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['job', '-created_at']),
+        ]
+        verbose_name = _('Job Result')
+        verbose_name_plural = _('Job Results')
+
+    def __str__(self):
+        return f"{self.job_id}:{self.digest[:12]}"
+
+
+# Claim record for a single dispatched execution, keyed by job and scheduled fire
+class JobRun(models.Model):
+    job = models.ForeignKey(
+        ScheduledJob,
+        verbose_name=_('Job'),
+        on_delete=models.CASCADE,
+        related_name='runs',
+    )
+
+    # Unique per dispatch; a redelivered message carries the same key and is dropped
+    run_key = models.CharField(
+        verbose_name=_('Run Key'),
+        max_length=255,
+        unique=True,
+    )
+    status = models.CharField(
+        verbose_name=_('Status'),
+        max_length=20,
+        choices=JobStatus.choices,
+        default=JobStatus.RUNNING,
+    )
+    worker = models.CharField(
+        verbose_name=_('Worker'),
+        max_length=255,
+        blank=True,
+        null=True,
+    )
+    claimed_at = models.DateTimeField(
+        verbose_name=_('Claimed At'),
+        auto_now_add=True,
+        db_index=True,
+    )
+    finished_at = models.DateTimeField(
+        verbose_name=_('Finished At'),
+        blank=True,
+        null=True,
+    )
+
+    # Per-phase timings and query counts of sampled runs (see scheduler.profiling)
+    profile = models.JSONField(
+        verbose_name=_('Profile'),
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        ordering = ['-claimed_at']
+        verbose_name = _('Job Run')
+        verbose_name_plural = _('Job Runs')
+
+    def __str__(self):
+        return self.run_key
+
+
+# Hourly execution rollup of one job (job set) or of every job sharing a task path (job empty)
+class JobStats(models.Model):
+    job = models.ForeignKey(
+        ScheduledJob,
+        verbose_name=_('Job'),
+        on_delete=models.CASCADE,
+        related_name='stats',
+        blank=True,
+        null=True,
+    )
+    task_path = models.CharField(
+        verbose_name=_('Task Path'),
+        max_length=255,
+    )
+
+    # Start of the hour covered by this bucket (UTC)
+    bucket = models.DateTimeField(
+        verbose_name=_('Bucket'),
+    )
+    runs = models.PositiveIntegerField(
+        verbose_name=_('Runs'),
+        default=0,
+    )
+    successes = models.PositiveIntegerField(
+        verbose_name=_('Successes'),
+        default=0,
+    )
+    failures = models.PositiveIntegerField(
+        verbose_name=_('Failures'),
+        default=0,
+    )
+    total_duration_ms = models.BigIntegerField(
+        verbose_name=_('Total Duration (ms)'),
+        default=0,
+    )
+    max_duration_ms = models.BigIntegerField(
+        verbose_name=_('Max Duration (ms)'),
+        default=0,
+    )
+
+    # Run counts per fixed duration bin (see scheduler.stats.DURATION_BINS_MS), for percentiles
+    histogram = models.JSONField(
+        verbose_name=_('Duration Histogram'),
+        default=list,
+    )
+
+    class Meta:
+        ordering = ['-bucket']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['job', 'bucket'],
+                condition=models.Q(job__isnull=False),
+                name='unique_job_stats_bucket',
+            ),
+            models.UniqueConstraint(
+                fields=['task_path', 'bucket'],
+                condition=models.Q(job__isnull=True),
+                name='unique_task_path_stats_bucket',
+            ),
+        ]
+        verbose_name = _('Job Stats')
+        verbose_name_plural = _('Job Stats')
+
+    def __str__(self):
+        return f"{self.job_id or self.task_path}@{self.bucket:%Y-%m-%d %H:00}"
+
+
+# One task path + cron shared by many parameterized instances, expanded into batches at fire time
+class JobTemplate(BaseModel):
+    name = models.CharField(
+        verbose_name=_('Name'),
+        max_length=255,
+        unique=True,
+    )
+    description = models.TextField(
+        verbose_name=_('Description'),
+        blank=True,
+        null=True,
+    )
+    tenant = models.CharField(
+        verbose_name=_('Tenant'),
+        max_length=64,
+        default='default',
+    )
+    task_path = models.CharField(
+        verbose_name=_('Task Path'),
+        max_length=255,
+        help_text="Import path of the callable run once per parameter row.",
+    )
+    cron_expression = models.CharField(
+        verbose_name=_('Cron Expression'),
+        max_length=100,
+        help_text="Standard 5-field cron expression shared by every instance.",
+    )
+
+    # Defaults merged under each parameter row
+    args = models.JSONField(
+        verbose_name=_('*args'),
+        blank=True,
+        null=True,
+        help_text="Positional args used by parameter rows that define none.",
+    )
+    kwargs = models.JSONField(
+        verbose_name=_('**kwargs'),
+        blank=True,
+        null=True,
+        help_text="Keyword args shared by every instance; parameter kwargs override them.",
+    )
+
+    # Parameter rows executed per dispatched message
+    batch_size = models.PositiveIntegerField(
+        verbose_name=_('Batch Size'),
+        default=500,
+        help_text="Number of instances executed by one worker message.",
+    )
+    is_active = models.BooleanField(
+        verbose_name=_('Is Active'),
+        default=True,
+        db_index=True,
+    )
+    last_run_at = models.DateTimeField(
+        verbose_name=_('Last Run At'),
+        blank=True,
+        null=True,
+    )
+
+    # Instance and batch counts of the latest expansion
+    last_expansion = models.JSONField(
+        verbose_name=_('Last Expansion'),
+        blank=True,
+        null=True,
+    )
+
+    history_audited_fields = (
+        'name',
+        'description',
+        'tenant',
+        'task_path',
+        'cron_expression',
+        'args',
+        'kwargs',
+        'batch_size',
+        'is_active',
+    )
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = _('Job Template')
+        verbose_name_plural = _('Job Templates')
+
+    def clean(self):
+        if not croniter.is_valid(self.cron_expression):
+            raise ValidationError("Invalid cron expression.")
+        if len(self.cron_expression.split()) != 5:
+            raise ValidationError("Cron expression must have exactly 5 fields.")
 
     def __str__(self):
         return self.name
+
+
+# Per-instance arguments of a template; deliberately small and without history
+class JobTemplateParameter(models.Model):
+    template = models.ForeignKey(
+        JobTemplate,
+        verbose_name=_('Template'),
+        on_delete=models.CASCADE,
+        related_name='parameters',
+    )
+
+    # Caller-chosen identity of the instance (e.g. a customer id), unique per template
+    key = models.CharField(
+        verbose_name=_('Key'),
+        max_length=255,
+    )
+    args = models.JSONField(
+        verbose_name=_('*args'),
+        blank=True,
+        null=True,
+        help_text="Positional args of this instance; empty uses the template's.",
+    )
+    kwargs = models.JSONField(
+        verbose_name=_('**kwargs'),
+        blank=True,
+        null=True,
+        help_text="Keyword args of this instance, merged over the template's.",
+    )
+    is_active = models.BooleanField(
+        verbose_name=_('Is Active'),
+        default=True,
+    )
+
+    class Meta:
+        ordering = ['template', 'id']
+        constraints = [
+            models.UniqueConstraint(fields=['template', 'key'], name='unique_template_parameter_key'),
+        ]
+        indexes = [
+            models.Index(fields=['template', 'is_active', 'id']),  # Keyset batches at expansion time
+        ]
+        verbose_name = _('Job Template Parameter')
+        verbose_name_plural = _('Job Template Parameters')
+
+    def __str__(self):
+        return f"{self.template_id}:{self.key}"
+
+
+# Cold copy of a finished one-off job, moved out of the live table by `archive_jobs`
+class ArchivedJob(models.Model):
+    # Primary key the job had in ScheduledJob
+    original_id = models.BigIntegerField(
+        verbose_name=_('Original ID'),
+        unique=True,
+    )
+    name = models.CharField(
+        verbose_name=_('Name'),
+        max_length=255,
+    )
+    tenant = models.CharField(
+        verbose_name=_('Tenant'),
+        max_length=64,
+    )
+    task_path = models.CharField(
+        verbose_name=_('Task Path'),
+        max_length=255,
+    )
+    args = models.JSONField(
+        verbose_name=_('*args'),
+        blank=True,
+        null=True,
+    )
+    kwargs = models.JSONField(
+        verbose_name=_('**kwargs'),
+        blank=True,
+        null=True,
+    )
+    one_off_run_time = models.DateTimeField(
+        verbose_name=_('One-off Run Time'),
+    )
+    status = models.CharField(
+        verbose_name=_('Status'),
+        max_length=20,
+        choices=JobStatus.choices,
+    )
+    last_run_at = models.DateTimeField(
+        verbose_name=_('Last Run At'),
+        blank=True,
+        null=True,
+    )
+    error_message = models.TextField(
+        verbose_name=_('Error Message'),
+        blank=True,
+        null=True,
+    )
+
+    # Latest stored result, copied from JobResult so it stays readable (see scheduler.results)
+    result = models.JSONField(
+        verbose_name=_('Result Reference'),
+        blank=True,
+        null=True,
+        help_text="Digest, encoding, compression, size, storage and location of the latest result.",
+    )
+    result_payload = models.BinaryField(
+        verbose_name=_('Result Payload'),
+        blank=True,
+        null=True,
+    )
+    created_at = models.DateTimeField(
+        verbose_name=_('Created At'),
+        help_text="When the job was originally created.",
+    )
+    archived_at = models.DateTimeField(
+        verbose_name=_('Archived At'),
+        auto_now_add=True,
+    )
+
+    class Meta:
+        ordering = ['-one_off_run_time']
+        indexes = [
+            models.Index(fields=['tenant', '-one_off_run_time']),
+            models.Index(fields=['task_path', '-one_off_run_time']),
+        ]
+        verbose_name = _('Archived Job')
+        verbose_name_plural = _('Archived Jobs')
+
+    def __str__(self):
+        return f"{self.original_id}:{self.name}"
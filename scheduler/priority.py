@@ -0,0 +1,108 @@
+import json
+import logging
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from croniter import croniter
+from django.conf import settings
+from django.utils import timezone
+
+from scheduler.models import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlinePriority:
+    """
+    Earliest-deadline-first ordering of `run_scheduled_job` messages through broker priorities.
+
+    A run's deadline is the job's `end_time` or, for cron jobs, the dispatch of their next fire
+    (next fire time plus the job's spread offset), whichever comes first. Messages are sent with
+    that deadline as their expiry, so a cron run still queued when the next one is dispatched
+    is dropped by the worker instead of running twice back to back. Its slack, the time left
+    between the run becoming due and its deadline, is mapped onto the
+    `SCHEDULER_DEADLINE_PRIORITY_BANDS`: level 0 for the tightest band, one level per band
+    after that, and the lowest level for runs with ample slack or no deadline at all. With
+    the Redis transport lower levels are consumed first, so under backlog the runs closest
+    to expiry go ahead of far-from-deadline work.
+
+    Beat-fired runs get their options per fire from `IncrementalDatabaseScheduler` (see
+    `periodic_task_options`), since a `PeriodicTask` row only holds static options.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        return settings.SCHEDULER_DEADLINE_PRIORITY
+
+    @property
+    def bands(self) -> list:
+        return settings.SCHEDULER_DEADLINE_PRIORITY_BANDS
+
+    @property
+    def lowest(self) -> int:
+        return len(self.bands)
+
+    @staticmethod
+    def _deadline(end_time, cron_expression, spread: int, fire_time: datetime):
+        deadlines = [end_time] if end_time else []
+        if cron_expression:
+            try:
+                next_fire = croniter(cron_expression, fire_time).get_next(datetime)
+            except (ValueError, KeyError):
+                pass
+            else:
+                deadlines.append(next_fire + timedelta(seconds=spread))
+        return min(deadlines) if deadlines else None
+
+    def deadline(self, job: ScheduledJob, fire_time: datetime):
+        return self._deadline(job.end_time, job.cron_expression, job.spread_offset, fire_time)
+
+    def _priority(self, deadline, due: datetime) -> int:
+        if deadline is None:
+            return self.lowest
+        return bisect_left(self.bands, (deadline - due).total_seconds())
+
+    def _options(self, deadline, due: datetime) -> dict:
+        options = {'priority': self._priority(deadline, due)}
+        if deadline is not None:
+            options['expires'] = deadline
+        return options
+
+    def priority(self, job: ScheduledJob, fire_time=None, now=None):
+        """
+        Broker priority of a run of `job` due at `fire_time` (default now), or None when disabled.
+        """
+        if not self.enabled:
+            return None
+        now = now or timezone.now()
+        return self._priority(self.deadline(job, fire_time or now), max(fire_time or now, now))
+
+    def options(self, job: ScheduledJob, fire_time=None, now=None) -> dict:
+        """
+        `apply_async` options (priority and expiry) for a run of `job` due at `fire_time`.
+        """
+        if not self.enabled:
+            return {'expires': job.end_time} if job.end_time else {}
+        now = now or timezone.now()
+        return self._options(self.deadline(job, fire_time or now), max(fire_time or now, now))
+
+    def periodic_task_options(self, task, now=None) -> dict:
+        """
+        Options for a beat fire of the cron job behind `task` (a `PeriodicTask`), computed at
+        send time from its crontab, its `expires` (the job's end_time) and its spread kwarg,
+        without loading the job.
+        """
+        if not self.enabled or task.crontab is None:
+            return {}
+        now = now or timezone.now()
+        crontab = task.crontab
+        expression = " ".join(
+            (crontab.minute, crontab.hour, crontab.day_of_month, crontab.month_of_year, crontab.day_of_week)
+        )
+        spread = json.loads(task.kwargs or '{}').get('spread', 0)
+        # The worker defers the run by its spread, so that is when it becomes due
+        return self._options(self._deadline(task.expires, expression, spread, now), now + timedelta(seconds=spread))
+
+
+# Singleton instance used across the application
+deadline_priority = DeadlinePriority()
@@ -0,0 +1,132 @@
+import io
+import logging
+import random
+import time
+from contextlib import contextmanager, nullcontext
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# Phases of run_scheduled_job, in execution order
+PHASES = ('load', 'mark-running', 'resolve', 'execute', 'persist')
+
+# Entries kept from cProfile / tracemalloc captures
+PROFILE_TOP_N = 25
+
+
+class RunProfiler:
+    """
+    Sampled instrumentation of one `run_scheduled_job` execution.
+
+    Records wall time and database queries per phase. When enabled in settings,
+    the `execute` phase also runs under cProfile and/or tracemalloc, and those
+    captures are kept only for runs slower than `SCHEDULER_PROFILE_SLOW_MS`.
+    A profiler that was not sampled costs one attribute check per phase.
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.phases = {}
+        self.started = time.perf_counter()
+        self._current = None
+        self._profile = None
+        self._tracing = False
+        self._captures = {}
+
+    @classmethod
+    def sample(cls):
+        """
+        Return a profiler enabled for `SCHEDULER_PROFILE_SAMPLE_RATE` of the runs.
+        """
+        rate = settings.SCHEDULER_PROFILE_SAMPLE_RATE
+        return cls(enabled=rate > 0 and random.random() < rate)
+
+    def phase(self, name: str):
+        """
+        Context manager timing `name` and counting the queries it issues.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._phase(name)
+
+    @contextmanager
+    def _phase(self, name):
+        previous, self._current = self._current, name
+        stats = self.phases.setdefault(name, {'ms': 0.0, 'queries': 0})
+        capture = name == 'execute'
+        if capture:
+            self._start_captures()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(self._count_query):
+                yield
+        finally:
+            stats['ms'] += (time.perf_counter() - started) * 1000
+            if capture:
+                self._stop_captures()
+            self._current = previous
+
+    def _count_query(self, execute, sql, params, many, context):
+        self.phases[self._current]['queries'] += 1
+        return execute(sql, params, many, context)
+
+    def _start_captures(self):
+        # Capture modules are imported on first use to keep them off the worker import path
+        if settings.SCHEDULER_PROFILE_CPROFILE:
+            import cProfile
+
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError as e:
+                # Another profiler is active in this thread
+                logger.debug(f"[Profiler] cProfile unavailable: {e}")
+                self._profile = None
+        if settings.SCHEDULER_PROFILE_TRACEMALLOC:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+
+    def _stop_captures(self):
+        if self._profile is not None:
+            import pstats
+
+            self._profile.disable()
+            output = io.StringIO()
+            pstats.Stats(self._profile, stream=output).sort_stats('cumulative').print_stats(PROFILE_TOP_N)
+            self._captures['cprofile'] = output.getvalue()
+            self._profile = None
+        if self._tracing:
+            import tracemalloc
+
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self._tracing = False
+            self._captures['tracemalloc'] = {
+                'peak_kb': round(peak / 1024, 1),
+                'top': [str(stat) for stat in snapshot.statistics('lineno')[:PROFILE_TOP_N]],
+            }
+
+    def report(self):
+        """
+        Phase breakdown of the run (plus captures if it was slow), or None when not sampled.
+        """
+        if not self.enabled:
+            return None
+
+        total_ms = (time.perf_counter() - self.started) * 1000
+        report = {
+            'total_ms': round(total_ms, 2),
+            'phases': {
+                name: {'ms': round(self.phases[name]['ms'], 2), 'queries': self.phases[name]['queries']}
+                for name in PHASES if name in self.phases
+            },
+        }
+        if total_ms >= settings.SCHEDULER_PROFILE_SLOW_MS:
+            report.update(self._captures)
+        return report
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import logging
+import zlib
+
+from celery import states
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.core.serializers.json import DjangoJSONEncoder
+
+from scheduler.models import JobResult, ResultBackendMode, ResultStorage, ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+
+class ResultStore:
+    """
+    Persists job results outside the hot `ScheduledJob` row.
+
+    Results are serialized to JSON (falling back to `repr` for unsupported types),
+    zlib-compressed when worthwhile, and stored inline in `JobResult` or offloaded to
+    the configured storage backend once they exceed the offload threshold.
+    """
+
+    @property
+    def compress_min_size(self):
+        return getattr(settings, 'SCHEDULER_RESULT_COMPRESS_MIN_SIZE', 256)
+
+    @property
+    def offload_threshold(self):
+        return getattr(settings, 'SCHEDULER_RESULT_OFFLOAD_THRESHOLD', 64 * 1024)
+
+    @property
+    def storage(self):
+        return storages[getattr(settings, 'SCHEDULER_RESULT_STORAGE', 'default')]
+
+    def save(self, job: ScheduledJob, value) -> JobResult:
+        """
+        Serialize, compress and store `value` as the latest result of `job`.
+        """
+        data, encoding = self._serialize(value)
+        digest = hashlib.sha256(data).hexdigest()
+        size = len(data)
+
+        compression = 'none'
+        if size >= self.compress_min_size:
+            data, compression = zlib.compress(data), 'zlib'
+
+        job_result = JobResult(
+            job=job,
+            digest=digest,
+            encoding=encoding,
+            compression=compression,
+            size=size,
+        )
+
+        if len(data) > self.offload_threshold:
+            location = f"scheduler/results/{job.id}/{digest}.bin"
+            job_result.location = self.storage.save(location, ContentFile(data))
+            job_result.storage = ResultStorage.FILE
+            logger.debug(f"[ResultStore] Offloaded result of job {job.id} to {job_result.location}.")
+        else:
+            job_result.payload = data
+
+        job_result.save()
+        return job_result
+
+    def load(self, job_result: JobResult):
+        """
+        Read back and decode a stored result.
+        """
+        if job_result.storage == ResultStorage.FILE:
+            with self.storage.open(job_result.location, 'rb') as fh:
+                data = fh.read()
+        else:
+            data = bytes(job_result.payload or b'')
+
+        if job_result.compression == 'zlib':
+            data = zlib.decompress(data)
+        return json.loads(data)
+
+    def delete(self, job_result: JobResult):
+        """
+        Remove a stored result, including any offloaded payload.
+        """
+        if job_result.storage == ResultStorage.FILE and job_result.location:
+            self.storage.delete(job_result.location)
+        job_result.delete()
+
+    def discard(self, result_id: int):
+        """
+        Delete a superseded result, if it still exists. Never raises into the caller.
+        """
+        try:
+            job_result = JobResult.objects.filter(pk=result_id).only('id', 'storage', 'location').first()
+            if job_result is not None:
+                self.delete(job_result)
+        except Exception as e:
+            logger.warning(f"[ResultStore] Failed to delete superseded result {result_id}: {e}")
+
+    def delete_files(self, locations):
+        """
+        Delete offloaded payloads whose rows are gone. Never raises into the caller.
+        """
+        for location in locations:
+            try:
+                self.storage.delete(location)
+            except Exception as e:
+                logger.warning(f"[ResultStore] Failed to delete offloaded result {location}: {e}")
+
+    @staticmethod
+    def _serialize(value):
+        try:
+            return json.dumps(value, cls=DjangoJSONEncoder, separators=(',', ':')).encode(), 'json'
+        except (TypeError, ValueError):
+            return json.dumps(repr(value)).encode(), 'repr'
+
+
+# Singleton instance used across the application
+result_store = ResultStore()
+
+
+class BackendResultWriter:
+    """
+    Writes run results to the Celery result backend according to each job's `result_backend`.
+
+    `run_scheduled_job` ignores its return value, as the database already keeps the result,
+    so by default nothing reaches the backend. Jobs whose callers read results through
+    Celery opt into the full value or a small digest reference to the stored `JobResult`,
+    kept for `result_expires` seconds (`CELERY_RESULT_EXPIRES` when empty).
+    """
+
+    @staticmethod
+    def value(job: ScheduledJob, result):
+        if job.result_backend == ResultBackendMode.DIGEST:
+            return {'job_id': job.id, 'result_id': job.last_result_id, 'digest': job.result_digest}
+        return result
+
+    def write(self, backend, task_id: str, job: ScheduledJob, result):
+        """
+        Store the run's entry under `task_id` if the job asks for one. Never raises into the caller.
+        """
+        if job.result_backend == ResultBackendMode.NONE or not task_id:
+            return
+        try:
+            backend.store_result(task_id, self.value(job, result), states.SUCCESS)
+            if job.result_expires:
+                backend.expire(backend.get_key_for_task(task_id), job.result_expires)
+        except Exception as e:
+            logger.warning(f"[ResultStore] Failed to write the result of job {job.id} to the result backend: {e}")
+
+
+# Singleton instance used across the application
+backend_results = BackendResultWriter()
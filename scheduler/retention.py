@@ -0,0 +1,66 @@
+import logging
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from scheduler.models import JobResult, JobRun, JobStats, JobStatus, ResultStorage, ScheduledJob
+from scheduler.results import result_store
+
+logger = logging.getLogger(__name__)
+
+
+class JobDataPruner:
+    """
+    Deletes the per-run rows that accumulate for live jobs: finished `JobRun` claims,
+    hourly `JobStats` buckets and `JobResult` rows no job points to any more (each job's
+    latest result is always kept, along with its offloaded payload).
+
+    Rows are deleted in primary-key batches, each in its own short transaction.
+    """
+
+    @staticmethod
+    def runs(cutoff):
+        return JobRun.objects.filter(claimed_at__lt=cutoff).exclude(status=JobStatus.RUNNING)
+
+    @staticmethod
+    def stats(cutoff):
+        return JobStats.objects.filter(bucket__lt=cutoff)
+
+    @staticmethod
+    def results(cutoff):
+        return JobResult.objects.filter(created_at__lt=cutoff).filter(
+            ~Exists(ScheduledJob.objects.filter(last_result=OuterRef('pk')))
+        )
+
+    def prune(self, queryset, batch_size: int) -> int:
+        """
+        Delete every row of `queryset`, one batch at a time. Returns the number deleted.
+        """
+        deleted_total = 0
+        while True:
+            deleted = self.prune_batch(queryset, batch_size)
+            if not deleted:
+                break
+            deleted_total += deleted
+            logger.info(f"[Retention] Deleted {deleted} {queryset.model._meta.verbose_name_plural}.")
+        return deleted_total
+
+    @staticmethod
+    def prune_batch(queryset, batch_size: int) -> int:
+        with transaction.atomic():
+            batch = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if not batch:
+                return 0
+
+            rows = queryset.model.objects.filter(pk__in=batch)
+            if queryset.model is JobResult:
+                locations = list(rows.filter(storage=ResultStorage.FILE).values_list('location', flat=True))
+                if locations:
+                    transaction.on_commit(lambda: result_store.delete_files(locations))
+            rows.delete()
+
+        return len(batch)
+
+
+# Singleton instance used across the application
+job_data_pruner = JobDataPruner()
@@ -1,6 +1,13 @@
+from datetime import timedelta
+
+from croniter import croniter
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
 
-from scheduler.models import ScheduledJob
+from core.utils.scheduler.spread import min_cron_interval
+from scheduler.dag import DependencyCycleError, dependency_graph
+from scheduler.models import ArchivedJob, JobStatus, JobTemplate, JobTemplateParameter, ScheduledJob
 
 
 class ScheduledJobSerializer(serializers.ModelSerializer):
@@ -12,7 +19,8 @@ class ScheduledJobSerializer(serializers.ModelSerializer):
             'status',
             'last_run_at',
             'next_run_at',
-            'result',
+            'last_result',
+            'result_digest',
             'error_message',
             'created_at',
             'updated_at',
@@ -24,10 +32,170 @@ class ScheduledJobSerializer(serializers.ModelSerializer):
         """
         one_off = data.get('one_off_run_time')
         cron = data.get('cron_expression')
+        upstream_jobs = data.get('upstream_jobs')
 
-        if not one_off and not cron:
-            raise serializers.ValidationError("You must provide either 'one_off_run_time' or 'cron_expression'.")
+        if not one_off and not cron and not upstream_jobs:
+            raise serializers.ValidationError(
+                "You must provide either 'one_off_run_time', 'cron_expression' or 'upstream_jobs'."
+            )
         if one_off and cron:
             raise serializers.ValidationError("You cannot provide both 'one_off_run_time' and 'cron_expression'.")
 
+        soft_time_limit = data.get('soft_time_limit')
+        time_limit = data.get('time_limit')
+        if soft_time_limit and time_limit and soft_time_limit >= time_limit:
+            raise serializers.ValidationError("'soft_time_limit' must be lower than 'time_limit'.")
+
+        spread_seconds = data.get('spread_seconds', getattr(self.instance, 'spread_seconds', None))
+        cron = data.get('cron_expression', getattr(self.instance, 'cron_expression', None))
+        if spread_seconds and cron and croniter.is_valid(cron) and spread_seconds >= min_cron_interval(cron):
+            raise serializers.ValidationError(
+                {'spread_seconds': "Must be shorter than the shortest interval between the cron expression's fires."}
+            )
+
+        if upstream_jobs and self.instance:
+            try:
+                dependency_graph.ensure_acyclic(self.instance.id, [job.id for job in upstream_jobs])
+            except DependencyCycleError as e:
+                raise serializers.ValidationError({'upstream_jobs': str(e)})
+
+        return data
+
+
+class JobSelectionSerializer(serializers.Serializer):
+    """
+    Selects the jobs targeted by a bulk action, by explicit ids and/or filters.
+    """
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False)
+    tenant = serializers.CharField(required=False)
+    task_path = serializers.CharField(required=False)
+    cron_expression = serializers.CharField(required=False)
+    status = serializers.ChoiceField(choices=JobStatus.choices, required=False)
+
+    def validate(self, data):
+        """
+        Require at least one selector so a bulk action never targets every job by accident.
+        """
+        if not data:
+            raise serializers.ValidationError("Provide 'ids' or at least one filter.")
+        return data
+
+    def filter(self, queryset):
+        """
+        Narrow `queryset` down to the selected jobs.
+        """
+        selection = dict(self.validated_data)
+        ids = selection.pop('ids', None)
+        if ids:
+            queryset = queryset.filter(id__in=ids)
+        return queryset.filter(**selection)
+
+
+class UpcomingQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the upcoming fire times endpoint.
+    """
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    histogram = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, data):
+        """
+        Default to the next hour and bound the window so expansion stays cheap.
+        """
+        start = data.get('start') or timezone.now()
+        end = data.get('end') or start + timedelta(hours=1)
+        max_window = timedelta(hours=settings.SCHEDULER_UPCOMING_MAX_WINDOW_HOURS)
+
+        if end <= start:
+            raise serializers.ValidationError("'end' must be after 'start'.")
+        if end - start > max_window:
+            raise serializers.ValidationError(f"The window cannot exceed {max_window}.")
+
+        data['start'], data['end'] = start, end
         return data
+
+
+class StatusEventsQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the status event stream: comma-separated job ids and statuses, and a tenant.
+    """
+    job_ids = serializers.CharField(required=False)
+    status = serializers.CharField(required=False)
+    tenant = serializers.CharField(required=False)
+
+    def validate_job_ids(self, value):
+        try:
+            return [int(job_id) for job_id in value.split(',') if job_id.strip()]
+        except ValueError:
+            raise serializers.ValidationError("Must be a comma-separated list of job ids.")
+
+    def validate_status(self, value):
+        statuses = [status.strip() for status in value.split(',') if status.strip()]
+        unknown = set(statuses) - set(JobStatus.values)
+        if unknown:
+            raise serializers.ValidationError(f"Unknown status(es): {', '.join(sorted(unknown))}.")
+        return statuses
+
+
+class StatsQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the execution stats endpoints.
+    """
+    hours = serializers.IntegerField(required=False, min_value=1)
+    task_path = serializers.CharField(required=False)
+
+    def validate_hours(self, value):
+        if value > settings.SCHEDULER_STATS_MAX_HOURS:
+            raise serializers.ValidationError(f"Cannot exceed {settings.SCHEDULER_STATS_MAX_HOURS} hours.")
+        return value
+
+
+class JobTemplateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = JobTemplate
+        fields = '__all__'
+        read_only_fields = ['id', 'last_run_at', 'last_expansion', 'created_at', 'updated_at']
+
+    def validate_cron_expression(self, value):
+        if not croniter.is_valid(value):
+            raise serializers.ValidationError("Invalid cron expression.")
+        if len(value.split()) != 5:
+            raise serializers.ValidationError("Cron expression must have exactly 5 fields.")
+        return value
+
+    def validate_batch_size(self, value):
+        if value < 1:
+            raise serializers.ValidationError("Must be at least 1.")
+        return value
+
+
+class JobTemplateParameterSerializer(serializers.ModelSerializer):
+    """
+    One instance of a template, identified by its `key`.
+    """
+
+    class Meta:
+        model = JobTemplateParameter
+        fields = ['key', 'args', 'kwargs', 'is_active']
+        extra_kwargs = {'key': {'validators': []}}  # Upserted by key
+
+
+class TemplateParametersSerializer(serializers.Serializer):
+    """
+    Body of the bulk parameter upsert endpoint.
+    """
+    parameters = JobTemplateParameterSerializer(many=True, allow_empty=False)
+    delete = serializers.ListField(child=serializers.CharField(), required=False)
+
+
+class ArchivedJobSerializer(serializers.ModelSerializer):
+    # Digest of the latest result; the payload is served by the `result` action
+    result_digest = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArchivedJob
+        exclude = ['result', 'result_payload']
+
+    def get_result_digest(self, obj):
+        return (obj.result or {}).get('digest')
@@ -1,10 +1,18 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
+from celery import group
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 from croniter import croniter
 
-from scheduler.models import ScheduledJob, JobStatus
+from scheduler.claims import run_claims
+from scheduler.dag import dependency_graph
+from scheduler.events import job_events
+from scheduler.models import ScheduledJob, JobStatus, JobRun
+from scheduler.results import result_store
 
 logger = logging.getLogger(__name__)
 
@@ -23,20 +31,23 @@ class JobService:
         - One-off jobs must have a future `one_off_run_time`
         - Cron jobs must have a valid `cron_expression`
 
-        Existing job instances are unscheduled before re-adding them.
+        Cron entries are updated in place; other jobs are unscheduled before re-adding them.
+        Inactive jobs are only unscheduled, so a later activation never
+        re-enables an outdated engine entry.
         """
         from core.utils.scheduler import engine as scheduler_engine
 
         if not job.is_active:
+            self.unschedule_job(job)
             logger.info(f"[JobService] Job {job.id} is inactive. Skipping scheduling.")
             return
 
-        self.unschedule_job(job)
-
         if job.one_off_run_time and job.one_off_run_time > timezone.now():
+            self.unschedule_job(job)  # drop a cron entry left by a previous definition
             scheduler_engine.schedule_one_off(job)
             logger.info(f"[JobService] Scheduled one-off job {job.id} at {job.one_off_run_time}.")
         elif job.cron_expression:
+            # Engines update cron entries in place; no unschedule, so beat is not forced to reload
             scheduler_engine.schedule_cron(job)
             logger.info(f"[JobService] Scheduled cron job {job.id} with expression '{job.cron_expression}'.")
 
@@ -44,11 +55,14 @@ class JobService:
             try:
                 base_time = timezone.now()
                 next_run = croniter(job.cron_expression, base_time).get_next(datetime)
+                next_run += timedelta(seconds=job.spread_offset)  # actual dispatch time
                 job.next_run_at = next_run
                 job.save(update_fields=['next_run_at', 'updated_at'])
                 logger.debug(f"[JobService] Updated next_run_at for job {job.id} to {next_run}.")
             except Exception as e:
                 logger.error(f"[JobService] Failed to calculate next_run_at for job {job.id}: {e}")
+        else:
+            self.unschedule_job(job)
 
     def unschedule_job(self, job: ScheduledJob):
         """
@@ -59,25 +73,147 @@ class JobService:
         scheduler_engine.remove_job(job.id)
         logger.info(f"[JobService] Unscheduling job {job.id} from scheduler.")
 
-    def handle_job_success(self, job: ScheduledJob):
+    def set_active(self, queryset, active: bool) -> list:
+        """
+        Activate or deactivate every job in `queryset` whose state differs, in bulk.
+
+        The flag is flipped with one UPDATE (deactivation also clears `next_run_at`),
+        history rows are written with one batched INSERT, and engine entries are
+        enabled or disabled in place. Activated jobs the engine has no entry for
+        (one-offs, jobs edited while inactive) are rescheduled individually.
+        Returns the ids of the jobs that changed.
+        """
+        from core.utils.scheduler import engine as scheduler_engine
+
+        now = timezone.now()
+        with transaction.atomic():
+            jobs = list(
+                queryset.exclude(is_active=active).select_for_update().order_by()
+                .only(*ScheduledJob.history_audited_fields, 'created_at', 'updated_at')
+            )
+            if not jobs:
+                return []
+            job_ids = [job.id for job in jobs]
+
+            changes = {'is_active': active, 'updated_at': now}
+            if not active:
+                changes['next_run_at'] = None
+            ScheduledJob.objects.filter(id__in=job_ids).update(**changes)
+
+            for job in jobs:
+                job.is_active, job.updated_at = active, now
+            ScheduledJob.history.bulk_history_create(jobs, update=True, batch_size=1000)
+
+        handled = scheduler_engine.set_enabled(job_ids, active)
+
+        if active:
+            cron_jobs = [job for job in jobs if job.cron_expression and job.id in handled]
+            for job in cron_jobs:
+                try:
+                    next_run = croniter(job.cron_expression, now).get_next(datetime)
+                    job.next_run_at = next_run + timedelta(seconds=job.spread_offset)
+                except Exception as e:
+                    logger.error(f"[JobService] Failed to calculate next_run_at for job {job.id}: {e}")
+            ScheduledJob.objects.bulk_update(cron_jobs, ['next_run_at'], batch_size=1000)
+
+            for job in ScheduledJob.objects.filter(id__in=set(job_ids) - handled).iterator():
+                self.refresh_job(job)
+
+        logger.info(f"[JobService] {'Activated' if active else 'Deactivated'} {len(job_ids)} job(s).")
+        return job_ids
+
+    def handle_job_success(self, job: ScheduledJob, result=None):
         """
         Callback to be called after a job has successfully run.
-        Updates run time and status.
+        Updates run time, status and the pointer to the stored result; the result it replaces is deleted.
         """
+        previous_result_id = job.last_result_id
         job.last_run_at = timezone.now()
         job.status = JobStatus.SUCCESS
-        job.save(update_fields=['last_run_at', 'status', 'updated_at'])
+        job.last_result = result_store.save(job, result) if result is not None else None
+        job.result_digest = job.last_result.digest if job.last_result else None
+        job.save(update_fields=['last_run_at', 'status', 'last_result', 'result_digest', 'updated_at'])
+        if previous_result_id:
+            transaction.on_commit(lambda: result_store.discard(previous_result_id))
+        job_events.publish(job)
         logger.info(f"[JobService] Job {job.id} executed successfully.")
 
-    def handle_job_failure(self, job: ScheduledJob):
+    def handle_job_failure(self, job: ScheduledJob, error_message=None):
         """
         Callback to be called if a job execution fails.
-        Updates job status accordingly.
+        Updates job status and the recorded error accordingly.
         """
         job.status = JobStatus.FAILED
-        job.save(update_fields=['status', 'updated_at'])
+        job.error_message = str(error_message)[:2048] if error_message else None  # truncate if large
+        job.save(update_fields=['status', 'error_message', 'updated_at'])
+        job_events.publish(job)
         logger.warning(f"[JobService] Job {job.id} execution failed.")
 
+    def trigger_downstream(self, job: ScheduledJob):
+        """
+        Dispatch, as one Celery group, every downstream job that became ready
+        now that `job` has succeeded.
+        """
+        from scheduler.tasks import run_scheduled_job
+
+        ready = dependency_graph.ready_downstream(job)
+        if not ready:
+            return
+
+        group(
+            run_scheduled_job.s(downstream_id, run_key=run_claims.dependency_run_key(downstream_id, finished_at))
+            for downstream_id, finished_at in ready
+        ).apply_async()
+        logger.info(f"[JobService] Job {job.id} triggered downstream job(s) {[job_id for job_id, _ in ready]}.")
+
+    def reap_stale_jobs(self, lease_seconds=None, requeue=None) -> list:
+        """
+        Transition RUNNING jobs whose heartbeat lease expired (their worker died) to FAILED,
+        or requeue them, in bulk. Returns the ids of the reaped jobs.
+        """
+        from scheduler.tasks import run_scheduled_job
+
+        lease_seconds = lease_seconds or settings.SCHEDULER_HEARTBEAT_LEASE
+        requeue = settings.SCHEDULER_REAPER_REQUEUE if requeue is None else requeue
+        now = timezone.now()
+        cutoff = now - timedelta(seconds=lease_seconds)
+
+        with transaction.atomic():
+            stale = dict(
+                ScheduledJob.objects.select_for_update(skip_locked=True)
+                .filter(status=JobStatus.RUNNING)
+                .filter(Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, last_run_at__lt=cutoff))
+                .values_list('id', 'tenant')
+            )
+            stale_ids = list(stale)
+            if not stale_ids:
+                return []
+
+            ScheduledJob.objects.filter(id__in=stale_ids).update(
+                status=JobStatus.PENDING if requeue else JobStatus.FAILED,
+                error_message="Worker lost: heartbeat lease expired.",
+                heartbeat_at=None,
+                updated_at=now,
+            )
+            JobRun.objects.filter(job_id__in=stale_ids, status=JobStatus.RUNNING).update(
+                status=JobStatus.FAILED,
+                finished_at=now,
+            )
+
+        for tenant in set(stale.values()):
+            job_events.publish_many(
+                [job_id for job_id in stale_ids if stale[job_id] == tenant],
+                JobStatus.PENDING if requeue else JobStatus.FAILED,
+                tenant=tenant,
+            )
+        if requeue:
+            group(run_scheduled_job.s(job_id) for job_id in stale_ids).apply_async()
+
+        logger.warning(
+            f"[JobService] Reaped {len(stale_ids)} stale job(s) ({'requeued' if requeue else 'failed'}): {stale_ids}"
+        )
+        return stale_ids
+
     def update_next_run_time(self, job: ScheduledJob, next_time: datetime):
         """
         Update the next scheduled run time for the job.
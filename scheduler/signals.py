@@ -0,0 +1,66 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from scheduler.dag import DependencyCycleError, dependency_graph
+from scheduler.models import JobResult, JobTemplate, ResultStorage, ScheduledJob
+from scheduler.results import result_store
+
+
+@receiver(m2m_changed, sender=ScheduledJob.upstream_jobs.through)
+def validate_job_dependencies(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Reject dependency edges that would create a cycle and refresh the cached DAG indexes.
+    """
+    if action == 'pre_add':
+        try:
+            if reverse:
+                # `instance` becomes upstream of every job in `pk_set`
+                for downstream_id in pk_set:
+                    dependency_graph.ensure_acyclic(downstream_id, [instance.pk])
+            else:
+                dependency_graph.ensure_acyclic(instance.pk, pk_set)
+        except DependencyCycleError as e:
+            raise ValidationError(str(e))
+
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        dependency_graph.invalidate()
+
+
+@receiver(pre_delete, sender=ScheduledJob)
+def delete_offloaded_results(sender, instance, **kwargs):
+    """
+    The cascade removes the job's result rows but not their offloaded payloads;
+    delete those files once the deletion commits.
+    """
+    locations = list(
+        JobResult.objects.filter(job=instance, storage=ResultStorage.FILE).values_list('location', flat=True)
+    )
+    if locations:
+        transaction.on_commit(lambda: result_store.delete_files(locations))
+
+
+@receiver(post_delete, sender=ScheduledJob)
+def invalidate_job_dependencies(sender, instance, **kwargs):
+    """
+    Deleting a job removes its edges, so drop the cached DAG indexes.
+    """
+    dependency_graph.invalidate()
+
+
+@receiver(post_save, sender=JobTemplate)
+def schedule_job_template(sender, instance, **kwargs):
+    """
+    Keep the template's single periodic task in sync with its cron and active flag.
+    """
+    from scheduler.templates import template_dispatcher
+
+    template_dispatcher.schedule(instance)
+
+
+@receiver(post_delete, sender=JobTemplate)
+def unschedule_job_template(sender, instance, **kwargs):
+    from scheduler.templates import template_dispatcher
+
+    template_dispatcher.unschedule(instance.id)
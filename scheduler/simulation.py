@@ -0,0 +1,222 @@
+import heapq
+import logging
+import time
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Sum
+
+from core.utils.scheduler.spread import spread_offset
+from scheduler.models import JobStats, ScheduledJob
+from scheduler.tenants import DEFAULT_TENANT, tenant_quotas
+from scheduler.upcoming import FireTimeExpander
+
+logger = logging.getLogger(__name__)
+
+# Busiest seconds listed in a report
+TOP_SECONDS = 10
+
+
+class FakeBroker:
+    """
+    Stands in for the Celery broker during a simulation: counts messages per second.
+    """
+
+    def __init__(self):
+        self.per_second = Counter()
+        self.messages = 0
+
+    def publish(self, at: float, messages=1):
+        self.per_second[int(at)] += messages
+        self.messages += messages
+
+
+class ScheduleSimulator:
+    """
+    Replays the dispatches of a time window against a virtual clock.
+
+    Fire times come from the same cron expansion and spread offsets as the engines
+    (see `FireTimeExpander`). Every fire is published to a `FakeBroker` and then "runs"
+    for the job's mean duration from its stats rollups, or `default_duration` for jobs
+    without stats. Tenant quotas are applied as the worker does: a run over its tenant's
+    concurrency or per-minute limit is deferred and fired again later. Nothing is queued
+    and no time passes, so a week replays in seconds.
+
+    `extra_jobs` adds hypothetical `(cron_expression, count, spread_seconds)` groups on top
+    of the active jobs, to size a batch of new jobs before creating it.
+    """
+
+    def __init__(self, start: datetime, end: datetime, default_duration=1.0, extra_jobs=()):
+        self.start = start
+        self.end = end
+        self.default_duration = default_duration
+        self.extra_jobs = extra_jobs
+        self.expander = FireTimeExpander(start, end)
+        self.broker = FakeBroker()
+        self._timestamps = {}
+
+    def _fire_timestamps(self, expression: str) -> tuple:
+        timestamps = self._timestamps.get(expression)
+        if timestamps is None:
+            timestamps = self._timestamps[expression] = tuple(fire.timestamp() for fire in self.expander.expand(expression))
+        return timestamps
+
+    def _group_fires(self, group_id, expression, one_off_run_time, end_time, offset):
+        if not expression:
+            yield one_off_run_time.timestamp(), group_id
+            return
+        until = end_time.timestamp() if end_time else None
+        for fire in self._fire_timestamps(expression):
+            if until is not None and fire > until:
+                return
+            yield fire + offset, group_id
+
+    def jobs(self) -> list:
+        """
+        `(id, cron_expression, one_off_run_time, end_time, spread_seconds)` of the simulated jobs.
+        Hypothetical jobs get negative ids.
+        """
+        jobs = [(job_id, expression, one_off, end_time, spread)
+                for job_id, _, expression, one_off, end_time, spread in self.expander.jobs().iterator(chunk_size=2000)]
+        virtual_id = 0
+        for expression, count, spread_seconds in self.extra_jobs:
+            for _ in range(count):
+                virtual_id -= 1
+                jobs.append((virtual_id, expression, None, None, spread_seconds))
+        return jobs
+
+    def durations(self, job_ids) -> dict:
+        """
+        Mean run duration (seconds, to 0.1s) of each job over its stored stats rollups.
+        """
+        durations = {}
+        rows = (
+            JobStats.objects.filter(job_id__in=job_ids).values('job_id')
+            .annotate(runs=Sum('runs'), total_ms=Sum('total_duration_ms'))
+        )
+        for row in rows:
+            if row['runs']:
+                durations[row['job_id']] = round(row['total_ms'] / row['runs'] / 1000, 1)
+        return durations
+
+    def groups(self, jobs) -> list:
+        """
+        Collapse jobs that behave identically (same fire times, tenant and duration) into
+        `(fire_args, tenant, duration, size)` groups, so shared expressions cost one event per fire.
+        """
+        real_ids = [job[0] for job in jobs if job[0] > 0]
+        tenants = dict(ScheduledJob.objects.filter(id__in=real_ids).values_list('id', 'tenant'))
+        durations = self.durations(real_ids)
+
+        groups = Counter()
+        for job_id, expression, one_off_run_time, end_time, spread_seconds in jobs:
+            if expression:
+                try:
+                    self._fire_timestamps(expression)
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"[Simulation] Skipping job {job_id} with invalid cron '{expression}': {e}")
+                    continue
+                fire_args = (expression, None, end_time, spread_offset(job_id, spread_seconds, expression))
+            else:
+                fire_args = (None, one_off_run_time, None, 0)
+            groups[fire_args, tenants.get(job_id, DEFAULT_TENANT), durations.get(job_id, self.default_duration)] += 1
+        return [(*key, size) for key, size in groups.items()]
+
+    def run(self) -> dict:
+        """
+        Replay the window and return the dispatch and concurrency report.
+        """
+        started = time.perf_counter()
+        jobs = self.jobs()
+        groups = self.groups(jobs)
+        quotas = tenant_quotas.quotas()
+        throttle_delay = settings.SCHEDULER_TENANT_THROTTLE_DELAY
+        window_end = self.end.timestamp()
+
+        fires = heapq.merge(*(self._group_fires(group_id, *group[0]) for group_id, group in enumerate(groups)))
+        deferred_fires = []  # (at, group_id, runs) heap of runs pushed back by tenant quotas
+        completions = []  # (finishes_at, group_id, runs) heap of simulated runs
+        running_groups = Counter()
+        running_tenants = Counter()
+        tenant_starts = Counter()  # (tenant, minute) -> runs started
+        running = peak = 0
+        peak_at = None
+        overlaps = deferred = dropped = 0
+
+        next_fire = next(fires, None)
+        while next_fire is not None or deferred_fires:
+            if deferred_fires and (next_fire is None or deferred_fires[0][:2] < next_fire):
+                at, group_id, runs = heapq.heappop(deferred_fires)
+            else:
+                at, group_id = next_fire
+                runs = groups[group_id][3]
+                next_fire = next(fires, None)
+
+            while completions and completions[0][0] <= at:
+                _, finished_id, finished_runs = heapq.heappop(completions)
+                running_groups[finished_id] -= finished_runs
+                running_tenants[groups[finished_id][1]] -= finished_runs
+                running -= finished_runs
+
+            _, tenant, duration, size = groups[group_id]
+            quota = quotas.get(tenant)
+            if quota is not None:
+                # Admit what the tenant's limits allow; the rest is deferred as the worker would
+                minute = int(at // 60)
+                admitted, delay = runs, 0
+                if quota.max_concurrency is not None:
+                    free = max(quota.max_concurrency - running_tenants[tenant], 0)
+                    if free < admitted:
+                        admitted, delay = free, throttle_delay
+                if quota.max_runs_per_minute is not None:
+                    allowed = max(quota.max_runs_per_minute - tenant_starts[tenant, minute], 0)
+                    if allowed < admitted:
+                        admitted, delay = allowed, 60 - at % 60 + 1
+                if admitted < runs:
+                    deferred += runs - admitted
+                    if at + delay < window_end:
+                        heapq.heappush(deferred_fires, (at + delay, group_id, runs - admitted))
+                    else:
+                        dropped += runs - admitted
+                runs = admitted
+                if not runs:
+                    continue
+                tenant_starts[tenant, minute] += runs
+
+            self.broker.publish(at, runs)
+            # Members of a group share fire times; each overlaps at most once per fire
+            overlaps += min(running_groups[group_id], size, runs)
+            running_groups[group_id] += runs
+            running_tenants[tenant] += runs
+            running += runs
+            heapq.heappush(completions, (at + duration, group_id, runs))
+            if running > peak:
+                peak, peak_at = running, at
+
+        return self.report(len(jobs), peak, peak_at, overlaps, deferred, dropped, time.perf_counter() - started)
+
+    def report(self, jobs, peak, peak_at, overlaps, deferred, dropped, elapsed) -> dict:
+        per_second = self.broker.per_second
+        busiest = per_second.most_common(TOP_SECONDS)
+        counts = sorted(per_second.values())
+        return {
+            'start': self.start,
+            'end': self.end,
+            'jobs': jobs,
+            'dispatches': self.broker.messages,
+            'busy_seconds': len(counts),
+            'peak_per_second': busiest[0][1] if busiest else 0,
+            'p99_per_busy_second': counts[min(int(len(counts) * 0.99), len(counts) - 1)] if counts else 0,
+            'busiest_seconds': [(_as_datetime(second), count) for second, count in busiest],
+            'peak_concurrency': peak,
+            'peak_concurrency_at': _as_datetime(peak_at) if peak_at is not None else None,
+            'overlaps': overlaps,
+            'deferred': deferred,
+            'dropped': dropped,
+            'elapsed_seconds': round(elapsed, 3),
+        }
+
+
+def _as_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
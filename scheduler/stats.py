@@ -0,0 +1,182 @@
+import logging
+from bisect import bisect_left
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Func, JSONField, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from scheduler.models import JobStats, ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the duration bins; one extra bin counts everything slower
+DURATION_BINS_MS = (
+    10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000, 60_000, 300_000, 900_000, 3_600_000,
+)
+
+
+class HistogramIncrement(Func):
+    """
+    Adds one to element `index` of a JSON array column, in place (a JSON path update).
+    """
+    output_field = JSONField()
+
+    def __init__(self, expression, index: int, **extra):
+        super().__init__(expression, **extra)
+        self.index = int(index)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        # SQLite and MySQL/MariaDB
+        path = f"'$[{self.index}]'"
+        template = f"JSON_SET(%(expressions)s, {path}, COALESCE(JSON_EXTRACT(%(expressions)s, {path}), 0) + 1)"
+        return super().as_sql(compiler, connection, template=template, **extra_context)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        template = (
+            f"JSONB_SET(%(expressions)s, '{{{self.index}}}', "
+            f"TO_JSONB(COALESCE((%(expressions)s ->> {self.index})::bigint, 0) + 1))"
+        )
+        return super().as_sql(compiler, connection, template=template, **extra_context)
+
+
+class StatsRecorder:
+    """
+    Maintains hourly execution rollups per job and per task path.
+
+    Each finished run upserts two fixed-size rows (its job's and its task path's current
+    hour), so reading stats over a window touches at most one row per hour regardless of
+    how many runs happened. Percentiles are estimated from a fixed duration histogram.
+
+    Counters are incremented in place by single `UPDATE`s (the histogram bin through a JSON
+    path update), so concurrent runs of a popular task path never hold its row for longer
+    than that statement.
+    """
+
+    @staticmethod
+    def bucket_for(moment):
+        return moment.replace(minute=0, second=0, microsecond=0)
+
+    def record(self, job: ScheduledJob, succeeded: bool, duration_ms: int, finished_at=None):
+        """
+        Add one finished run of `job` to its job and task path buckets.
+        Recording is best-effort and never raises into the task.
+        """
+        bucket = self.bucket_for(finished_at or timezone.now())
+        duration_ms = max(int(duration_ms), 0)
+        bin_index = bisect_left(DURATION_BINS_MS, duration_ms)
+
+        try:
+            for lookup in ({'job_id': job.id}, {'job__isnull': True, 'task_path': job.task_path}):
+                self._upsert(job, lookup, bucket, succeeded, duration_ms, bin_index)
+        except Exception as e:
+            logger.warning(f"[Stats] Failed to record run of job {job.id}: {e}")
+
+    @staticmethod
+    def _upsert(job, lookup: dict, bucket, succeeded: bool, duration_ms: int, bin_index: int):
+        """
+        Add the run to one bucket with a single atomic UPDATE; the first run of the hour
+        inserts the row instead (or, if a concurrent run inserted it first, updates it).
+        """
+        buckets = JobStats.objects.filter(bucket=bucket, **lookup)
+        changes = {
+            'runs': F('runs') + 1,
+            'successes': F('successes') + int(succeeded),
+            'failures': F('failures') + int(not succeeded),
+            'total_duration_ms': F('total_duration_ms') + duration_ms,
+            'max_duration_ms': Greatest(F('max_duration_ms'), Value(duration_ms)),
+            'histogram': HistogramIncrement('histogram', bin_index),
+        }
+        if buckets.update(**changes):
+            return
+
+        histogram = [0] * (len(DURATION_BINS_MS) + 1)
+        histogram[bin_index] = 1
+        try:
+            with transaction.atomic():
+                JobStats.objects.create(
+                    job_id=lookup.get('job_id'),
+                    task_path=job.task_path,
+                    bucket=bucket,
+                    runs=1,
+                    successes=int(succeeded),
+                    failures=int(not succeeded),
+                    total_duration_ms=duration_ms,
+                    max_duration_ms=duration_ms,
+                    histogram=histogram,
+                )
+        except IntegrityError:
+            buckets.update(**changes)
+
+    def window(self, hours=None):
+        """
+        Bucket range covering the last `hours` hours, current hour included.
+        """
+        hours = min(hours or settings.SCHEDULER_STATS_DEFAULT_HOURS, settings.SCHEDULER_STATS_MAX_HOURS)
+        end = self.bucket_for(timezone.now())
+        return end - timedelta(hours=hours - 1), end, hours
+
+    def for_job(self, job_id: int, hours=None) -> dict:
+        start, end, hours = self.window(hours)
+        return self.summarize(JobStats.objects.filter(job_id=job_id, bucket__range=(start, end)), hours)
+
+    def for_task_path(self, task_path: str, hours=None) -> dict:
+        start, end, hours = self.window(hours)
+        return self.summarize(
+            JobStats.objects.filter(job__isnull=True, task_path=task_path, bucket__range=(start, end)),
+            hours,
+        )
+
+    def summarize(self, buckets, hours: int) -> dict:
+        """
+        Merge hourly buckets into window totals, rates and duration percentiles.
+        """
+        runs = successes = failures = total_duration_ms = max_duration_ms = 0
+        histogram = [0] * (len(DURATION_BINS_MS) + 1)
+        per_hour = []
+
+        for stats in buckets.order_by('bucket'):
+            runs += stats.runs
+            successes += stats.successes
+            failures += stats.failures
+            total_duration_ms += stats.total_duration_ms
+            max_duration_ms = max(max_duration_ms, stats.max_duration_ms)
+            for index, count in enumerate(stats.histogram):
+                histogram[index] += count
+            per_hour.append({'hour': stats.bucket, 'runs': stats.runs, 'failures': stats.failures})
+
+        return {
+            'hours': hours,
+            'runs': runs,
+            'successes': successes,
+            'failures': failures,
+            'success_rate': round(successes / runs, 4) if runs else None,
+            'runs_per_hour': round(runs / hours, 2),
+            'avg_duration_ms': round(total_duration_ms / runs) if runs else None,
+            'p50_duration_ms': self.percentile(histogram, 0.50, max_duration_ms),
+            'p95_duration_ms': self.percentile(histogram, 0.95, max_duration_ms),
+            'max_duration_ms': max_duration_ms if runs else None,
+            'per_hour': per_hour,
+        }
+
+    @staticmethod
+    def percentile(histogram, quantile: float, max_duration_ms: int):
+        """
+        Upper bound of the bin holding the `quantile` run, capped by the observed maximum.
+        """
+        total = sum(histogram)
+        if not total:
+            return None
+        rank, seen = quantile * total, 0
+        for index, count in enumerate(histogram):
+            seen += count
+            if seen >= rank and count:
+                bound = DURATION_BINS_MS[index] if index < len(DURATION_BINS_MS) else max_duration_ms
+                return min(bound, max_duration_ms)
+        return max_duration_ms
+
+
+# Singleton instance used across the application
+job_stats = StatsRecorder()
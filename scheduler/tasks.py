@@ -1,32 +1,75 @@
+import asyncio
+import inspect
 import logging
+import time
 import traceback
+from datetime import timedelta
+from functools import partial
 from importlib import import_module
 
+from billiard.process import current_process
+from asgiref.sync import async_to_sync
 from celery import shared_task
 from celery.exceptions import MaxRetriesExceededError
 from django.utils import timezone
+
+from core.utils.limits import ExecutionGuard
+from scheduler.async_runner import async_runner
+from scheduler.events import job_events
+from scheduler.leases import Heartbeat
+from scheduler.memo import result_cache
+from scheduler.priority import deadline_priority
+from scheduler.profiling import RunProfiler
+from scheduler.results import backend_results
 from scheduler.models import ScheduledJob, JobStatus
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task(bind=True, name='run_scheduled_job')
-def run_scheduled_job(self, job_id):
+@shared_task(bind=True, name='run_scheduled_job', ignore_result=True)
+def run_scheduled_job(self, job_id, run_key=None, spread=0, deferrals=0):
     """
     Celery task that executes a scheduled job.
     This task serves as the main entry point for running both one-off and recurring jobs.
+    Results are kept in the database; the result backend only gets what the job's
+    `result_backend` mode asks for (see `BackendResultWriter`).
 
     Args:
         job_id (int): ID of the ScheduledJob instance to run.
+        run_key (str): Identity of the scheduled fire (job id + fire time). Defaults to the
+            Celery task id, which is stable across broker redeliveries and retries.
+        spread (int): Seconds to defer this fire by, as set by the engine from the job's
+            spread window. The deferred message keeps the original run key.
+        deferrals (int): Times this run was already deferred by its tenant's concurrency
+            limit; each deferral backs off exponentially.
     """
+    from scheduler.claims import run_claims
     from scheduler.services import job_service
+    from scheduler.tenants import tenant_quotas
 
-    try:
-        job = ScheduledJob.objects.get(id=job_id)
-    except ScheduledJob.DoesNotExist:
-        logger.warning(f"[Task] Job with id {job_id} does not exist.")
+    # Sampled phase timings / query counts, stored on the JobRun
+    profiler = RunProfiler.sample()
+
+    if spread:
+        # The job is not loaded yet; the deferred message keeps the deadline priority and expiry it was sent with
+        priority = (self.request.delivery_info or {}).get('priority')
+        run_scheduled_job.apply_async(
+            args=[job_id],
+            kwargs={'run_key': run_key or f"{job_id}:{self.request.id}"},
+            countdown=spread,
+            **({'priority': priority} if priority is not None else {}),
+            **({'expires': self.request.expires} if self.request.expires else {}),
+        )
+        logger.debug(f"[Task] Deferred job {job_id} by {spread}s (spread).")
         return
 
+    with profiler.phase('load'):
+        try:
+            job = ScheduledJob.objects.get(id=job_id)
+        except ScheduledJob.DoesNotExist:
+            logger.warning(f"[Task] Job with id {job_id} does not exist.")
+            return
+
     # Check if the job is active and not expired
     if not job.is_active:
         logger.info(f"[Task] Skipping inactive job {job_id}.")
@@ -36,31 +79,77 @@ def run_scheduled_job(self, job_id):
         logger.info(f"[Task] Skipping expired job {job_id} (past end_time).")
         return
 
-    logger.info(f"[Task] Running job {job_id} ({job.name}) at {timezone.now()}")
+    # A one-off re-scheduled to another time leaves its old message behind in the broker
+    if run_claims.is_stale(job, run_key):
+        logger.info(f"[Task] Skipping stale dispatch {run_key} of job {job_id}.")
+        return
+
+    claim_key = run_claims.attempt_key(run_key or f"{job_id}:{self.request.id}", self.request.retries)
+
+    # Tenant quotas: while the tenant is over its concurrency or rate limit, defer without claiming
+    admission = tenant_quotas.admit(job, claim_key, deferrals)
+    if admission.delay:
+        run_scheduled_job.apply_async(
+            args=[job_id],
+            kwargs={'run_key': run_key or f"{job_id}:{self.request.id}", 'deferrals': deferrals + 1},
+            countdown=admission.delay,
+            retries=self.request.retries,
+            **deadline_priority.options(job),
+        )
+        return
+
+    with profiler.phase('mark-running'):
+        # Claim this fire exactly once; redelivered duplicates are acked without running
+        if not run_claims.claim(job, claim_key, worker=self.request.hostname):
+            tenant_quotas.refund(job, claim_key, admission)
+            return
+
+        logger.info(f"[Task] Running job {job_id} ({job.name}) at {timezone.now()}")
+
+        # Update job as running and take the heartbeat lease
+        job.status = JobStatus.RUNNING
+        job.last_run_at = job.heartbeat_at = timezone.now()
+        job.save(update_fields=['status', 'last_run_at', 'heartbeat_at'])
+        job_events.publish(job)
 
-    # Update job as running
-    job.status = JobStatus.RUNNING
-    job.last_run_at = timezone.now()
-    job.save(update_fields=['status', 'last_run_at'])
+    # `async def` callables run on the worker's event loop; this task returns without waiting.
+    # Memoized jobs run in place so concurrent identical calls share the single-flight lock
+    if not self.request.is_eager and not job.result_cache_ttl:
+        coroutine_func = _resolve_coroutine_function(job)
+        if coroutine_func is not None:
+            async_runner.submit(
+                job,
+                coroutine_func(*job.args or [], **job.kwargs or {}),
+                on_done=partial(
+                    _finish_async_run, job, run_key or f"{job_id}:{self.request.id}",
+                    self.request.retries, profiler, time.monotonic(), self.request.id,
+                ),
+                timeout=job.time_limit or job.soft_time_limit,
+            )
+            logger.info(f"[Task] Job {job_id} handed to the event loop ({async_runner.in_flight()} in flight).")
+            return
 
+    # Time/memory bounds; the hard limit recycles the pool child, so record the failure first
+    guard = ExecutionGuard(
+        soft_time_limit=job.soft_time_limit,
+        time_limit=job.time_limit,
+        max_memory_mb=job.max_memory_mb,
+        hard_kill=not self.request.is_eager and _in_pool_child(),
+        on_hard_limit=lambda error: job_service.handle_job_failure(job, error_message=str(error)),
+    )
+
+    started = time.monotonic()
     try:
         # Dynamically import and execute the task function
-        result = _execute_job_logic(job)
+        with guard, Heartbeat(job.id, on_beat=partial(tenant_quotas.renew, job, claim_key)):
+            result = _execute_job_logic(job, profiler)
 
-        # Handle success
-        job.result = str(result)[:2048]  # truncate if large
-        job_service.handle_job_success(job, result=result)
-        job.save(update_fields=['result', 'status', 'last_run_at', 'updated_at'])
-        logger.info(f"[Task] Job {job_id} executed successfully.")
+        _record_success(job, result, claim_key, profiler, started)
+        backend_results.write(self.backend, self.request.id, job, result)
         return result
 
     except Exception as exc:
-        # Handle failure
-        error_msg = f"[Task] Job {job_id} failed: {exc}\n{traceback.format_exc()}"
-        logger.error(error_msg)
-        job.error_message = str(exc)[:2048]  # truncate if large
-        job_service.handle_job_failure(job, error_message=str(exc))
-        job.save(update_fields=['error_message', 'status', 'updated_at'])
+        _record_failure(job, exc, claim_key, profiler, started)
 
         # Retry with job-defined max_retries
         if job.max_retries > 0:
@@ -81,25 +170,179 @@ def run_scheduled_job(self, job_id):
                 return
 
 
-def _execute_job_logic(job: ScheduledJob):
+@shared_task(name='reap_stale_jobs')
+def reap_stale_jobs():
+    """
+    Periodic task failing (or requeueing) RUNNING jobs whose heartbeat lease expired.
+    """
+    from scheduler.services import job_service
+
+    return len(job_service.reap_stale_jobs())
+
+
+@shared_task(name='dispatch_due_jobs')
+def dispatch_due_jobs():
+    """
+    Periodic task dispatching due jobs from the Redis scheduling index.
+    Only scheduled when the Redis index engine is configured.
+    """
+    from core.utils.scheduler.redis_index_engine import redis_index_engine
+
+    return redis_index_engine.dispatch_due()
+
+
+@shared_task(name='archive_finished_jobs')
+def archive_finished_jobs():
+    """
+    Periodic task moving finished one-off jobs past the retention window to the archive table.
+    """
+    from scheduler.archive import job_archiver
+
+    return job_archiver.archive(job_archiver.cutoff())
+
+
+@shared_task(name='notify_beat_schedule_changed')
+def notify_beat_schedule_changed():
+    """
+    Debounced signal to beat that periodic tasks changed, sent once per coalescing window.
+    """
+    from core.utils.scheduler.beat_sync import bump_schedule_changed
+
+    bump_schedule_changed()
+
+
+@shared_task(bind=True, name='expand_job_template')
+def expand_job_template(self, template_id, run_key=None):
+    """
+    Periodic task of a job template; fans its parameter rows out into batch messages.
+    """
+    from scheduler.templates import template_dispatcher
+
+    return template_dispatcher.expand(template_id, run_key or f"template:{template_id}:{self.request.id}")
+
+
+@shared_task(name='run_template_batch')
+def run_template_batch(template_id, first_id, last_id, run_key):
+    """
+    Execute one batch (parameter id range) of a job template fire.
+    """
+    from scheduler.templates import template_dispatcher
+
+    return template_dispatcher.run_batch(template_id, first_id, last_id, run_key)
+
+
+def _record_success(job: ScheduledJob, result, claim_key: str, profiler, started: float):
+    """
+    Persist a successful run and fan out to downstream jobs whose dependencies are now satisfied.
+    """
+    from scheduler.claims import run_claims
+    from scheduler.services import job_service
+    from scheduler.stats import job_stats
+    from scheduler.tenants import tenant_quotas
+
+    with profiler.phase('persist'):
+        job_stats.record(job, succeeded=True, duration_ms=(time.monotonic() - started) * 1000)
+        job_service.handle_job_success(job, result=result)
+    run_claims.finish(claim_key, JobStatus.SUCCESS, profile=profiler.report())
+    tenant_quotas.release(job, claim_key)
+    logger.info(f"[Task] Job {job.id} executed successfully.")
+
+    job_service.trigger_downstream(job)
+
+
+def _record_failure(job: ScheduledJob, exc: Exception, claim_key: str, profiler, started: float):
+    """
+    Persist a failed run; retrying is left to the caller.
+    """
+    from scheduler.claims import run_claims
+    from scheduler.services import job_service
+    from scheduler.stats import job_stats
+    from scheduler.tenants import tenant_quotas
+
+    error_msg = f"[Task] Job {job.id} failed: {exc}\n{''.join(traceback.format_exception(exc))}"
+    logger.error(error_msg)
+    with profiler.phase('persist'):
+        job_stats.record(job, succeeded=False, duration_ms=(time.monotonic() - started) * 1000)
+        job_service.handle_job_failure(job, error_message=str(exc))
+    run_claims.finish(claim_key, JobStatus.FAILED, profile=profiler.report())
+    tenant_quotas.release(job, claim_key)
+
+
+def _finish_async_run(job: ScheduledJob, run_key: str, attempt: int, profiler, started: float, task_id: str,
+                      result, error):
+    """
+    Completion callback of a job run on the event loop (see `AsyncJobRunner.submit`).
+    Failures are retried like synchronous runs: same run key, next attempt, 60s later.
+    """
+    from scheduler.claims import run_claims
+
+    claim_key = run_claims.attempt_key(run_key, attempt)
+    if error is None:
+        _record_success(job, result, claim_key, profiler, started)
+        backend_results.write(run_scheduled_job.backend, task_id, job, result)
+        return
+
+    _record_failure(job, error, claim_key, profiler, started)
+    if attempt < job.max_retries:
+        run_scheduled_job.apply_async(
+            args=[job.id],
+            kwargs={'run_key': run_key},
+            countdown=60,
+            retries=attempt + 1,
+            **deadline_priority.options(job, timezone.now() + timedelta(seconds=60)),
+        )
+    elif job.max_retries > 0:
+        logger.warning(f"[Task] Max retries exceeded for job {job.id}.")
+
+
+def _in_pool_child():
+    """
+    Whether the current process is a prefork pool child that may be recycled.
+    """
+    return 'PoolWorker' in current_process().name
+
+
+def _resolve_coroutine_function(job: ScheduledJob):
+    """
+    The job's callable if it is an `async def` function, None otherwise (or if it cannot be resolved,
+    which the synchronous path then reports as the run's failure).
+    """
+    try:
+        module_path, func_name = job.task_path.rsplit('.', 1)
+        task_func = getattr(import_module(module_path), func_name)
+    except (AttributeError, ImportError, ValueError):
+        return None
+    return task_func if inspect.iscoroutinefunction(task_func) else None
+
+
+def _execute_job_logic(job: ScheduledJob, profiler=None):
     """
     Dynamically imports and executes the task function specified in the job's `task_path`.
 
     Args:
         job (ScheduledJob): The job instance to execute.
+        profiler (RunProfiler): Optional profiler timing the resolve and execute phases.
 
     Returns:
         Any: The result of the executed task.
     """
+    profiler = profiler or RunProfiler(enabled=False)
     if not job.task_path:
         raise ValueError("Task path is not defined for this job.")
 
-    module_path, func_name = job.task_path.rsplit('.', 1)
-    module = import_module(module_path)
-    task_func = getattr(module, func_name)
+    with profiler.phase('resolve'):
+        module_path, func_name = job.task_path.rsplit('.', 1)
+        module = import_module(module_path)
+        task_func = getattr(module, func_name)
 
     logger.debug(f"[Execution] Executing job {job.id} with args={job.args} kwargs={job.kwargs}")
-    return task_func(*job.args or [], **job.kwargs or {})
+    if inspect.iscoroutinefunction(task_func):
+        # Outside a worker loop (eager calls, tests) coroutines are run to completion in place
+        task_func = async_to_sync(task_func)
+
+    with profiler.phase('execute'):
+        # Jobs with a result_cache_ttl reuse the cached result of an identical call
+        return result_cache.get_or_compute(job, lambda: task_func(*job.args or [], **job.kwargs or {}))
 
 
 @shared_task
@@ -110,6 +353,21 @@ def sample_task():
     logger.info("[Sample] This is a scheduled sample task running...")
 
 
+async def sample_async_task(delay=0):
+    """
+    Sample `async def` job callable; waits `delay` seconds without holding a worker process.
+
+    Args:
+        delay (int | float): Seconds to wait.
+
+    Returns:
+        str: Completion message.
+    """
+    await asyncio.sleep(delay)
+    logger.info("[Sample] This is a scheduled async task running...")
+    return f"Waited {delay}s"
+
+
 @shared_task
 def add(x, y):
     """
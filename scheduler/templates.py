@@ -0,0 +1,182 @@
+import asyncio
+import inspect
+import json
+import logging
+from importlib import import_module
+
+from asgiref.sync import async_to_sync
+from celery import group
+from django.core.cache import cache
+from django.utils import timezone
+from django_celery_beat.models import CrontabSchedule, PeriodicTask
+
+from core.utils.scheduler.beat_sync import notify_schedule_changed
+from scheduler.models import JobTemplate, JobTemplateParameter
+
+logger = logging.getLogger(__name__)
+
+
+class TemplateDispatcher:
+    """
+    Schedules job templates and expands them into batched executions at fire time.
+
+    A template owns a single `PeriodicTask` whatever its number of parameter rows. When it
+    fires, the parameter ids are walked in keyset order and one `run_template_batch`
+    message is sent per `batch_size` rows; each batch resolves the callable once and runs
+    it for every row of its id range. Rows are read at fire time, so adding or editing
+    instances never touches beat.
+    """
+
+    @staticmethod
+    def task_name(template_id: int) -> str:
+        return f"scheduler.template.{template_id}"
+
+    def schedule(self, template: JobTemplate):
+        """
+        Create or update the template's periodic task in place.
+        """
+        try:
+            minute, hour, day_of_month, month, day_of_week = template.cron_expression.split()
+        except ValueError as ve:
+            logger.error(f"[Templates] Invalid cron format for template {template.id}: {ve}")
+            return
+        schedule, _ = CrontabSchedule.objects.get_or_create(
+            minute=minute,
+            hour=hour,
+            day_of_month=day_of_month,
+            month_of_year=month,
+            day_of_week=day_of_week,
+            timezone="UTC",
+        )
+        desired = {
+            "task": "expand_job_template",
+            "crontab_id": schedule.id,
+            "args": json.dumps([template.id]),
+            "enabled": template.is_active,
+        }
+
+        name = self.task_name(template.id)
+        current = PeriodicTask.objects.filter(name=name).values("id", *desired).first()
+        if current is None:
+            task = PeriodicTask(name=name, start_time=timezone.now(), **desired)
+            task.no_changes = True  # notified below, debounced
+            task.save()
+            logger.info(f"[Templates] Template {template.id} registered in DB.")
+        else:
+            changes = {field: value for field, value in desired.items() if current[field] != value}
+            if not changes:
+                return
+            PeriodicTask.objects.filter(id=current["id"]).update(**changes, date_changed=timezone.now())
+            logger.info(f"[Templates] Template {template.id} updated in place: {sorted(changes)}.")
+        notify_schedule_changed()
+
+    def unschedule(self, template_id: int):
+        deleted, _ = PeriodicTask.objects.filter(name=self.task_name(template_id)).delete()
+        if deleted:
+            logger.info(f"[Templates] Template {template_id} removed from PeriodicTask.")
+            notify_schedule_changed()
+
+    @staticmethod
+    def claim(run_key: str) -> bool:
+        """
+        Claim a template fire or batch once; broker redeliveries carry the same key.
+        """
+        from scheduler.claims import run_claims
+
+        try:
+            return cache.add(f"scheduler:run:{run_key}", 1, timeout=run_claims.ttl)
+        except Exception as e:
+            # Better a rare duplicate than a template silently not running
+            logger.warning(f"[Templates] Failed to claim {run_key}, running anyway: {e}")
+            return True
+
+    @staticmethod
+    def batches(template: JobTemplate):
+        """
+        Yield `(first_id, last_id, count)` id ranges of at most `batch_size` active parameter rows.
+        """
+        parameters = template.parameters.filter(is_active=True).order_by('id')
+        last_id = 0
+        while True:
+            ids = list(parameters.filter(id__gt=last_id).values_list('id', flat=True)[:template.batch_size])
+            if not ids:
+                return
+            yield ids[0], ids[-1], len(ids)
+            last_id = ids[-1]
+
+    def expand(self, template_id: int, run_key: str) -> dict:
+        """
+        Send one `run_template_batch` message per batch of the template's parameter rows.
+        """
+        from scheduler.tasks import run_template_batch
+
+        template = JobTemplate.objects.filter(id=template_id, is_active=True).first()
+        if template is None:
+            logger.info(f"[Templates] Skipping missing or inactive template {template_id}.")
+            return {}
+        if not self.claim(run_key):
+            logger.info(f"[Templates] Skipping duplicate expansion {run_key}.")
+            return {}
+
+        batches = list(self.batches(template))
+        if batches:
+            group(
+                run_template_batch.s(template.id, first_id, last_id, run_key=f"{run_key}:{first_id}")
+                for first_id, last_id, _ in batches
+            ).apply_async()
+
+        expansion = {'instances': sum(count for *_, count in batches), 'batches': len(batches)}
+        JobTemplate.objects.filter(id=template.id).update(last_run_at=timezone.now(), last_expansion=expansion)
+        logger.info(f"[Templates] Expanded template {template.id} into {expansion['batches']} batch(es) "
+                    f"of {expansion['instances']} instance(s).")
+        return expansion
+
+    def run_batch(self, template_id: int, first_id: int, last_id: int, run_key: str) -> dict:
+        """
+        Run the template's callable for every active parameter row with an id in `[first_id, last_id]`.
+        Instances fail independently; coroutine callables run concurrently within the batch.
+        """
+        template = JobTemplate.objects.filter(id=template_id).first()
+        if template is None or not self.claim(run_key):
+            return {}
+
+        module_path, func_name = template.task_path.rsplit('.', 1)
+        task_func = getattr(import_module(module_path), func_name)
+
+        parameters = JobTemplateParameter.objects.filter(
+            template_id=template_id, is_active=True, id__gte=first_id, id__lte=last_id,
+        ).only('key', 'args', 'kwargs')
+        calls = [
+            (parameter.key, parameter.args or template.args or [], {**(template.kwargs or {}), **(parameter.kwargs or {})})
+            for parameter in parameters
+        ]
+
+        if inspect.iscoroutinefunction(task_func):
+            outcomes = async_to_sync(self._gather)(task_func, calls)
+        else:
+            outcomes = []
+            for _, args, kwargs in calls:
+                try:
+                    task_func(*args, **kwargs)
+                    outcomes.append(None)
+                except Exception as e:
+                    outcomes.append(e)
+
+        failures = 0
+        for (key, _, _), error in zip(calls, outcomes):
+            if error is not None:
+                failures += 1
+                logger.error(f"[Templates] Instance {key} of template {template_id} failed: {error}")
+
+        logger.info(f"[Templates] Batch {run_key} ran {len(calls)} instance(s), {failures} failed.")
+        return {'instances': len(calls), 'failures': failures}
+
+    @staticmethod
+    async def _gather(task_func, calls):
+        results = await asyncio.gather(*(task_func(*args, **kwargs) for _, args, kwargs in calls),
+                                       return_exceptions=True)
+        return [result if isinstance(result, Exception) else None for result in results]
+
+
+# Singleton instance used across the application
+template_dispatcher = TemplateDispatcher()
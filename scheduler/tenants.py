@@ -0,0 +1,223 @@
+import logging
+import random
+import time
+from typing import NamedTuple
+
+from django.conf import settings
+
+from core.utils.redis import get_redis_client
+from scheduler.models import ScheduledJob, TenantQuota
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = 'default'
+
+ADMIT_RESERVED, ADMIT_CONCURRENCY, ADMIT_RATE, ADMIT_HELD = 0, 1, 2, 3
+
+# Check both limits of a tenant and reserve both, or neither. KEYS[1] holds running claim keys
+# scored by lease expiry (expired leases are dropped first), KEYS[2] counts this minute's runs.
+# ARGV: claim key, now, lease expiry, max concurrency, max runs per minute (-1 = unlimited).
+# A claim key already holding a slot is a duplicate delivery and reserves nothing
+ADMIT_SCRIPT = """
+local max_concurrency, max_rate = tonumber(ARGV[4]), tonumber(ARGV[5])
+if max_concurrency >= 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[2])
+    if redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+        return 3
+    end
+    if redis.call('ZCARD', KEYS[1]) >= max_concurrency then
+        return 1
+    end
+end
+if max_rate >= 0 and tonumber(redis.call('GET', KEYS[2]) or '0') >= max_rate then
+    return 2
+end
+if max_concurrency >= 0 then
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+end
+if max_rate >= 0 then
+    redis.call('INCR', KEYS[2])
+    redis.call('EXPIRE', KEYS[2], 120)
+end
+return 0
+"""
+
+
+# Outcome of `TenantQuotas.admit`: deferral in seconds (0 to run now), whether a slot was
+# taken, and the epoch time the reservation was made at
+class Admission(NamedTuple):
+    delay: float
+    reserved: bool
+    at: float
+
+
+class TenantQuotas:
+    """
+    Per-tenant admission control and dispatch weights.
+
+    Quota rows are cached in-process for `SCHEDULER_TENANT_QUOTA_CACHE_SECONDS`. Workers
+    reserve a concurrency slot and a unit of the per-minute rate in Redis, atomically,
+    before claiming a run; a duplicate delivery that then fails its claim refunds them.
+    Slots are leases, renewed by the run's heartbeat and freed when it finishes, so runs
+    of a worker that died stop counting once their lease lapses.
+    """
+
+    def __init__(self):
+        self._quotas = {}
+        self._loaded_at = None
+        self._admit = None
+
+    def quotas(self) -> dict:
+        """
+        Map of tenant to `TenantQuota`, reloaded once the cache expires.
+        """
+        now = time.monotonic()
+        if self._loaded_at is None or now - self._loaded_at >= settings.SCHEDULER_TENANT_QUOTA_CACHE_SECONDS:
+            self._quotas = {quota.tenant: quota for quota in TenantQuota.objects.all()}
+            self._loaded_at = now
+        return self._quotas
+
+    def invalidate(self):
+        self._loaded_at = None
+
+    def weight(self, tenant: str) -> int:
+        quota = self.quotas().get(tenant)
+        return max(quota.weight, 1) if quota else 1
+
+    @staticmethod
+    def slots_key(tenant: str) -> str:
+        return f"scheduler:tenant:{tenant}:slots"
+
+    @staticmethod
+    def runs_key(tenant: str, minute: int) -> str:
+        return f"scheduler:tenant:{tenant}:runs:{minute}"
+
+    def admit(self, job: ScheduledJob, member: str, deferrals=0, now=None) -> Admission:
+        """
+        Reserve a run of `job` (identified by its claim key `member`) against its tenant's
+        quotas. A non-zero `delay` means the run must be deferred by that many seconds;
+        `reserved` whether this call took a slot and a rate unit, to be refunded if the
+        run is then not claimed.
+        """
+        now = now or time.time()
+        quota = self.quotas().get(job.tenant)
+        if not quota or (quota.max_concurrency is None and quota.max_runs_per_minute is None):
+            return Admission(0, False, now)
+
+        lease = max(settings.SCHEDULER_HEARTBEAT_LEASE, job.time_limit or 0)
+        try:
+            client = get_redis_client()
+            if self._admit is None or self._admit.registered_client is not client:
+                self._admit = client.register_script(ADMIT_SCRIPT)
+            outcome = self._admit(
+                keys=[self.slots_key(job.tenant), self.runs_key(job.tenant, int(now // 60))],
+                args=[member, now, now + lease,
+                      -1 if quota.max_concurrency is None else quota.max_concurrency,
+                      -1 if quota.max_runs_per_minute is None else quota.max_runs_per_minute],
+            )
+        except Exception as e:
+            logger.debug(f"[Tenants] Failed to reserve a run of tenant {job.tenant}: {e}")
+            return Admission(0, False, now)
+
+        if outcome == ADMIT_CONCURRENCY:
+            # Exponential backoff with jitter, so deferred runs do not come back in lockstep
+            backoff = min(settings.SCHEDULER_TENANT_THROTTLE_DELAY * 2 ** deferrals,
+                          settings.SCHEDULER_TENANT_THROTTLE_MAX_DELAY)
+            logger.info(f"[Tenants] Tenant {job.tenant} at concurrency limit; deferring job {job.id}.")
+            return Admission(backoff / 2 + random.uniform(0, backoff / 2), False, now)
+        if outcome == ADMIT_RATE:
+            logger.info(f"[Tenants] Tenant {job.tenant} over its rate limit; deferring job {job.id}.")
+            return Admission(60 - now % 60 + random.uniform(1, settings.SCHEDULER_TENANT_THROTTLE_DELAY), False, now)
+        return Admission(0, outcome == ADMIT_RESERVED, now)
+
+    def refund(self, job: ScheduledJob, member: str, admission: Admission):
+        """
+        Give back what `admit` reserved for a run that was not claimed (a duplicate delivery).
+        """
+        if not admission.reserved:
+            return
+        try:
+            pipe = get_redis_client().pipeline()
+            pipe.zrem(self.slots_key(job.tenant), member)
+            pipe.decr(self.runs_key(job.tenant, int(admission.at // 60)))
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"[Tenants] Failed to refund a run of tenant {job.tenant}: {e}")
+
+    def renew(self, job: ScheduledJob, member: str):
+        """
+        Extend the concurrency slot of a running run by the heartbeat lease.
+        """
+        if not self._limits_concurrency(job):
+            return
+        try:
+            lease_until = time.time() + settings.SCHEDULER_HEARTBEAT_LEASE
+            get_redis_client().zadd(self.slots_key(job.tenant), {member: lease_until}, xx=True)
+        except Exception as e:
+            logger.debug(f"[Tenants] Failed to renew a slot of tenant {job.tenant}: {e}")
+
+    def release(self, job: ScheduledJob, member: str):
+        """
+        Free the concurrency slot of a finished run.
+        """
+        if not self._limits_concurrency(job):
+            return
+        try:
+            get_redis_client().zrem(self.slots_key(job.tenant), member)
+        except Exception as e:
+            logger.debug(f"[Tenants] Failed to release a slot of tenant {job.tenant}: {e}")
+
+    def _limits_concurrency(self, job: ScheduledJob) -> bool:
+        quota = self.quotas().get(job.tenant)
+        return bool(quota) and quota.max_concurrency is not None
+
+
+class DeficitRoundRobin:
+    """
+    Weighted fair selection across tenants (deficit round robin).
+
+    Every round each tenant with due jobs earns `quantum * weight` credit and may take
+    that many jobs; unused credit is kept while the tenant stays backlogged, so over time
+    dispatch capacity is split by weight however many jobs a tenant has due.
+    """
+
+    def __init__(self, quantum=None):
+        self.quantum = quantum
+        self.deficits = {}
+        self._rotation = 0
+
+    def select(self, tenants, limit: int, take):
+        """
+        Pick up to `limit` jobs. `take(tenant, n)` removes and returns up to `n` due jobs
+        of `tenant`; a tenant returning fewer is considered drained for this call.
+        """
+        quantum = self.quantum or settings.SCHEDULER_TENANT_QUANTUM
+        active = sorted(tenants)
+        if active:
+            # Rotate the starting tenant between calls so ties do not always favour the same one
+            self._rotation = (self._rotation + 1) % len(active)
+            active = active[self._rotation:] + active[:self._rotation]
+
+        selected = []
+        while active and len(selected) < limit:
+            backlogged = []
+            for tenant in active:
+                remaining = limit - len(selected)
+                if not remaining:
+                    backlogged.append(tenant)
+                    continue
+                self.deficits[tenant] = self.deficits.get(tenant, 0) + quantum * tenant_quotas.weight(tenant)
+                wanted = min(self.deficits[tenant], remaining)
+                jobs = take(tenant, wanted)
+                selected.extend(jobs)
+                if len(jobs) < wanted:
+                    self.deficits.pop(tenant, None)  # drained: idle tenants do not bank credit
+                else:
+                    self.deficits[tenant] -= len(jobs)
+                    backlogged.append(tenant)
+            active = backlogged
+        return selected
+
+
+# Singleton instance used across the application
+tenant_quotas = TenantQuotas()
@@ -0,0 +1,118 @@
+import heapq
+import json
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+
+from croniter import croniter
+from django.db.models import Q
+
+from core.utils.scheduler.spread import spread_offset
+from scheduler.models import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+
+class FireTimeExpander:
+    """
+    Expands active jobs into their fire times inside a window.
+
+    Cron expressions are expanded once per window and shared by every job using
+    the same expression, which is the common case (e.g. hundreds of '*/5 * * * *').
+    Cron fire times include each job's spread offset, i.e. they are actual dispatch times.
+    """
+
+    def __init__(self, start: datetime, end: datetime):
+        self.start = start
+        self.end = end
+        self._expansions = {}
+
+    def expand(self, expression: str) -> tuple:
+        """
+        Fire times of `expression` within [start, end), cached per expression.
+        """
+        fires = self._expansions.get(expression)
+        if fires is None:
+            fires = []
+            # croniter yields times strictly after its base; step back to include `start`
+            iterator = croniter(expression, self.start - timedelta(seconds=1))
+            while True:
+                fire = iterator.get_next(datetime)
+                if fire >= self.end:
+                    break
+                if fire >= self.start:
+                    fires.append(fire)
+            fires = self._expansions[expression] = tuple(fires)
+        return fires
+
+    def jobs(self):
+        """
+        Active jobs that may fire inside the window, as lightweight value tuples.
+        """
+        return ScheduledJob.objects.filter(
+            Q(cron_expression__isnull=False) & ~Q(cron_expression='')
+            | Q(one_off_run_time__gte=self.start, one_off_run_time__lt=self.end),
+            Q(end_time__isnull=True) | Q(end_time__gte=self.start),
+            is_active=True,
+        ).values_list('id', 'name', 'cron_expression', 'one_off_run_time', 'end_time', 'spread_seconds')
+
+    def _job_fires(self, job):
+        job_id, name, expression, one_off_run_time, end_time, spread_seconds = job
+        offset = timedelta()
+        if expression:
+            try:
+                fires = self.expand(expression)
+            except (ValueError, KeyError) as e:
+                logger.warning(f"[Upcoming] Skipping job {job_id} with invalid cron '{expression}': {e}")
+                return
+            offset = timedelta(seconds=spread_offset(job_id, spread_seconds, expression))
+        else:
+            fires = (one_off_run_time,)
+
+        for fire in fires:
+            if end_time and fire > end_time:
+                return
+            yield fire + offset, job_id, name
+
+    def iter_fires(self):
+        """
+        Yield `(fire_at, job_id, name)` across all jobs, in chronological order.
+        """
+        jobs = list(self.jobs().iterator(chunk_size=2000))
+        return heapq.merge(*(self._job_fires(job) for job in jobs))
+
+    def minute_histogram(self) -> Counter:
+        """
+        Number of fires per minute. Jobs sharing an expression are counted together
+        without expanding each one, so the cost scales with distinct expressions.
+        """
+        histogram = Counter()
+        per_expression = Counter()
+
+        for job in self.jobs().iterator(chunk_size=2000):
+            job_id, name, expression, one_off_run_time, end_time, spread_seconds = job
+            if expression and not end_time:
+                per_expression[expression, spread_offset(job_id, spread_seconds, expression)] += 1
+                continue
+            for fire, _, _ in self._job_fires(job):
+                histogram[fire.replace(second=0, microsecond=0)] += 1
+
+        for (expression, offset), jobs_count in per_expression.items():
+            try:
+                fires = self.expand(expression)
+            except (ValueError, KeyError):
+                continue
+            for fire in fires:
+                fire += timedelta(seconds=offset)
+                histogram[fire.replace(second=0, microsecond=0)] += jobs_count
+        return histogram
+
+    def stream_json(self):
+        """
+        Stream the chronological fire list as a JSON array, one chunk per entry.
+        """
+        yield '['
+        for position, (fire, job_id, name) in enumerate(self.iter_fires()):
+            entry = json.dumps({'fire_at': fire.isoformat(), 'job_id': job_id, 'name': name})
+            yield entry if not position else f',{entry}'
+        yield ']'
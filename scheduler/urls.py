@@ -1,13 +1,17 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from scheduler.views import ScheduledJobViewSet
+from scheduler.views import ArchivedJobViewSet, JobTemplateViewSet, ScheduledJobViewSet, job_status_events
 
 # Initialize DRF router to automatically generate routes for the ViewSet
 router = DefaultRouter()
 router.register(r'jobs', ScheduledJobViewSet, basename='scheduledjob')
+router.register(r'templates', JobTemplateViewSet, basename='jobtemplate')
+router.register(r'archive', ArchivedJobViewSet, basename='archivedjob')
 
 urlpatterns = [
+    # Live status transitions (SSE); listed first so the jobs detail route does not capture it
+    path('jobs/events/', job_status_events, name='job-status-events'),
     # Include all generated routes for scheduled job management
     path('', include(router.urls)),
 ]
@@ -1,10 +1,27 @@
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
-from scheduler.models import ScheduledJob
-from scheduler.serializers import ScheduledJobSerializer
+from scheduler.archive import job_archiver
+from scheduler.events import job_events
+from scheduler.models import ArchivedJob, JobTemplate, JobTemplateParameter, ScheduledJob
+from scheduler.results import result_store
+from scheduler.serializers import (
+    ArchivedJobSerializer,
+    ScheduledJobSerializer,
+    JobSelectionSerializer,
+    JobTemplateSerializer,
+    TemplateParametersSerializer,
+    StatsQuerySerializer,
+    StatusEventsQuerySerializer,
+    UpcomingQuerySerializer,
+)
 from scheduler.services import job_service
+from scheduler.stats import job_stats
+from scheduler.upcoming import FireTimeExpander
 
 
 class ScheduledJobViewSet(viewsets.ModelViewSet):
@@ -16,6 +33,16 @@ class ScheduledJobViewSet(viewsets.ModelViewSet):
     queryset = ScheduledJob.objects.all()
     serializer_class = ScheduledJobSerializer
 
+    def get_queryset(self):
+        """
+        Optionally restrict jobs to one tenant with `?tenant=`.
+        """
+        queryset = super().get_queryset()
+        tenant = self.request.query_params.get('tenant')
+        if tenant:
+            queryset = queryset.filter(tenant=tenant)
+        return queryset
+
     def perform_create(self, serializer):
         """
         Hook to handle post-creation logic such as scheduling the job.
@@ -40,23 +67,196 @@ class ScheduledJobViewSet(viewsets.ModelViewSet):
         if job.is_active:
             return Response({"detail": "Job is already active."}, status=status.HTTP_400_BAD_REQUEST)
 
-        job.is_active = True
-        job.save()
-
-        job_service.refresh_job(job)
+        job_service.set_active(ScheduledJob.objects.filter(pk=job.pk), True)
         return Response({"detail": "Job activated and scheduled successfully."}, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["post"])
     def deactivate(self, request, pk=None):
         """
         Custom action to deactivate a scheduled job.
-        Disables future execution but does not cancel already scheduled tasks.
+        Disables its engine entry; already queued runs are skipped by the worker.
         """
         job = self.get_object()
         if not job.is_active:
             return Response({"detail": "Job is already inactive."}, status=status.HTTP_400_BAD_REQUEST)
 
-        job.is_active = False
-        job.save()
-
+        job_service.set_active(ScheduledJob.objects.filter(pk=job.pk), False)
         return Response({"detail": "Job deactivated."}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["post"], url_path="bulk-activate")
+    def bulk_activate(self, request):
+        """
+        Custom action to activate every job selected by `ids` and/or filters in bulk.
+        """
+        return self._bulk_set_active(request, True)
+
+    @action(detail=False, methods=["post"], url_path="bulk-deactivate")
+    def bulk_deactivate(self, request):
+        """
+        Custom action to deactivate every job selected by `ids` and/or filters in bulk.
+        """
+        return self._bulk_set_active(request, False)
+
+    def _bulk_set_active(self, request, active: bool):
+        selection = JobSelectionSerializer(data=request.data)
+        selection.is_valid(raise_exception=True)
+        changed = job_service.set_active(selection.filter(self.get_queryset()), active)
+        return Response({"changed": len(changed)}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["get"])
+    def result(self, request, pk=None):
+        """
+        Custom action to retrieve the full, decoded result of the latest successful run.
+        """
+        job = self.get_object()
+        if not job.last_result_id:
+            return Response({"detail": "Job has no stored result."}, status=status.HTTP_404_NOT_FOUND)
+
+        job_result = job.last_result
+        return Response({
+            "digest": job_result.digest,
+            "size": job_result.size,
+            "created_at": job_result.created_at,
+            "result": result_store.load(job_result),
+        }, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["get"])
+    def stats(self, request, pk=None):
+        """
+        Custom action returning execution stats of the job over the last `hours` hours,
+        read from hourly rollups.
+        """
+        job = self.get_object()
+        query = StatsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return Response(job_stats.for_job(job.id, query.validated_data.get('hours')), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="task-stats")
+    def task_stats(self, request):
+        """
+        Custom action returning execution stats of every job running `task_path`.
+        """
+        query = StatsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        task_path = query.validated_data.get('task_path')
+        if not task_path:
+            return Response({"detail": "'task_path' is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        stats = job_stats.for_task_path(task_path, query.validated_data.get('hours'))
+        return Response({"task_path": task_path, **stats}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"])
+    def upcoming(self, request):
+        """
+        Custom action listing fire times of all active jobs between `start` and `end`,
+        streamed in chronological order. With `histogram=true`, returns per-minute
+        fire counts instead, to spot top-of-minute load spikes.
+        """
+        query = UpcomingQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        expander = FireTimeExpander(query.validated_data['start'], query.validated_data['end'])
+
+        if query.validated_data['histogram']:
+            histogram = expander.minute_histogram()
+            peak = max(histogram.items(), key=lambda item: item[1], default=(None, 0))
+            return Response({
+                "start": expander.start,
+                "end": expander.end,
+                "total": sum(histogram.values()),
+                "peak": {"minute": peak[0], "count": peak[1]},
+                "minutes": {minute.isoformat(): count for minute, count in sorted(histogram.items())},
+            }, status=status.HTTP_200_OK)
+
+        return StreamingHttpResponse(expander.stream_json(), content_type='application/json')
+
+
+class JobTemplateViewSet(viewsets.ModelViewSet):
+    """
+    ViewSet for managing job templates: one task path and cron shared by many parameter rows.
+    Saving a template creates or updates its single periodic task.
+    """
+    queryset = JobTemplate.objects.all()
+    serializer_class = JobTemplateSerializer
+
+    @action(detail=True, methods=["post"])
+    def parameters(self, request, pk=None):
+        """
+        Custom action upserting parameter rows by `key` in bulk (and deleting the keys in `delete`).
+        Changes apply from the template's next fire; beat is not touched.
+        """
+        template = self.get_object()
+        body = TemplateParametersSerializer(data=request.data)
+        body.is_valid(raise_exception=True)
+
+        rows = [JobTemplateParameter(template=template, **row) for row in body.validated_data['parameters']]
+        JobTemplateParameter.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['template', 'key'],
+            update_fields=['args', 'kwargs', 'is_active'],
+        )
+        deleted = 0
+        if body.validated_data.get('delete'):
+            deleted, _ = template.parameters.filter(key__in=body.validated_data['delete']).delete()
+
+        return Response({
+            "upserted": len(rows),
+            "deleted": deleted,
+            "total": template.parameters.count(),
+        }, status=status.HTTP_200_OK)
+
+
+class ArchivedJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only access to finished one-off jobs moved out of the live table,
+    looked up by the id they had as scheduled jobs.
+    """
+    queryset = ArchivedJob.objects.defer('result_payload')
+    serializer_class = ArchivedJobSerializer
+    lookup_field = 'original_id'
+    filterset_fields = ('tenant', 'task_path', 'status')
+
+    @action(detail=True, methods=["get"])
+    def result(self, request, original_id=None):
+        """
+        Custom action returning the decoded latest result of the archived job.
+        """
+        archived = self.get_object()
+        if not archived.result:
+            return Response({"detail": "Job has no stored result."}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response({
+            "digest": archived.result['digest'],
+            "size": archived.result['size'],
+            "result": job_archiver.load_result(archived),
+        }, status=status.HTTP_200_OK)
+
+
+@require_GET
+async def job_status_events(request):
+    """
+    Server-Sent Events stream of job status transitions, filtered server-side with
+    `?job_ids=1,2`, `?status=running,failed` and `?tenant=`. Replaces polling the job list;
+    needs the ASGI application (config/asgi.py) to hold connections open, so WSGI
+    requests are answered with 503 rather than pinning a worker thread forever.
+    """
+    query = StatusEventsQuerySerializer(data=request.GET)
+    if not query.is_valid():
+        return JsonResponse(query.errors, status=400)
+    if not job_events.enabled:
+        return JsonResponse({"detail": "Status events are disabled."}, status=503)
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"detail": "Status events need the ASGI server."}, status=503)
+
+    response = StreamingHttpResponse(
+        job_events.stream(
+            job_ids=query.validated_data.get('job_ids'),
+            statuses=query.validated_data.get('status'),
+            tenant=query.validated_data.get('tenant'),
+        ),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # let proxies pass events through unbuffered
+    return response
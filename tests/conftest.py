@@ -10,3 +10,17 @@ django.setup()
 @pytest.fixture
 def celery_app():
     return celery_app
+
+
+@pytest.fixture
+def celery_eager():
+    """
+    Run tasks dispatched with `delay`/`apply_async` (including groups) in-process,
+    whichever settings module is loaded.
+    """
+    from config.celery import app
+
+    previous = {key: app.conf[key] for key in ('task_always_eager', 'task_eager_propagates')}
+    app.conf.update(task_always_eager=True, task_eager_propagates=True)
+    yield app
+    app.conf.update(previous)
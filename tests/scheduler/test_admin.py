@@ -0,0 +1,59 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import Client
+from django.urls import reverse
+
+from core.utils.admin import EstimatedCountPaginator
+from scheduler.admin import ScheduledJobAdminForm
+from scheduler.models import ScheduledJob
+
+
+@pytest.mark.django_db
+def test_job_changelist_defers_wide_columns_and_filters_on_cached_choices():
+    """
+    The job changelist skips the full count, offers the most common cron expressions
+    and tenants as filter choices, and leaves wide columns unloaded.
+    """
+    for index in range(3):
+        ScheduledJob.objects.create(name=f"Every 5m {index}", task_path="scheduler.tasks.sample_task",
+                                    cron_expression="*/5 * * * *", tenant="acme")
+    ScheduledJob.objects.create(name="Hourly", task_path="scheduler.tasks.sample_task", cron_expression="0 * * * *")
+    client = Client()
+    client.force_login(get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password'))
+
+    url = reverse('admin:scheduler_scheduledjob_changelist')
+    response = client.get(url)
+
+    assert response.status_code == 200
+    changelist = response.context['cl']
+    assert isinstance(changelist.paginator, EstimatedCountPaginator)
+    assert changelist.result_count == 4
+    assert changelist.full_result_count is None
+    choices = {spec.parameter_name: [value for value, _ in spec.lookup_choices] for spec in changelist.filter_specs
+               if hasattr(spec, 'parameter_name')}
+    assert choices['cron_expression'] == ['*/5 * * * *', '0 * * * *']
+    assert choices['tenant'] == ['acme', 'default']
+    deferred, is_defer = changelist.result_list.query.deferred_loading
+    assert is_defer and {'description', 'args', 'kwargs', 'error_message'} <= set(deferred)
+
+    filtered = client.get(url, {'cron_expression': '0 * * * *'})
+    assert [job.name for job in filtered.context['cl'].result_list] == ["Hourly"]
+
+
+@pytest.mark.django_db
+def test_job_admin_form_rejects_dependency_cycles():
+    """
+    An upstream job that would close a cycle is a form error on `upstream_jobs`, not a server error.
+    """
+    upstream = ScheduledJob.objects.create(name="Upstream", task_path="scheduler.tasks.sample_task",
+                                           cron_expression="*/5 * * * *")
+    downstream = ScheduledJob.objects.create(name="Downstream", task_path="scheduler.tasks.sample_task")
+    downstream.upstream_jobs.add(upstream)
+
+    initial = ScheduledJobAdminForm(instance=upstream)
+    data = {name: field.value() for name, field in ((name, initial[name]) for name in initial.fields)
+            if field.value() is not None}
+    form = ScheduledJobAdminForm(data={**data, 'upstream_jobs': [downstream.id]}, instance=upstream)
+
+    assert not form.is_valid()
+    assert list(form.errors) == ['upstream_jobs'] and 'cycle' in form.errors['upstream_jobs'][0]
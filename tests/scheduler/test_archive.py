@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from scheduler.archive import job_archiver
+from scheduler.models import ArchivedJob, JobResult, JobRun, JobStatus, ScheduledJob
+from scheduler.results import result_store
+
+
+@pytest.mark.django_db
+def test_archive_jobs_moves_finished_one_offs_and_api_reads_them():
+    """
+    Finished one-offs past the retention window leave the live table in batches and stay
+    readable, result included, through the archive endpoints; live work is untouched.
+    """
+    long_ago = timezone.now() - timedelta(days=30)
+    finished = [
+        ScheduledJob.objects.create(name=f"Done {i}", task_path="scheduler.tasks.add", one_off_run_time=long_ago,
+                                    status=JobStatus.SUCCESS if i % 2 else JobStatus.FAILED)
+        for i in range(5)
+    ]
+    finished[1].last_result = result_store.save(finished[1], {"total": 42})
+    finished[1].save(update_fields=['last_result'])
+
+    recent = ScheduledJob.objects.create(name="Recent", task_path="scheduler.tasks.add",
+                                         one_off_run_time=timezone.now() - timedelta(hours=1), status=JobStatus.SUCCESS)
+    pending = ScheduledJob.objects.create(name="Pending", task_path="scheduler.tasks.add", one_off_run_time=long_ago)
+    upstream = ScheduledJob.objects.create(name="Upstream", task_path="scheduler.tasks.add",
+                                           one_off_run_time=long_ago, status=JobStatus.SUCCESS)
+    downstream = ScheduledJob.objects.create(name="Downstream", task_path="scheduler.tasks.add",
+                                             cron_expression="0 * * * *", status=JobStatus.SUCCESS)
+    downstream.upstream_jobs.add(upstream)
+
+    call_command('archive_jobs', '--older-than', '7d', '--batch-size', '2')
+
+    assert set(ScheduledJob.objects.values_list('id', flat=True)) == {recent.id, pending.id, upstream.id, downstream.id}
+    assert ArchivedJob.objects.count() == 5
+
+    client = APIClient()
+    response = client.get('/api/v1/scheduler/archive/', {'status': JobStatus.FAILED})
+    assert response.data['count'] == 3
+
+    response = client.get(f'/api/v1/scheduler/archive/{finished[1].id}/result/')
+    assert response.status_code == 200
+    assert response.data['result'] == {"total": 42}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_archive_batch_deletes_with_one_statement_per_table(django_assert_max_num_queries):
+    """
+    Archiving a batch costs a fixed number of queries however many jobs it holds, and
+    writes the deletion history in bulk.
+    """
+    long_ago = timezone.now() - timedelta(days=30)
+    jobs = [
+        ScheduledJob.objects.create(name=f"Done {i}", task_path="scheduler.tasks.add", one_off_run_time=long_ago,
+                                    status=JobStatus.SUCCESS)
+        for i in range(50)
+    ]
+    for job in jobs:
+        job.last_result = result_store.save(job, job.id)
+        job.save(update_fields=['last_result'])
+        JobRun.objects.create(job=job, run_key=f"run-{job.id}", status=JobStatus.SUCCESS)
+
+    with django_assert_max_num_queries(12):
+        assert job_archiver.archive_batch(timezone.now(), 50) == 50
+
+    assert not ScheduledJob.objects.exists()
+    assert not JobResult.objects.exists() and not JobRun.objects.exists()
+    assert ArchivedJob.objects.count() == 50
+    assert ScheduledJob.history.filter(history_type='-', history_change_reason='Archived').count() == 50
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import pytest
+from celery import current_app
+from django.utils import timezone
+from django_celery_beat.models import PeriodicTask, PeriodicTasks
+
+from core.utils.scheduler.beat_sync import IncrementalDatabaseScheduler
+from scheduler.models import ScheduledJob
+from scheduler.priority import deadline_priority
+from scheduler.services import job_service
+from scheduler.tasks import run_scheduled_job
+
+
+def _create_cron_job(cron_expression="*/5 * * * *"):
+    job = ScheduledJob.objects.create(name="Beat Job", task_path="scheduler.tasks.sample_task",
+                                      cron_expression=cron_expression)
+    job_service.refresh_job(job)
+    return job
+
+
+@pytest.mark.django_db
+def test_refresh_updates_periodic_task_in_place():
+    """
+    Editing a cron job updates its PeriodicTask row instead of recreating it,
+    and never bumps the full-reload timestamp.
+    """
+    job = _create_cron_job()
+    _create_cron_job(cron_expression="0 * * * *")  # new CrontabSchedule rows do signal a reload
+    task = PeriodicTask.objects.get(name=f"scheduler.job.{job.id}")
+    last_change = PeriodicTasks.last_change()
+
+    job.cron_expression = "0 * * * *"
+    job.save()
+    job_service.refresh_job(job)
+
+    updated = PeriodicTask.objects.get(name=f"scheduler.job.{job.id}")
+    assert updated.id == task.id
+    assert updated.crontab.minute == "0"
+    assert updated.date_changed > task.date_changed
+    assert PeriodicTasks.last_change() == last_change
+
+
+@pytest.mark.django_db
+def test_incremental_scheduler_applies_changed_rows():
+    """
+    The scheduler patches changed entries in memory and skips unchanged rows.
+    """
+    job = _create_cron_job()
+    _create_cron_job(cron_expression="15 * * * *")
+    name = f"scheduler.job.{job.id}"
+    scheduler = IncrementalDatabaseScheduler(app=current_app)
+    assert str(scheduler.schedule[name].schedule._orig_minute) == "*/5"
+
+    scheduler._next_poll = 0
+    scheduler.schedule
+    assert scheduler.apply_changes() == 0
+
+    job.cron_expression = "15 * * * *"
+    job.save()
+    job_service.refresh_job(job)
+    scheduler._next_poll = 0
+    full_sync = scheduler._last_full_sync
+
+    assert str(scheduler.schedule[name].schedule._orig_minute) == "15"
+    assert scheduler._last_full_sync == full_sync
+
+    job_service.set_active(ScheduledJob.objects.filter(id=job.id), False)
+    scheduler._next_poll = 0
+
+    assert name not in scheduler.schedule
+
+
+@pytest.mark.django_db
+def test_beat_fires_carry_deadline_priority_and_expiry(settings, monkeypatch):
+    """
+    Beat computes each cron fire's priority and expiry when sending it: the run expires when
+    the next fire is dispatched, or at the job's end_time if that comes first.
+    """
+    settings.SCHEDULER_DEADLINE_PRIORITY_BANDS = [60, 300, 1800]
+    now = datetime(2030, 1, 1, 12, 0, 5, tzinfo=dt_timezone.utc)
+    frequent = _create_cron_job(cron_expression="* * * * *")
+    hourly = _create_cron_job(cron_expression="0 * * * *")
+    ending = ScheduledJob.objects.create(name="Ending", task_path="scheduler.tasks.sample_task",
+                                         cron_expression="0 * * * *", spread_seconds=30,
+                                         end_time=now + timedelta(seconds=45))
+    job_service.refresh_job(ending)
+
+    def options(job):
+        task = PeriodicTask.objects.get(name=f"scheduler.job.{job.id}")
+        assert task.priority is None
+        return deadline_priority.periodic_task_options(task, now)
+
+    assert options(frequent) == {'priority': 0, 'expires': now.replace(second=0) + timedelta(minutes=1)}
+    assert options(hourly) == {'priority': 3, 'expires': now.replace(minute=0, second=0) + timedelta(hours=1)}
+    assert options(ending) == {'priority': 0, 'expires': ending.end_time}
+
+    sent = []
+    monkeypatch.setattr(run_scheduled_job, 'apply_async', lambda args, kwargs, **options: sent.append(options))
+    scheduler = IncrementalDatabaseScheduler(app=current_app)
+    scheduler.apply_async(scheduler.schedule[f"scheduler.job.{frequent.id}"])
+
+    [sent_options] = sent
+    assert sent_options['priority'] == 0
+    assert sent_options['expires'] - timezone.now() <= timedelta(minutes=1)
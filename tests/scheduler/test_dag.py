@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from scheduler.models import ScheduledJob, JobStatus
+from scheduler.tasks import run_scheduled_job
+
+
+def _job(name, **kwargs):
+    kwargs.setdefault('cron_expression', '0 * * * *')
+    return ScheduledJob.objects.create(name=name, task_path="scheduler.tasks.add", args=[1, 1], **kwargs)
+
+
+@pytest.mark.django_db
+def test_dependency_cycle_is_rejected():
+    """
+    Declaring an upstream that already depends on the job raises a validation error.
+    """
+    extract, transform, load = _job("extract"), _job("transform"), _job("load")
+    transform.upstream_jobs.add(extract)
+    load.upstream_jobs.add(transform)
+
+    with pytest.raises(ValidationError):
+        extract.upstream_jobs.add(load)
+
+
+@pytest.mark.django_db
+def test_downstream_runs_once_all_upstreams_succeed(celery_eager):
+    """
+    A fan-in job is triggered only after its last upstream job finishes
+    (the downstream group runs eagerly, in-process).
+    """
+    left, right = _job("left"), _job("right")
+    join = _job("join", cron_expression=None)
+    join.upstream_jobs.add(left, right)
+
+    run_scheduled_job.apply(args=(left.id,))
+    join.refresh_from_db()
+    assert join.last_run_at is None
+
+    run_scheduled_job.apply(args=(right.id,))
+    join.refresh_from_db()
+    assert join.status == JobStatus.SUCCESS
+    assert join.last_run_at > timezone.now() - timedelta(minutes=1)
@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from scheduler.models import JobResult, JobRun, JobStats, ScheduledJob, JobStatus
+from scheduler.results import result_store
+
+
+@pytest.mark.django_db
+def test_runtime_updates_skip_history():
+    """
+    Saves touching only runtime fields do not write history rows; definition edits do.
+    """
+    job = ScheduledJob.objects.create(
+        name="Audited Job",
+        task_path="scheduler.tasks.sample_task",
+        cron_expression="*/5 * * * *",
+    )
+    assert job.history.count() == 1
+
+    job.status = JobStatus.RUNNING
+    job.last_run_at = timezone.now()
+    job.save(update_fields=['status', 'last_run_at', 'updated_at'])
+    assert job.history.count() == 1
+
+    job.cron_expression = "*/10 * * * *"
+    job.save(update_fields=['cron_expression', 'updated_at'])
+    assert job.history.count() == 2
+
+
+@pytest.mark.django_db
+def test_prune_job_history_deletes_old_records_in_batches():
+    """
+    `prune_job_history` removes only records older than the cutoff.
+    """
+    job = ScheduledJob.objects.create(
+        name="Pruned Job",
+        task_path="scheduler.tasks.sample_task",
+        cron_expression="*/5 * * * *",
+    )
+    for minute in range(3):
+        job.name = f"Pruned Job {minute}"
+        job.save()
+    job.history.filter(history_type='~').update(history_date=timezone.now() - timedelta(days=40))
+
+    call_command('prune_job_history', older_than='30d', batch_size=2)
+
+    assert list(job.history.values_list('history_type', flat=True)) == ['+']
+
+
+@pytest.mark.django_db
+def test_prune_job_data_keeps_latest_results_and_recent_rows():
+    """
+    `prune_job_data` removes old finished runs, stats buckets and unreferenced results,
+    but keeps running claims and each job's latest result.
+    """
+    job = ScheduledJob.objects.create(
+        name="Pruned Data Job",
+        task_path="scheduler.tasks.sample_task",
+        cron_expression="*/5 * * * *",
+    )
+    old = timezone.now() - timedelta(days=40)
+    orphan = result_store.save(job, "superseded")
+    job.last_result = result_store.save(job, "latest")
+    job.save(update_fields=['last_result'])
+    JobResult.objects.update(created_at=old)
+    JobRun.objects.create(job=job, run_key="old", status=JobStatus.SUCCESS)
+    JobRun.objects.create(job=job, run_key="running")
+    JobRun.objects.create(job=job, run_key="recent", status=JobStatus.SUCCESS)
+    JobRun.objects.exclude(run_key="recent").update(claimed_at=old)
+    JobStats.objects.create(job=job, task_path=job.task_path, bucket=old)
+
+    call_command('prune_job_data', older_than='30d', batch_size=1)
+
+    assert list(JobResult.objects.values_list('id', flat=True)) == [job.last_result_id]
+    assert not JobResult.objects.filter(id=orphan.id).exists()
+    assert sorted(JobRun.objects.values_list('run_key', flat=True)) == ['recent', 'running']
+    assert not JobStats.objects.exists()
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import fakeredis
+import pytest
+
+from core.utils.scheduler.redis_index_engine import RedisIndexSchedulerEngine
+from scheduler.models import ScheduledJob
+from scheduler.tasks import run_scheduled_job
+from scheduler.tenants import tenant_quotas
+
+NOW = datetime(2030, 1, 1, 12, 0, 40, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def index(monkeypatch):
+    """
+    An index engine on an in-memory Redis, recording dispatched messages instead of sending them.
+    """
+    client = fakeredis.FakeRedis()
+    monkeypatch.setattr('core.utils.scheduler.redis_index_engine.get_redis_client', lambda: client)
+    engine = RedisIndexSchedulerEngine()
+    engine.dispatched = []
+    monkeypatch.setattr(run_scheduled_job, 'apply_async',
+                        lambda args, kwargs, **options: engine.dispatched.append((args[0], kwargs['run_key'], options)))
+    tenant_quotas.invalidate()
+    return engine
+
+
+def _job(name, tenant='default', **kwargs):
+    kwargs.setdefault('cron_expression', '* * * * *')
+    return ScheduledJob.objects.create(name=name, tenant=tenant, task_path="scheduler.tasks.sample_task", **kwargs)
+
+
+def _members(engine, key):
+    return {int(member): score for member, score in engine.client.zrange(key, 0, -1, withscores=True)}
+
+
+@pytest.mark.django_db
+def test_dispatch_pops_due_jobs_and_advances_them(index):
+    """
+    Due members are claimed once, dispatched with their logical fire in the run key and
+    their deadline options, and re-indexed at their next fire plus the spread offset.
+    """
+    end_time = NOW + timedelta(hours=1)
+    job = _job("Spread", spread_seconds=30, end_time=end_time)
+    later = _job("Later")
+    fire = NOW.replace(second=0)
+    index._add(index.client, job, fire.timestamp() + job.spread_offset)
+    index._add(index.client, later, (NOW + timedelta(minutes=5)).timestamp())
+
+    assert index.dispatch_due(now=NOW) == 1
+    assert index.dispatch_due(now=NOW) == 0
+
+    [(job_id, run_key, options)] = index.dispatched
+    assert (job_id, run_key) == (job.id, f"{job.id}:{fire.isoformat()}")
+    next_run_at = fire + timedelta(minutes=1, seconds=job.spread_offset)
+    assert options == {'priority': 0, 'expires': next_run_at}
+    assert _members(index, index.tenant_key('default')) == {
+        job.id: next_run_at.timestamp(),
+        later.id: (NOW + timedelta(minutes=5)).timestamp(),
+    }
+    assert not index.client.exists(index.processing_key('default'))
+    job.refresh_from_db()
+    assert job.next_run_at == next_run_at
+
+
+@pytest.mark.django_db
+def test_pop_due_shares_batches_between_tenants(index, settings):
+    """
+    A batch is filled across tenants' sets rather than drained from the busiest one.
+    """
+    settings.SCHEDULER_TENANT_QUANTUM = 1
+    for position in range(3):
+        index._add(index.client, _job(f"Acme {position}", tenant='acme'), NOW.timestamp() - 60)
+    index._add(index.client, _job("Globex", tenant='globex'), NOW.timestamp() - 60)
+
+    claimed = index.pop_due(now=NOW, limit=2)
+
+    assert sorted(tenant for _, _, tenant in claimed) == ['acme', 'globex']
+    assert index.client.zcard(index.processing_key('acme')) == 1
+
+
+@pytest.mark.django_db
+def test_dispatch_after_an_outage_runs_missed_fires_once(index):
+    """
+    A cron job whose fire is hours in the past runs once and resumes after now,
+    instead of replaying every missed minute.
+    """
+    job = _job("Minutely", spread_seconds=0)
+    index._add(index.client, job, (NOW - timedelta(hours=3)).timestamp())
+
+    for _ in range(5):
+        index.dispatch_due(now=NOW)
+
+    assert len(index.dispatched) == 1
+    next_fire = NOW.replace(second=0) + timedelta(minutes=1)
+    assert _members(index, index.tenant_key('default')) == {job.id: next_fire.timestamp()}
+
+
+@pytest.mark.django_db
+def test_crashed_dispatch_keeps_jobs_for_rebuild(index, monkeypatch):
+    """
+    Jobs claimed by a dispatcher that fails before re-adding them stay in the processing
+    set, and a rebuild indexes every active job again, per tenant.
+    """
+    job = _job("Claimed")
+    other = _job("Other tenant", tenant='acme', spread_seconds=0)
+    inactive = _job("Inactive", is_active=False)
+    index._add(index.client, job, NOW.timestamp() - 60)
+    index._add(index.client, inactive, NOW.timestamp() + 60)
+
+    def broker_down(*args, **kwargs):
+        raise ConnectionError("broker down")
+
+    monkeypatch.setattr(run_scheduled_job, 'apply_async', broker_down)
+    with pytest.raises(ConnectionError):
+        index.dispatch_due(now=NOW)
+    assert _members(index, index.processing_key('default')) == {job.id: NOW.timestamp() - 60}
+    assert job.id not in _members(index, index.tenant_key('default'))
+
+    assert index.rebuild(chunk_size=1) == 2
+
+    assert set(_members(index, index.tenant_key('default'))) == {job.id}
+    assert set(_members(index, index.tenant_key('acme'))) == {other.id}
+    assert not index.client.exists(index.processing_key('default'))
+    assert {tenant.decode() for tenant in index.client.smembers(index.tenants_key)} == {'default', 'acme'}
+
+
+@pytest.mark.django_db
+def test_set_enabled_removes_and_reindexes_jobs(index):
+    """
+    Bulk toggling drops jobs from their tenant sets and re-adds them at their next fire.
+    """
+    jobs = [_job("Toggled"), _job("Toggled acme", tenant='acme')]
+    ids = [job.id for job in jobs]
+    assert index.set_enabled(ids, True) == set(ids)
+    assert index.client.zcard(index.tenant_key('default')) == index.client.zcard(index.tenant_key('acme')) == 1
+
+    assert index.set_enabled(ids, False) == set(ids)
+
+    assert not index.client.zcard(index.tenant_key('default'))
+    assert not index.client.zcard(index.tenant_key('acme'))
@@ -0,0 +1,50 @@
+import pytest
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from scheduler.models import ScheduledJob
+from utils.db.middleware import PIN_COOKIE, replica_routing_middleware
+from utils.db.routers import ReplicaRouter, replica_reads
+
+
+@pytest.mark.django_db(transaction=True)
+def test_router_reads_from_replica_until_the_request_writes(settings):
+    """
+    Marked reads go to one replica, but not inside a transaction or once the request wrote;
+    unmarked code (workers, commands) always reads from the primary.
+    """
+    settings.DATABASE_REPLICAS = ['replica1']
+
+    assert ReplicaRouter.db_for_read(ScheduledJob) == 'default'
+    with replica_reads() as routing:
+        assert ReplicaRouter.db_for_read(ScheduledJob) == 'replica1'
+        settings.DATABASE_REPLICAS = ['replica1', 'replica2']
+        assert {ReplicaRouter.db_for_read(ScheduledJob) for _ in range(20)} == {'replica1'}
+        with transaction.atomic():
+            assert ReplicaRouter.db_for_read(ScheduledJob) == 'default'
+        assert ReplicaRouter.db_for_write(ScheduledJob) == 'default'
+        assert routing.wrote
+        assert ReplicaRouter.db_for_read(ScheduledJob) == 'default'
+    assert not ReplicaRouter.allow_migrate('replica1', 'scheduler')
+
+
+def test_middleware_pins_clients_to_the_primary_after_a_mutation(settings):
+    """
+    GETs read from a replica; a POST sets the pin cookie, and requests carrying it read from the primary.
+    """
+    settings.DATABASE_REPLICAS = ['replica1']
+    middleware = replica_routing_middleware(lambda request: HttpResponse(ReplicaRouter.db_for_read(ScheduledJob)))
+    factory = RequestFactory()
+
+    response = middleware(factory.get('/api/jobs/'))
+    assert response.content == b'replica1'
+    assert PIN_COOKIE not in response.cookies
+
+    response = middleware(factory.post('/api/jobs/'))
+    assert response.content == b'default'
+    assert response.cookies[PIN_COOKIE]['max-age'] == settings.DATABASE_REPLICA_PIN_SECONDS
+
+    pinned = factory.get('/api/jobs/')
+    pinned.COOKIES[PIN_COOKIE] = '1'
+    assert middleware(pinned).content == b'default'
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import pytest
+from django.utils import timezone
+
+from core.utils.scheduler.spread import spread_offset
+from scheduler.models import JobStats, ScheduledJob, JobStatus
+from scheduler.priority import deadline_priority
+from scheduler.services import job_service
+from scheduler.stats import job_stats
+
+
+@pytest.mark.django_db
+def test_reap_stale_jobs_fails_expired_leases_only():
+    """
+    RUNNING jobs whose heartbeat lease expired are failed in bulk; live ones are left alone.
+    """
+    now = timezone.now()
+    stale = ScheduledJob.objects.create(
+        name="Stale Job",
+        task_path="scheduler.tasks.sample_task",
+        cron_expression="* * * * *",
+        status=JobStatus.RUNNING,
+        heartbeat_at=now - timedelta(minutes=10),
+    )
+    live = ScheduledJob.objects.create(
+        name="Live Job",
+        task_path="scheduler.tasks.sample_task",
+        cron_expression="* * * * *",
+        status=JobStatus.RUNNING,
+        heartbeat_at=now,
+    )
+
+    reaped = job_service.reap_stale_jobs(lease_seconds=120, requeue=False)
+
+    assert reaped == [stale.id]
+    stale.refresh_from_db()
+    live.refresh_from_db()
+    assert stale.status == JobStatus.FAILED
+    assert "heartbeat" in stale.error_message
+    assert live.status == JobStatus.RUNNING
+
+
+@pytest.mark.django_db
+def test_spread_offset_is_deterministic_and_bounded(settings):
+    """
+    Jobs sharing a cron slot get stable offsets inside their spread window;
+    a zero window disables spreading.
+    """
+    settings.SCHEDULER_DEFAULT_SPREAD_SECONDS = 0
+    jobs = [
+        ScheduledJob.objects.create(name=f"Spread {index}", task_path="scheduler.tasks.sample_task",
+                                    cron_expression="*/5 * * * *", spread_seconds=60)
+        for index in range(20)
+    ]
+    offsets = [job.spread_offset for job in jobs]
+
+    assert all(0 <= offset < 60 for offset in offsets)
+    assert len(set(offsets)) > 1
+    assert offsets == [ScheduledJob.objects.get(id=job.id).spread_offset for job in jobs]
+
+    jobs[0].spread_seconds = None
+    assert jobs[0].spread_offset == 0
+
+
+@pytest.mark.django_db
+def test_default_spread_window_stays_below_the_cron_interval(settings):
+    """
+    The global default window is clamped to just under each job's cron interval.
+    """
+    settings.SCHEDULER_DEFAULT_SPREAD_SECONDS = 300
+    minutely = [
+        ScheduledJob.objects.create(name=f"Minutely {index}", task_path="scheduler.tasks.sample_task",
+                                    cron_expression="* * * * *")
+        for index in range(50)
+    ]
+    hourly = ScheduledJob.objects.create(name="Hourly", task_path="scheduler.tasks.sample_task",
+                                         cron_expression="0 * * * *")
+
+    assert max(job.spread_offset for job in minutely) < 60
+    assert hourly.spread_offset == spread_offset(hourly.id, 300)
+
+
+@pytest.mark.django_db
+def test_deadline_priority_orders_runs_by_slack(settings):
+    """
+    Runs closest to their deadline (end_time or the next cron dispatch) get the most urgent broker
+    priority and expire at it; runs without a deadline get the lowest.
+    """
+    settings.SCHEDULER_DEADLINE_PRIORITY_BANDS = [60, 300, 1800]
+    now = datetime(2030, 1, 1, tzinfo=dt_timezone.utc)
+
+    def job(**fields):
+        return ScheduledJob(id=1, name="Deadline", task_path="scheduler.tasks.sample_task", **fields)
+
+    expiring = job(one_off_run_time=now, end_time=now + timedelta(seconds=30))
+    assert deadline_priority.priority(expiring, now, now) == 0
+    assert deadline_priority.priority(job(one_off_run_time=now, end_time=now + timedelta(minutes=10)), now, now) == 2
+    assert deadline_priority.priority(job(cron_expression="* * * * *"), now, now) == 0
+    assert deadline_priority.priority(job(cron_expression="*/5 * * * *"), now, now) == 1
+    assert deadline_priority.priority(job(cron_expression="0 * * * *", end_time=now + timedelta(days=1)), now, now) == 3
+    assert deadline_priority.priority(job(one_off_run_time=now), now, now) == 3
+    assert deadline_priority.options(expiring, now, now) == {'priority': 0, 'expires': expiring.end_time}
+    assert deadline_priority.options(job(cron_expression="*/5 * * * *", spread_seconds=0), now, now) == {
+        'priority': 1, 'expires': now + timedelta(minutes=5),
+    }
+    spread = job(cron_expression="*/5 * * * *", spread_seconds=30)
+    assert deadline_priority.deadline(spread, now) == now + timedelta(minutes=5, seconds=spread.spread_offset)
+
+    # Runs dispatched late have less slack left
+    late = job(one_off_run_time=now, end_time=now + timedelta(minutes=10))
+    assert deadline_priority.priority(late, now, now + timedelta(minutes=8)) == 1
+
+    settings.SCHEDULER_DEADLINE_PRIORITY = False
+    assert deadline_priority.options(job(cron_expression="* * * * *"), now, now) == {}
+    assert deadline_priority.options(expiring, now, now) == {'expires': expiring.end_time}
+
+
+@pytest.mark.django_db
+def test_stats_record_increments_buckets_in_place(django_assert_num_queries):
+    """
+    The first run of the hour inserts the job and task path buckets; later runs add to them
+    with one UPDATE each, histogram bin included.
+    """
+    job = ScheduledJob.objects.create(name="Counted", task_path="scheduler.tasks.add", cron_expression="* * * * *")
+    finished_at = datetime(2030, 1, 1, 12, 30, tzinfo=dt_timezone.utc)
+
+    job_stats.record(job, succeeded=True, duration_ms=5, finished_at=finished_at)
+    with django_assert_num_queries(2):
+        job_stats.record(job, succeeded=False, duration_ms=7, finished_at=finished_at)
+    job_stats.record(job, succeeded=True, duration_ms=40, finished_at=finished_at)
+
+    for stats in (JobStats.objects.get(job=job), JobStats.objects.get(job__isnull=True, task_path=job.task_path)):
+        assert (stats.runs, stats.successes, stats.failures) == (3, 2, 1)
+        assert (stats.total_duration_ms, stats.max_duration_ms) == (52, 40)
+        assert stats.histogram[:3] == [2, 0, 1] and sum(stats.histogram) == 3
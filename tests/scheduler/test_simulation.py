@@ -0,0 +1,55 @@
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from scheduler.models import ScheduledJob, TenantQuota
+from scheduler.simulation import ScheduleSimulator
+from scheduler.tenants import tenant_quotas
+
+START = datetime(2030, 1, 1, tzinfo=dt_timezone.utc)
+END = datetime(2030, 1, 1, 1, tzinfo=dt_timezone.utc)
+
+
+@pytest.mark.django_db
+def test_simulation_reports_dispatch_peaks_overlaps_and_deferrals():
+    """
+    Replaying an hour yields exact dispatch counts, per-second peaks, overlapping runs
+    and runs deferred by tenant quotas.
+    """
+    for i in range(3):
+        ScheduledJob.objects.create(name=f"Minutely {i}", task_path="scheduler.tasks.add",
+                                    cron_expression="* * * * *", spread_seconds=0)
+    ScheduledJob.objects.create(name="Quota", tenant="acme", task_path="scheduler.tasks.add",
+                                cron_expression="*/30 * * * *", spread_seconds=0)
+    TenantQuota.objects.create(tenant="acme", max_runs_per_minute=0)
+    tenant_quotas.invalidate()
+
+    report = ScheduleSimulator(START, END, default_duration=90,
+                               extra_jobs=[("*/15 * * * *", 4, 0)]).run()
+
+    assert report['jobs'] == 8
+    assert report['dispatches'] == 3 * 60 + 4 * 4
+    assert report['peak_per_second'] == 7
+    assert report['busiest_seconds'][0][0] == START
+    assert report['peak_concurrency'] == 3 * 2 + 4
+    assert report['overlaps'] == 3 * 59
+    assert report['deferred'] > 0 and report['dropped'] == 2
+
+
+@pytest.mark.django_db
+def test_simulate_schedule_command_enforces_budgets():
+    """
+    The command doubles as a regression check: exceeding a budget fails it.
+    """
+    args = ['--from', START.isoformat(), '--to', END.isoformat(), '--add', '* * * * *', '50', '--spread', '0']
+    output = StringIO()
+    call_command('simulate_schedule', *args, '--max-per-second', '50', stdout=output)
+    assert 'Dispatches:            3000' in output.getvalue()
+
+    with pytest.raises(CommandError, match='dispatches/s exceeds 10'):
+        call_command('simulate_schedule', *args, '--max-per-second', '10', stdout=StringIO())
+
+    call_command('simulate_schedule', '--from', START.isoformat(), '--to', END.isoformat(),
+                 '--add', '* * * * *', '50', '--spread', '60', '--max-per-second', '10', stdout=StringIO())
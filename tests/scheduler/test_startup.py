@@ -0,0 +1,21 @@
+from core.utils.startup import measure_imports
+
+# Generous ceiling for a cold worker start-up; a regression adding a heavy import chain trips it
+WORKER_STARTUP_BUDGET_MS = 3000
+
+# Packages the worker profile must not load: the web/API stack and on-demand tooling
+WORKER_EXCLUDED_MODULES = (
+    'drf_yasg', 'rest_framework', 'corsheaders', 'whitenoise', 'django_filters', 'psutil', 'cProfile',
+)
+
+
+def test_worker_profile_skips_web_stack_and_stays_within_budget():
+    """
+    Booting with the worker settings registers the tasks without importing the API/docs stack.
+    """
+    report = measure_imports('config.settings.worker', env={'DJANGO_ENV': 'test'})
+
+    assert 'scheduler.tasks' in report['imported']
+    for module in WORKER_EXCLUDED_MODULES:
+        assert not any(name == module or name.startswith(module + '.') for name in report['imported'])
+    assert report['wall_ms'] < WORKER_STARTUP_BUDGET_MS
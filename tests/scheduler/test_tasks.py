@@ -1,9 +1,20 @@
+import asyncio
+import logging
+import threading
+import time
 from datetime import timedelta
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 
-from scheduler.models import ScheduledJob, JobStatus
+from core.utils.metrics import get_counter
+from scheduler.async_runner import AsyncJobRunner
+from scheduler.claims import run_claims
+from scheduler.memo import result_cache
+from scheduler.models import ScheduledJob, JobStatus, JobResult, JobRun, ResultBackendMode
+from scheduler.results import result_store
+from scheduler.services import job_service
 from scheduler.tasks import add
 from scheduler.tasks import run_scheduled_job
 
@@ -30,6 +41,7 @@ def test_run_send_email_task_via_scheduled_job(caplog):
     - Job status is updated appropriately
     - Logs and result are persisted correctly
     """
+    caplog.set_level(logging.INFO)
 
     # Create a ScheduledJob targeting the send_email_task
     job = ScheduledJob.objects.create(
@@ -48,17 +60,14 @@ def test_run_send_email_task_via_scheduled_job(caplog):
     assert result.successful(), "Celery task did not execute successfully"
 
     # Validate expected output from send_email_task
-    expected_output = (
-        "Sending email to test@example.com\n"
-        "Subject: Hello\n"
-        "Body: This is a test."
-    )
+    expected_output = "Email sent to test@example.com with subject: Hello"
     assert expected_output in result.result
 
     # Validate job database state updates
     job.refresh_from_db()
     assert job.status == JobStatus.SUCCESS
-    assert job.result and expected_output in job.result
+    assert job.last_result and job.result_digest == job.last_result.digest
+    assert expected_output in result_store.load(job.last_result)
     assert job.last_run_at is not None
 
     # Validate log output
@@ -66,3 +75,237 @@ def test_run_send_email_task_via_scheduled_job(caplog):
         "executed successfully" in record.message.lower()
         for record in caplog.records
     ), "Expected success log not found"
+
+
+@pytest.mark.django_db
+def test_run_scheduled_job_soft_time_limit_marks_job_failed():
+    """
+    A job exceeding its `soft_time_limit` is interrupted and recorded as failed
+    with a timeout error instead of holding the worker.
+    """
+    job = ScheduledJob.objects.create(
+        name="Slow Job",
+        task_path="time.sleep",
+        args=[5],
+        soft_time_limit=1,
+        is_active=True,
+        one_off_run_time=timezone.now() + timedelta(seconds=1),
+    )
+
+    result = run_scheduled_job.apply(args=(job.id,))
+
+    assert result.successful()
+    job.refresh_from_db()
+    assert job.status == JobStatus.FAILED
+    assert "time limit" in job.error_message
+
+
+@pytest.mark.django_db
+def test_result_store_compresses_large_results():
+    """
+    Large results are stored compressed and untruncated, and read back intact.
+    """
+    job = ScheduledJob.objects.create(
+        name="Report Job",
+        task_path="scheduler.tasks.add",
+        cron_expression="0 * * * *",
+    )
+    value = {"rows": [{"id": i, "label": "row"} for i in range(1000)]}
+
+    job_result = result_store.save(job, value)
+
+    assert job_result.compression == 'zlib'
+    assert len(job_result.payload) < job_result.size
+    assert result_store.load(job_result) == value
+
+
+@pytest.mark.django_db
+def test_run_scheduled_job_skips_duplicate_delivery():
+    """
+    A redelivered dispatch carrying an already-claimed run key is acked without running again.
+    """
+    job = ScheduledJob.objects.create(
+        name="Idempotent Job",
+        task_path="scheduler.tasks.add",
+        args=[1, 2],
+        one_off_run_time=timezone.now() + timedelta(seconds=1),
+    )
+    run_key = run_claims.one_off_run_key(job)
+
+    first = run_scheduled_job.apply(args=(job.id,), kwargs={'run_key': run_key})
+    second = run_scheduled_job.apply(args=(job.id,), kwargs={'run_key': run_key})
+
+    assert first.result == 3
+    assert second.result is None
+    assert JobRun.objects.filter(job=job).count() == 1
+    assert JobRun.objects.get(job=job).status == JobStatus.SUCCESS
+
+
+@pytest.mark.django_db
+def test_sampled_run_stores_phase_profile(settings):
+    """
+    Sampled runs store per-phase timings and query counts on their JobRun,
+    plus a cProfile capture once they exceed the slow threshold.
+    """
+    settings.SCHEDULER_PROFILE_SAMPLE_RATE = 1
+    settings.SCHEDULER_PROFILE_SLOW_MS = 0
+    settings.SCHEDULER_PROFILE_CPROFILE = True
+    job = ScheduledJob.objects.create(name="Profiled", task_path="scheduler.tasks.add", args=[2, 3],
+                                      cron_expression="* * * * *")
+
+    run_scheduled_job.apply(args=[job.id])
+
+    profile = JobRun.objects.get(job=job).profile
+    assert list(profile['phases']) == ['load', 'mark-running', 'resolve', 'execute', 'persist']
+    assert profile['phases']['load']['queries'] == 1
+    assert profile['phases']['persist']['queries'] > 0
+    assert 'function calls' in profile['cprofile']
+
+
+@pytest.mark.django_db
+def test_async_callable_job_runs_in_eager_mode():
+    """
+    `task_path` may point to an `async def` callable; outside a worker loop it runs to completion in place.
+    """
+    job = ScheduledJob.objects.create(name="Async Job", task_path="scheduler.tasks.sample_async_task",
+                                      kwargs={"delay": 0}, cron_expression="* * * * *")
+
+    result = run_scheduled_job.apply(args=[job.id])
+
+    assert result.result == "Waited 0s"
+    job.refresh_from_db()
+    assert job.status == JobStatus.SUCCESS
+
+
+def test_async_runner_overlaps_jobs_up_to_in_flight_cap(settings):
+    """
+    One process runs many I/O-bound coroutines concurrently, never more than the in-flight cap.
+    """
+    settings.SCHEDULER_ASYNC_MAX_IN_FLIGHT = 10
+    settings.SCHEDULER_HEARTBEAT_INTERVAL = 0
+    runner = AsyncJobRunner()
+    running, peak, outcomes = [0], [0], []
+
+    async def io_bound(value):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.1)
+        running[0] -= 1
+        return value
+
+    started = time.monotonic()
+    for i in range(40):
+        runner.submit(ScheduledJob(id=i), io_bound(i), on_done=lambda result, error: outcomes.append(result))
+    assert runner.drain(timeout=10) == 0
+
+    assert sorted(outcomes) == list(range(40))
+    assert peak[0] == 10
+    assert time.monotonic() - started < 40 * 0.1 / 2
+
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'memo-tests'}}
+
+
+def counted_call(x, y):
+    """
+    Deterministic job callable counting its invocations.
+    """
+    counted_call.calls += 1
+    return x * y
+
+
+@pytest.mark.django_db
+def test_memoized_job_reuses_cached_result(settings):
+    """
+    Within `result_cache_ttl`, jobs making the same call are served from the cache without invoking the callable.
+    """
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+    counted_call.calls = 0
+    jobs = [
+        ScheduledJob.objects.create(name=f"Memoized {i}", task_path="tests.scheduler.test_tasks.counted_call",
+                                    args=[6, 7], result_cache_ttl=60, cron_expression="* * * * *")
+        for i in range(2)
+    ]
+
+    results = [run_scheduled_job.apply(args=[job.id]).result for job in jobs + jobs]
+
+    assert results == [42] * 4
+    assert counted_call.calls == 1
+    assert get_counter('scheduler.result_cache.miss') == 1
+    assert get_counter('scheduler.result_cache.hit') == 3
+    assert JobRun.objects.filter(status=JobStatus.SUCCESS).count() == 4
+
+    # A different call is computed separately
+    other = ScheduledJob.objects.create(name="Memoized other", task_path="tests.scheduler.test_tasks.counted_call",
+                                        args=[2, 3], result_cache_ttl=60, cron_expression="* * * * *")
+    assert run_scheduled_job.apply(args=[other.id]).result == 6
+    assert counted_call.calls == 2
+
+
+@pytest.mark.django_db
+def test_memoized_job_waits_for_in_flight_identical_call(settings):
+    """
+    While an identical call holds the single-flight lock, a run waits for its result instead of computing.
+    """
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+    settings.SCHEDULER_RESULT_CACHE_POLL_INTERVAL = 0.01
+    counted_call.calls = 0
+    job = ScheduledJob.objects.create(name="Memoized waiter", task_path="tests.scheduler.test_tasks.counted_call",
+                                      args=[4, 5], result_cache_ttl=60, cron_expression="* * * * *")
+    key = result_cache.key(job)
+    cache.add(f"{key}:lock", 1, timeout=60)
+    threading.Timer(0.1, lambda: cache.set(key, 20, timeout=60)).start()
+
+    assert run_scheduled_job.apply(args=[job.id]).result == 20
+    assert counted_call.calls == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.filterwarnings('ignore:Results are not stored in backend')
+def test_result_backend_mode_controls_backend_writes():
+    """
+    Runs leave nothing in the Celery result backend by default; jobs opt into a digest reference or the full result.
+    """
+    modes = [ResultBackendMode.NONE, ResultBackendMode.DIGEST, ResultBackendMode.FULL]
+    jobs = {
+        mode: ScheduledJob.objects.create(name=f"Backend {mode}", task_path="scheduler.tasks.add", args=[2, 2],
+                                          result_backend=mode, cron_expression="* * * * *")
+        for mode in modes
+    }
+
+    entries = {}
+    for mode, job in jobs.items():
+        run = run_scheduled_job.apply(args=[job.id])
+        assert run.result == 4
+        entries[mode] = run_scheduled_job.backend.get_task_meta(run.id)
+
+    assert entries[ResultBackendMode.NONE]['status'] == 'PENDING'
+    job = jobs[ResultBackendMode.DIGEST]
+    job.refresh_from_db()
+    assert entries[ResultBackendMode.DIGEST]['result'] == {
+        'job_id': job.id, 'result_id': job.last_result_id, 'digest': job.result_digest,
+    }
+    assert entries[ResultBackendMode.FULL]['result'] == 4
+    assert ScheduledJob._meta.get_field('result_backend').default == ResultBackendMode.NONE
+
+
+@pytest.mark.django_db(transaction=True)
+def test_success_deletes_the_superseded_result():
+    """
+    Each successful run replaces the job's stored result instead of accumulating rows.
+    """
+    job = ScheduledJob.objects.create(
+        name="Replaced Result Job",
+        task_path="scheduler.tasks.add",
+        args=[1, 2],
+        cron_expression="*/5 * * * *",
+    )
+
+    job_service.handle_job_success(job, result=3)
+    first_id = job.last_result_id
+    job_service.handle_job_success(job, result=4)
+
+    assert list(JobResult.objects.filter(job=job).values_list('id', flat=True)) == [job.last_result_id]
+    assert job.last_result_id != first_id
@@ -0,0 +1,64 @@
+import pytest
+from django_celery_beat.models import PeriodicTask
+from rest_framework.test import APIClient
+
+from scheduler.models import JobTemplate
+from scheduler.tasks import expand_job_template
+
+
+@pytest.mark.django_db
+def test_template_fire_expands_parameters_into_batches(caplog, celery_eager):
+    """
+    A template has one periodic task however many instances it has, and each fire runs
+    every active parameter row in batches of `batch_size` (eagerly, in-process).
+    """
+    client = APIClient()
+    response = client.post('/api/v1/scheduler/templates/', {
+        'name': 'Customer reports',
+        'task_path': 'scheduler.tasks.add',
+        'cron_expression': '0 6 * * *',
+        'batch_size': 2,
+    }, format='json')
+    assert response.status_code == 201
+    template_id = response.data['id']
+
+    rows = [{'key': f'customer-{i}', 'args': [i, 1]} for i in range(5)]
+    rows[4]['args'] = ['broken', 1]
+    response = client.post(f'/api/v1/scheduler/templates/{template_id}/parameters/', {'parameters': rows},
+                           format='json')
+    assert response.data == {'upserted': 5, 'deleted': 0, 'total': 5}
+
+    response = client.post(f'/api/v1/scheduler/templates/{template_id}/parameters/', {
+        'parameters': [{'key': 'customer-0', 'args': [0, 2], 'is_active': False}],
+        'delete': ['customer-1'],
+    }, format='json')
+    assert response.data == {'upserted': 1, 'deleted': 1, 'total': 4}
+
+    assert PeriodicTask.objects.filter(task='expand_job_template').count() == 1
+
+    expand_job_template.apply(args=[template_id])
+
+    template = JobTemplate.objects.get(id=template_id)
+    assert template.last_expansion == {'instances': 3, 'batches': 2}
+    assert template.last_run_at is not None
+    assert any("Instance customer-4" in record.message for record in caplog.records)
+
+
+@pytest.mark.django_db
+def test_template_rejects_cron_expressions_beat_cannot_schedule():
+    """
+    Six-field and `@` expressions pass croniter but have no crontab equivalent: the API
+    rejects them, and a template saved with one anyway is left unscheduled instead of failing.
+    """
+    client = APIClient()
+    for expression in ('0 0 6 * * *', '@hourly'):
+        response = client.post('/api/v1/scheduler/templates/', {
+            'name': f'Bad {expression}',
+            'task_path': 'scheduler.tasks.add',
+            'cron_expression': expression,
+        }, format='json')
+        assert response.status_code == 400
+        assert 'cron_expression' in response.data
+
+    template = JobTemplate.objects.create(name='Raw', task_path='scheduler.tasks.add', cron_expression='@hourly')
+    assert not PeriodicTask.objects.filter(name=f"scheduler.template.{template.id}").exists()
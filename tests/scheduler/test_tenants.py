@@ -0,0 +1,116 @@
+import time
+
+import fakeredis
+import pytest
+
+from scheduler.models import JobRun, JobStatus, ScheduledJob, TenantQuota
+from scheduler.tasks import run_scheduled_job
+from scheduler.tenants import DeficitRoundRobin, tenant_quotas
+
+
+@pytest.mark.django_db
+def test_deficit_round_robin_shares_batches_by_weight():
+    """
+    A tenant with a huge backlog cannot starve the others; weights set the share.
+    """
+    TenantQuota.objects.create(tenant='gold', weight=2)
+    tenant_quotas.invalidate()
+    backlog = {'burst': list(range(100_000)), 'gold': list(range(1_000)), 'small': list(range(5))}
+
+    def take(tenant, count):
+        taken, backlog[tenant] = backlog[tenant][:count], backlog[tenant][count:]
+        return [(tenant, job) for job in taken]
+
+    fair = DeficitRoundRobin(quantum=10)
+    shares = {}
+    for _ in range(10):
+        for tenant, _ in fair.select(['burst', 'gold', 'small'], 100, take):
+            shares[tenant] = shares.get(tenant, 0) + 1
+
+    assert shares['small'] == 5
+    assert shares['gold'] + shares['burst'] == 995
+    assert 1.8 < shares['gold'] / shares['burst'] < 2.2
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = fakeredis.FakeRedis()
+    monkeypatch.setattr('scheduler.tenants.get_redis_client', lambda: client)
+    return client
+
+
+def _job(name, tenant='acme'):
+    return ScheduledJob.objects.create(name=name, tenant=tenant, task_path="scheduler.tasks.sample_task",
+                                       cron_expression="* * * * *")
+
+
+@pytest.mark.django_db
+def test_admission_reserves_concurrency_slots_atomically(settings, redis_client):
+    """
+    A tenant at its concurrency limit gets jittered, exponentially growing deferrals; slots are
+    freed when runs finish or their lease lapses, duplicates reserve nothing, and other tenants
+    are unaffected.
+    """
+    settings.SCHEDULER_TENANT_THROTTLE_DELAY = 8
+    settings.SCHEDULER_TENANT_THROTTLE_MAX_DELAY = 40
+    settings.SCHEDULER_HEARTBEAT_LEASE = 120
+    TenantQuota.objects.create(tenant='acme', max_concurrency=1)
+    tenant_quotas.invalidate()
+    running, queued, other = _job("Running"), _job("Queued"), _job("Other", tenant='globex')
+    now = time.time()
+
+    assert tenant_quotas.admit(running, 'running:0', now=now) == (0, True, now)
+    assert tenant_quotas.admit(running, 'running:0', now=now) == (0, False, now)
+    assert 4 <= tenant_quotas.admit(queued, 'queued:0', now=now).delay <= 8
+    assert 20 <= tenant_quotas.admit(queued, 'queued:0', deferrals=5, now=now).delay <= 40
+    assert tenant_quotas.admit(other, 'other:0', now=now) == (0, False, now)
+
+    assert tenant_quotas.admit(queued, 'queued:0', now=now + 121).reserved
+
+    tenant_quotas.release(queued, 'queued:0')
+    assert not redis_client.zcard(tenant_quotas.slots_key('acme'))
+
+
+@pytest.mark.django_db
+def test_admission_counts_rate_once_per_claimed_run(settings, redis_client):
+    """
+    The per-minute rate is reserved with the slot and refunded when the run is not claimed.
+    """
+    TenantQuota.objects.create(tenant='acme', max_runs_per_minute=1)
+    tenant_quotas.invalidate()
+    job = _job("Rated")
+    now = 120.5
+
+    admission = tenant_quotas.admit(job, 'rated:0', now=now)
+    assert admission == (0, True, now)
+    tenant_quotas.refund(job, 'rated:0', admission)
+
+    assert tenant_quotas.admit(job, 'rated:0', now=now).reserved
+    assert 60 <= tenant_quotas.admit(job, 'rated:1', now=now).delay <= 60 + settings.SCHEDULER_TENANT_THROTTLE_DELAY
+
+
+@pytest.mark.django_db
+def test_run_over_tenant_concurrency_is_deferred_without_claiming(redis_client, monkeypatch, celery_eager):
+    """
+    A run finding its tenant's slot taken is re-sent with its deferral count and attempt,
+    and claims nothing; once the slot is free it runs and releases its slot.
+    """
+    TenantQuota.objects.create(tenant='acme', max_concurrency=1)
+    tenant_quotas.invalidate()
+    job = _job("Deferred")
+    redis_client.zadd(tenant_quotas.slots_key('acme'), {'elsewhere:0': time.time() + 60})
+    deferred = []
+    monkeypatch.setattr(run_scheduled_job, 'apply_async', lambda args, kwargs, **options: deferred.append(
+        (kwargs, options)))
+
+    run_scheduled_job.apply(args=[job.id], kwargs={'run_key': 'fire', 'deferrals': 2})
+
+    [(kwargs, options)] = deferred
+    assert kwargs == {'run_key': 'fire', 'deferrals': 3} and options['retries'] == 0
+    assert not JobRun.objects.filter(job=job).exists()
+
+    redis_client.zrem(tenant_quotas.slots_key('acme'), 'elsewhere:0')
+    run_scheduled_job.apply(args=[job.id], kwargs={'run_key': 'fire', 'deferrals': 3})
+
+    assert JobRun.objects.get(job=job).status == JobStatus.SUCCESS
+    assert not redis_client.zcard(tenant_quotas.slots_key('acme'))
@@ -0,0 +1,201 @@
+import json
+from datetime import datetime, timezone as dt_timezone
+
+import pytest
+from rest_framework.test import APIClient
+
+from scheduler.events import JobEventStream, _Listener
+from scheduler.models import ResultStorage, ScheduledJob
+from scheduler.results import result_store
+
+
+@pytest.mark.django_db
+def test_upcoming_lists_fire_times_in_window():
+    """
+    Cron and one-off jobs are expanded into chronological fire times inside the window.
+    """
+    start = datetime(2030, 1, 1, 2, 0, tzinfo=dt_timezone.utc)
+    cron = ScheduledJob.objects.create(name="Every 20m", task_path="scheduler.tasks.sample_task",
+                                       cron_expression="*/20 * * * *")
+    one_off = ScheduledJob.objects.create(name="Once", task_path="scheduler.tasks.sample_task",
+                                          one_off_run_time=datetime(2030, 1, 1, 2, 30, tzinfo=dt_timezone.utc))
+
+    response = APIClient().get('/api/v1/scheduler/jobs/upcoming/', {
+        'start': '2030-01-01T02:00:00Z',
+        'end': '2030-01-01T03:00:00Z',
+    })
+
+    assert response.status_code == 200
+    fires = json.loads(b''.join(response.streaming_content))
+    assert [(fire['job_id'], fire['fire_at']) for fire in fires] == [
+        (cron.id, start.replace(minute=0).isoformat()),
+        (cron.id, start.replace(minute=20).isoformat()),
+        (one_off.id, start.replace(minute=30).isoformat()),
+        (cron.id, start.replace(minute=40).isoformat()),
+    ]
+
+
+@pytest.mark.django_db
+def test_upcoming_histogram_counts_shared_expressions():
+    """
+    The histogram aggregates jobs sharing an expression per minute.
+    """
+    for index in range(3):
+        ScheduledJob.objects.create(name=f"Job {index}", task_path="scheduler.tasks.sample_task",
+                                    cron_expression="*/30 * * * *")
+
+    response = APIClient().get('/api/v1/scheduler/jobs/upcoming/', {
+        'start': '2030-01-01T02:00:00Z',
+        'end': '2030-01-01T03:00:00Z',
+        'histogram': 'true',
+    })
+
+    assert response.status_code == 200
+    assert response.data['total'] == 6
+    assert response.data['peak']['count'] == 3
+
+
+@pytest.mark.django_db
+def test_spread_window_must_be_shorter_than_the_cron_interval():
+    """
+    A spread window reaching the next fire is rejected, on create and on partial update.
+    """
+    client = APIClient()
+    payload = {'name': 'Spread', 'task_path': 'scheduler.tasks.sample_task', 'cron_expression': '* * * * *'}
+
+    response = client.post('/api/v1/scheduler/jobs/', {**payload, 'spread_seconds': 3600}, format='json')
+    assert response.status_code == 400
+    assert 'spread_seconds' in response.data
+
+    response = client.post('/api/v1/scheduler/jobs/', {**payload, 'spread_seconds': 30}, format='json')
+    assert response.status_code == 201
+
+    response = client.patch(f"/api/v1/scheduler/jobs/{response.data['id']}/", {'spread_seconds': 60}, format='json')
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_bulk_deactivate_and_activate_toggle_periodic_tasks():
+    """
+    Bulk actions flip `is_active` on the selected jobs, keep an audit row and
+    disable/enable the existing periodic tasks in place.
+    """
+    from django_celery_beat.models import PeriodicTask
+
+    from scheduler.services import job_service
+
+    jobs = [
+        ScheduledJob.objects.create(name=f"Bulk {index}", task_path="scheduler.tasks.sample_task",
+                                    cron_expression="*/5 * * * *")
+        for index in range(3)
+    ]
+    other = ScheduledJob.objects.create(name="Other", task_path="scheduler.tasks.send_email_task",
+                                        cron_expression="*/5 * * * *")
+    for job in jobs + [other]:
+        job_service.refresh_job(job)
+    task_ids = set(PeriodicTask.objects.values_list('id', flat=True))
+
+    client = APIClient()
+    response = client.post('/api/v1/scheduler/jobs/bulk-deactivate/',
+                           {'task_path': 'scheduler.tasks.sample_task'}, format='json')
+
+    assert response.status_code == 200
+    assert response.data['changed'] == 3
+    assert not ScheduledJob.objects.filter(id__in=[job.id for job in jobs], is_active=True).exists()
+    assert ScheduledJob.objects.get(id=other.id).is_active
+    assert PeriodicTask.objects.filter(enabled=False).count() == 3
+    assert jobs[0].history.first().is_active is False
+
+    response = client.post('/api/v1/scheduler/jobs/bulk-activate/',
+                           {'ids': [job.id for job in jobs]}, format='json')
+
+    assert response.data['changed'] == 3
+    assert PeriodicTask.objects.filter(enabled=True).count() == 4
+    assert set(PeriodicTask.objects.values_list('id', flat=True)) == task_ids
+    assert ScheduledJob.objects.get(id=jobs[0].id).next_run_at is not None
+
+
+@pytest.mark.django_db
+def test_stats_roll_up_runs_per_job_and_task_path():
+    """
+    Finished runs are rolled up into hourly buckets served by the stats endpoints.
+    """
+    from scheduler.tasks import run_scheduled_job
+
+    ok = ScheduledJob.objects.create(name="Adds", task_path="scheduler.tasks.add", args=[1, 2],
+                                     cron_expression="* * * * *")
+    broken = ScheduledJob.objects.create(name="Broken adds", task_path="scheduler.tasks.add", args=[1],
+                                         cron_expression="* * * * *")
+    for _ in range(3):
+        run_scheduled_job.apply(args=[ok.id])
+    run_scheduled_job.apply(args=[broken.id])
+
+    client = APIClient()
+    response = client.get(f'/api/v1/scheduler/jobs/{ok.id}/stats/', {'hours': 2})
+
+    assert response.status_code == 200
+    assert response.data['runs'] == 3
+    assert response.data['success_rate'] == 1
+    assert response.data['p95_duration_ms'] is not None
+
+    response = client.get('/api/v1/scheduler/jobs/task-stats/', {'task_path': 'scheduler.tasks.add'})
+
+    assert response.data['runs'] == 4
+    assert response.data['failures'] == 1
+    assert response.data['success_rate'] == 0.75
+
+
+@pytest.mark.django_db
+def test_status_events_validate_filters(settings):
+    """
+    The status event stream rejects malformed filters and answers 503 while events are
+    disabled, or when the request came through WSGI and could never be streamed.
+    """
+    settings.SCHEDULER_STATUS_EVENTS = False
+    client = APIClient()
+
+    assert client.get('/api/v1/scheduler/jobs/events/', {'job_ids': '1,x'}).status_code == 400
+    assert client.get('/api/v1/scheduler/jobs/events/', {'status': 'running,done'}).status_code == 400
+    assert client.get('/api/v1/scheduler/jobs/events/', {'job_ids': '1,2', 'status': 'failed'}).status_code == 503
+
+    settings.SCHEDULER_STATUS_EVENTS = True
+    response = client.get('/api/v1/scheduler/jobs/events/')
+    assert response.status_code == 503
+    assert response.json() == {'detail': 'Status events need the ASGI server.'}
+
+
+def test_status_events_fan_out_to_matching_listeners():
+    """
+    One published transition is queued to every listener whose job id, status and tenant filters match.
+    """
+    stream = JobEventStream()
+    by_job = _Listener(job_ids=[1, 2])
+    by_status = _Listener(statuses=['failed'])
+    by_tenant = _Listener(tenant='acme')
+    stream._listeners.update({by_job, by_status, by_tenant})
+
+    stream._dispatch(json.dumps({'job_id': 2, 'status': 'running', 'tenant': 'default', 'at': '2030-01-01T00:00:00Z'}))
+    stream._dispatch(json.dumps({'job_id': 3, 'status': 'failed', 'tenant': 'acme', 'at': '2030-01-01T00:00:01Z'}))
+
+    assert by_job.queue.get_nowait()['job_id'] == 2 and by_job.queue.empty()
+    assert by_status.queue.get_nowait()['job_id'] == 3 and by_status.queue.empty()
+    assert by_tenant.queue.get_nowait()['tenant'] == 'acme' and by_tenant.queue.empty()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_deleting_a_job_removes_its_offloaded_results(settings, tmp_path):
+    """
+    Result payloads offloaded to storage are deleted along with the job.
+    """
+    settings.MEDIA_ROOT = tmp_path
+    settings.SCHEDULER_RESULT_OFFLOAD_THRESHOLD = 0
+    job = ScheduledJob.objects.create(name="Offloaded", task_path="scheduler.tasks.sample_task",
+                                      cron_expression="0 * * * *")
+    job_result = result_store.save(job, {"rows": list(range(100))})
+    assert job_result.storage == ResultStorage.FILE
+    assert result_store.storage.exists(job_result.location)
+
+    response = APIClient().delete(f'/api/v1/scheduler/jobs/{job.id}/')
+
+    assert response.status_code == 204
+    assert not result_store.storage.exists(job_result.location)
@@ -0,0 +1,47 @@
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.utils.decorators import sync_and_async_middleware
+
+from utils.db.routers import iterate_routed, replica_reads
+
+# Cookie pinning a client's reads to the primary for a while after it changed something
+PIN_COOKIE = 'db_pinned'
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def _reads_from_replicas(request) -> bool:
+    return request.method in SAFE_METHODS and PIN_COOKIE not in request.COOKIES
+
+
+def _finish(request, response, routing):
+    """
+    After a mutation, keep the client on the primary for `DATABASE_REPLICA_PIN_SECONDS`
+    (the replication lag budget) so it reads its own writes.
+    """
+    if response.streaming and not response.is_async:
+        # Streamed content is read after this middleware returned
+        response.streaming_content = iterate_routed(routing, response.streaming_content)
+    if settings.DATABASE_REPLICAS and (request.method not in SAFE_METHODS or routing.wrote):
+        response.set_cookie(PIN_COOKIE, '1', max_age=settings.DATABASE_REPLICA_PIN_SECONDS, httponly=True,
+                            samesite='Lax')
+    return response
+
+
+@sync_and_async_middleware
+def replica_routing_middleware(get_response):
+    """
+    Marks read-only requests (safe methods, no recent mutation by the client) so that
+    `ReplicaRouter` sends their queries to a replica.
+    """
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            with replica_reads(_reads_from_replicas(request)) as routing:
+                response = await get_response(request)
+            return _finish(request, response, routing)
+    else:
+        def middleware(request):
+            with replica_reads(_reads_from_replicas(request)) as routing:
+                response = get_response(request)
+            return _finish(request, response, routing)
+    return middleware
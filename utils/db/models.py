@@ -2,14 +2,49 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from simple_history.models import HistoricalRecords
 
+# Fields always kept in history regardless of `history_audited_fields`
+ALWAYS_AUDITED_FIELDS = ('id', 'created_at', 'updated_at')
+
+
+class SelectiveHistoricalRecords(HistoricalRecords):
+    """
+    HistoricalRecords that only copies the fields a model declares in
+    `history_audited_fields` into its historical table.
+    """
+
+    def fields_included(self, model):
+        fields = super().fields_included(model)
+        audited = getattr(model, 'history_audited_fields', None)
+        if audited is None:
+            return fields
+
+        audited = set(audited) | set(ALWAYS_AUDITED_FIELDS)
+        return [field for field in fields if field.name in audited]
+
+    def create_history_model(self, model, inherited):
+        history_model = super().create_history_model(model, inherited)
+        # Let simple-history load unaudited values from the live row when rebuilding instances
+        included = {field.name for field in history_model.tracked_fields}
+        history_model._history_excluded_fields = [
+            field.name for field in model._meta.fields if field.name not in included
+        ]
+        return history_model
+
 
 class BaseModel(models.Model):
     """
     Abstract base model that provides:
     - Automatic timestamp fields for creation and updates.
     - Historical tracking via django-simple-history.
+
+    Subclasses may set `history_audited_fields` to the names of the fields worth auditing.
+    Other fields are left out of the historical table, and saves whose `update_fields`
+    only touch them (runtime bookkeeping) do not write a history row.
     """
 
+    # Names of audited fields; None audits every field
+    history_audited_fields = None
+
     # Timestamp indicating when the object was created
     created_at = models.DateTimeField(
         verbose_name=_('Created At'),
@@ -23,11 +58,30 @@ class BaseModel(models.Model):
     )
 
     # Enables history tracking of model changes (auditing)
-    history = HistoricalRecords(inherit=True)
+    history = SelectiveHistoricalRecords(inherit=True)
 
     class Meta:
         abstract = True  # Prevents Django from creating a separate table for this model
 
+    def save(self, *args, **kwargs):
+        """
+        Save the instance, skipping the history row for runtime-only updates.
+        """
+        update_fields = kwargs.get('update_fields')
+        if (
+                update_fields is None
+                or self.history_audited_fields is None
+                or hasattr(self, 'skip_history_when_saving')
+                or set(update_fields) & set(self.history_audited_fields)
+        ):
+            return super().save(*args, **kwargs)
+
+        self.skip_history_when_saving = True
+        try:
+            return super().save(*args, **kwargs)
+        finally:
+            del self.skip_history_when_saving
+
     def __str__(self):
         """
         Return the string representation of the model instance.
@@ -0,0 +1,91 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class ReplicaRouting:
+    """
+    Routing state of the current request: whether its reads may go to a replica, which
+    one (picked on the first read and kept, so all reads see the same replication lag),
+    and whether it wrote anything (after which it reads from the primary).
+    """
+
+    def __init__(self, use_replicas: bool):
+        self.use_replicas = use_replicas
+        self.replica = None
+        self.wrote = False
+
+
+# Unset outside requests: workers, beat and management commands always use the primary
+_routing = ContextVar('replica_routing', default=None)
+
+
+@contextmanager
+def replica_reads(enabled=True):
+    """
+    Let reads inside the block go to a replica (unless it writes first). Yields the routing state.
+    """
+    routing = ReplicaRouting(enabled)
+    token = _routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _routing.reset(token)
+
+
+def iterate_routed(routing: ReplicaRouting, iterator):
+    """
+    Iterate under `routing`, for streamed responses consumed after the request's middleware returned.
+    """
+    iterator = iter(iterator)
+    while True:
+        token = _routing.set(routing)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _routing.reset(token)
+        yield chunk
+
+
+class ReplicaRouter:
+    """
+    Sends reads of requests marked read-only (see `replica_routing_middleware`) to one
+    random database of `DATABASE_REPLICAS` per request; everything else, including every write and any read
+    inside a transaction, uses the primary. Replicas are never migrated.
+    """
+
+    @staticmethod
+    def db_for_read(model, **hints):
+        routing = _routing.get()
+        if (
+            routing is None
+            or not routing.use_replicas
+            or routing.wrote
+            or not settings.DATABASE_REPLICAS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        if routing.replica is None:
+            routing.replica = random.choice(settings.DATABASE_REPLICAS)
+        return routing.replica
+
+    @staticmethod
+    def db_for_write(model, **hints):
+        routing = _routing.get()
+        if routing is not None:
+            routing.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    @staticmethod
+    def allow_relation(obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+
+    @staticmethod
+    def allow_migrate(db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS